@@ -1,6 +1,14 @@
-from flask import Flask, jsonify, request
+import threading
+
+import numpy as np
+from flask import Flask, Response, jsonify, request, stream_with_context
 from flask_cors import CORS
 
+from src.engines import create_grid
+from src.generation_stream import KEYFRAME, GenerationStream, sse_event
+from src.rle import header_rule, load_rle, split_rle
+from src.wire_format import MEDIA_TYPE, STREAM_MEDIA_TYPE, encode_grid, encode_message, stream_chunk
+
 app = Flask(__name__)
 CORS(app)  # Allow all origins for cross-origin requests
 
@@ -14,10 +22,49 @@ data = {
     ]
 }
 
+# The simulation streamed by /stream, started by POST /stream. stream_lock guards replacing it
+# and reading its grid, so no request sees a stream half started or a grid already closed
+stream = None
+stream_lock = threading.Lock()
+
+def negotiate(text_type, binary_type):
+    # Binary frames (src/wire_format.py) when asked for with ?format=binary or preferred in the
+    # Accept header, JSON otherwise; ?compress=zlib also compresses binary frames
+    requested = request.args.get("format")
+    if requested is None:
+        binary = request.accept_mimetypes.best_match([text_type, binary_type]) == binary_type
+    else:
+        binary = requested == "binary"
+    return binary, request.args.get("compress", "").lower() in ("1", "true", "zlib")
+
 @app.route('/get_data', methods=['GET'])
 def get_data():
-    # Return current generation data
-    return jsonify(data)
+    # Return current generation data: the streamed simulation when one runs, the dummy data otherwise
+    binary, compress = negotiate("application/json", MEDIA_TYPE)
+    with stream_lock:
+        current = stream
+        if current is not None:
+            with current.lock:  # Not stepped while it is read
+                if binary:
+                    payload = encode_grid(current.grid, current.generation, current.sequence, compress)
+                else:
+                    generation, cells = current.generation, current.grid.get_live_cells()
+                    rows, cols = current.grid.rows, current.grid.cols
+    if current is None:
+        if not binary:
+            return jsonify(data)
+        cells = np.array([(cell["y"], cell["x"]) for cell in data["cells"] if cell.get("state", 1)])
+        payload = encode_message({"seq": 0, "generation": data["generation"], "kind": KEYFRAME, "cells": cells},
+                                 compress)
+    else:
+        if not binary:
+            response = jsonify({"generation": generation, "rows": rows, "cols": cols,
+                                "cells": [{"x": c, "y": r, "state": 1} for r, c in cells]})
+            response.vary.add("Accept")
+            return response
+    response = Response(payload, mimetype=MEDIA_TYPE)
+    response.vary.add("Accept")
+    return response
 
 @app.route('/update_data', methods=['POST'])
 def update_data():
@@ -26,7 +73,77 @@ def update_data():
     data.update(new_data)  # Example of updating data with new input
     return jsonify({"message": "Data updated successfully"})
 
-if __name__ == '__main__':
-    app.run(debug=True, port=5000)  # Runs the app on port 5000
+@app.route('/stream', methods=['POST'])
+def start_stream():
+    # Start (or restart) the streamed simulation, e.g.
+    # {"rows": 200, "cols": 200, "engine": "numpy", "rule": "B3/S23", "boundary": "torus",
+    #  "rle": "x = 3, y = 1\n3o!", "position": [100, 100], "delay": 0.05}
+    # or "cells": [[row, col], ...] instead of "rle"
+    global stream
+    config = request.get_json(silent=True) or {}
+    kwargs = {}
+    if config.get("boundary"):
+        kwargs["boundary"] = config["boundary"]
+    grid = None
+    try:
+        rule = config.get("rule")
+        if rule is None and config.get("rle"):
+            rule = header_rule(split_rle(config["rle"])[0])
+        grid = create_grid(int(config.get("rows", 100)), int(config.get("cols", 100)),
+                           config.get("engine", "numpy"), rule=rule or "B3/S23", **kwargs)
+        if config.get("rle"):
+            load_rle(config["rle"], grid, tuple(config.get("position", (0, 0))))
+        grid.set_cells(tuple(cell) for cell in config.get("cells", []))
+        new_stream = GenerationStream(grid, delay=float(config.get("delay", 0.1)),
+                                      buffer_size=int(config.get("buffer_size", 256)),
+                                      keyframe_interval=int(config.get("keyframe_interval", 64)))
+    except (TypeError, ValueError) as e:
+        if grid is not None:
+            grid.close()
+        return jsonify({"error": str(e)}), 400
+
+    with stream_lock:
+        if stream is not None:
+            stream.close()  # Its clients end and reconnect to the new one
+        stream = new_stream
+        stream.start()
+    return jsonify({"message": "Simulation started", "rows": grid.rows, "cols": grid.cols})
 
+@app.route('/stream', methods=['DELETE'])
+def stop_stream():
+    global stream
+    with stream_lock:
+        if stream is not None:
+            stream.close()
+            stream = None
+    return jsonify({"message": "Simulation stopped"})
 
+@app.route('/stream', methods=['GET'])
+def stream_generations():
+    # Server-sent events: a 'key' event with every alive cell, then 'delta' events with the cells
+    # born and died. A slow client gets the frames it missed coalesced into one event instead of a
+    # queue, and a reconnecting EventSource resumes from its Last-Event-ID.
+    # Negotiated like /get_data, the same frames in binary, each prefixed with its length (uint32,
+    # 0 for keep-alive), for fetch() readers; resume with ?after=<seq>.
+    with stream_lock:
+        current = stream
+    if current is None:
+        return jsonify({"error": "No simulation running, POST /stream to start one"}), 404
+    last_id = request.headers.get("Last-Event-ID", request.args.get("after"))
+    after = int(last_id) if last_id and last_id.isdigit() else None
+
+    binary, compress = negotiate("text/event-stream", STREAM_MEDIA_TYPE)
+
+    def events():
+        for message in current.subscribe(after):
+            if binary:
+                yield stream_chunk(None if message is None else encode_message(message, compress))
+            else:
+                yield sse_event(message)
+
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "Vary": "Accept"}
+    mimetype = STREAM_MEDIA_TYPE if binary else "text/event-stream"
+    return Response(stream_with_context(events()), mimetype=mimetype, headers=headers)
+
+if __name__ == '__main__':
+    app.run(debug=True, port=5000, threaded=True)  # Runs the app on port 5000
@@ -0,0 +1 @@
+# Makes pytest put backend_py on sys.path, so the tests import src and utils like the app does
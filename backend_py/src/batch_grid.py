@@ -0,0 +1,229 @@
+from typing import Iterable, Optional, Tuple, Union
+
+import numpy as np
+
+from src.grid import BOUNDARY_DEAD, BOUNDARY_TORUS, check_boundary
+from src.numpy_grid import apply_rule, count_neighbors, wrap_pad
+from src.rules import Rule, parse_rule
+
+# Number of cells stepped at once, small enough for the intermediate arrays to stay in the CPU cache
+CHUNK_CELLS = 1 << 18
+
+
+class BatchGrid:
+    """
+    A stack of independent, same-size boards stepped together as one (boards, rows, cols) array.
+
+    Every update() advances all boards one generation with vectorized neighbor counts over the stack
+    (see src.numpy_grid.count_neighbors), so screening thousands of small candidates costs a few array
+    operations per generation instead of one Grid and one Python call per candidate. Boards follow
+    the same rule lookup table as Grid and have dead edges, or wrap around on a torus (see
+    src.numpy_grid.wrap_pad), which lets fast ships run for long on small boards.
+
+    After each update the per-board results of that generation are available as arrays:
+    population, cells_changed, died (no alive cell left) and stable (nothing changed, so the board
+    is a still life or dead and stays that way).
+
+    The stack is stepped in chunks of boards of about CHUNK_CELLS cells, so the intermediate arrays
+    stay in the CPU cache instead of streaming every pass over the whole stack through memory.
+
+    Attributes:
+    - boards (int): Number of boards.
+    - rows (int): Number of rows of every board.
+    - cols (int): Number of columns of every board.
+    - generation (int): Number of updates done.
+    - rule (Rule): The Life-like rule every board evolves by.
+    - boundary (str): What lies beyond the edges of every board, 'dead' or 'torus'.
+    - population (np.ndarray): int64 array, alive cells per board.
+    - cells_changed (np.ndarray): int64 array, cells changed per board by the last update.
+    - died (np.ndarray): bool array, boards without alive cells.
+    - stable (np.ndarray): bool array, boards the last update did not change.
+
+    Methods:
+    - update(): Advances every board one generation.
+    - step(generations): Advances every board several generations, optionally until all settled.
+    - set_cells(board, cells): Sets cells of one board to alive.
+    - load(board, cells): Replaces one board with a 2D array.
+    - clear(board): Clears one or all boards.
+    """
+
+    # Boards of one batch must keep the same size, so they cannot expand
+    BOUNDARIES = (BOUNDARY_DEAD, BOUNDARY_TORUS)
+
+    def __init__(self, boards: int, rows: int, cols: int, rule: Union[str, Rule] = "B3/S23",
+                 boundary: str = BOUNDARY_DEAD) -> None:
+        """
+        Initializes boards empty boards of rows x cols cells.
+
+        Args:
+        - boards (int): Number of boards.
+        - rows (int): Number of rows of every board.
+        - cols (int): Number of columns of every board.
+        - rule (Union[str, Rule]): Life-like rule in B/S notation, e.g. 'B3/S23' or 'B36/S23'.
+        - boundary (str): What lies beyond the edges of every board: 'dead' or 'torus'.
+
+        Raises:
+        - ValueError: If the boundary is not supported.
+        """
+        self.boards = boards
+        self.rows = rows
+        self.cols = cols
+        self.rule = parse_rule(rule)
+        self.boundary = check_boundary(boundary, self.BOUNDARIES, type(self).__name__)
+        self.generation = 0
+        shape = (boards, rows, cols)
+        self._buffers = [np.zeros(shape, dtype=np.uint8), np.zeros(shape, dtype=np.uint8)]
+        self._front = 0
+        self._chunk = max(1, min(boards, CHUNK_CELLS // max(1, rows * cols)))
+        chunk_shape = (self._chunk, rows, cols)
+        counts_shape = (self._chunk, rows + 2, cols + 2) if self.boundary == BOUNDARY_TORUS else chunk_shape
+        self._padded = np.empty(counts_shape, dtype=np.uint8) if self.boundary == BOUNDARY_TORUS else None
+        self._counts = np.empty(counts_shape, dtype=np.uint8)
+        self._scratch = np.empty(counts_shape, dtype=np.uint8)
+        self._masks = np.empty((3,) + chunk_shape, dtype=bool)
+
+        self.population = np.zeros(boards, dtype=np.int64)
+        self.cells_changed = np.zeros(boards, dtype=np.int64)
+        self.died = np.ones(boards, dtype=bool)
+        self.stable = np.zeros(boards, dtype=bool)
+
+    @classmethod
+    def from_array(cls, cells: np.ndarray, rule: Union[str, Rule] = "B3/S23",
+                   boundary: str = BOUNDARY_DEAD) -> 'BatchGrid':
+        """
+        Creates a batch from a (boards, rows, cols) array of 0/1 cells.
+
+        Args:
+        - cells (np.ndarray): The boards.
+        - rule (Union[str, Rule]): Life-like rule in B/S notation.
+        - boundary (str): What lies beyond the edges of every board: 'dead' or 'torus'.
+
+        Returns:
+        - BatchGrid: A batch holding a copy of the boards.
+        """
+        batch = cls(*cells.shape, rule=rule, boundary=boundary)
+        np.copyto(batch.cells, cells, casting="unsafe")
+        batch._count_population()
+        return batch
+
+    @property
+    def cells(self) -> np.ndarray:
+        """The current generation of every board as a writable (boards, rows, cols) uint8 array."""
+        return self._buffers[self._front]
+
+    def _count_population(self) -> None:
+        """Recomputes population and died after the boards were edited."""
+        np.add.reduce(self.cells.reshape(self.boards, -1), axis=1, dtype=np.int64, out=self.population)
+        np.equal(self.population, 0, out=self.died)
+
+    def set_cells(self, board: int, cells: Iterable[Tuple[int, int]]) -> None:
+        """
+        Sets cells of one board to alive, coordinates outside the board are ignored, or wrapped on a torus.
+
+        Args:
+        - board (int): Index of the board.
+        - cells (Iterable[Tuple[int, int]]): (row, column) coordinates of the alive cells.
+        """
+        coordinates = np.array(list(cells), dtype=np.int64).reshape(-1, 2)
+        if self.boundary == BOUNDARY_TORUS:
+            coordinates %= (self.rows, self.cols)
+        else:
+            inside = ((coordinates[:, 0] >= 0) & (coordinates[:, 0] < self.rows)
+                      & (coordinates[:, 1] >= 0) & (coordinates[:, 1] < self.cols))
+            coordinates = coordinates[inside]
+        self.cells[board, coordinates[:, 0], coordinates[:, 1]] = 1
+        self.population[board] = np.count_nonzero(self.cells[board])
+        self.died[board] = self.population[board] == 0
+
+    def load(self, board: int, cells: np.ndarray) -> None:
+        """
+        Replaces one board with a (rows, cols) array of 0/1 cells.
+
+        Args:
+        - board (int): Index of the board.
+        - cells (np.ndarray): The new cells.
+        """
+        np.copyto(self.cells[board], cells, casting="unsafe")
+        self.population[board] = np.count_nonzero(self.cells[board])
+        self.died[board] = self.population[board] == 0
+
+    def clear(self, board: Optional[int] = None) -> None:
+        """
+        Clears one board, or every board when board is None.
+
+        Args:
+        - board (Optional[int]): Index of the board.
+        """
+        if board is None:
+            self.cells.fill(0)
+            self.generation = 0
+            self.cells_changed.fill(0)
+            self.stable.fill(False)
+        else:
+            self.cells[board].fill(0)
+        self._count_population()
+
+    def update(self) -> None:
+        """
+        Advances every board one generation and updates the per-board results.
+
+        Rules (self.rule, B3/S23 by default):
+        - A cell survives if its number of alive neighbors is in rule.survival.
+        - A dead cell becomes alive if its number of alive neighbors is in rule.birth.
+
+        Returns:
+        - None
+        """
+        for start in range(0, self.boards, self._chunk):
+            stop = min(start + self._chunk, self.boards)
+            n = stop - start
+            cells = self._buffers[self._front][start:stop]
+            new_cells = self._buffers[1 - self._front][start:stop]
+            masks = self._masks[:, :n]
+            if self.boundary == BOUNDARY_TORUS:
+                padded = wrap_pad(cells, self._padded[:n])
+                neighbors = count_neighbors(padded, out=self._counts[:n], scratch=self._scratch[:n])[:, 1:-1, 1:-1]
+            else:
+                neighbors = count_neighbors(cells, out=self._counts[:n], scratch=self._scratch[:n])
+            apply_rule(self.rule, cells, neighbors, out=new_cells, scratch=masks)
+
+            changed = masks[0]
+            np.not_equal(new_cells, cells, out=changed)
+            np.add.reduce(changed.reshape(n, -1), axis=1, dtype=np.int64, out=self.cells_changed[start:stop])
+            np.add.reduce(new_cells.reshape(n, -1), axis=1, dtype=np.int64, out=self.population[start:stop])
+
+        np.equal(self.cells_changed, 0, out=self.stable)
+        np.equal(self.population, 0, out=self.died)
+        self._front = 1 - self._front
+        self.generation += 1
+
+    def step(self, generations: int, until_settled: bool = False) -> int:
+        """
+        Advances every board several generations.
+
+        Args:
+        - generations (int): Maximum number of generations.
+        - until_settled (bool): Stop early once every board died or is stable.
+
+        Returns:
+        - int: The number of generations done.
+        """
+        for done in range(generations):
+            if until_settled and done and bool(np.all(self.stable | self.died)):
+                return done
+            self.update()
+        return generations
+
+    def board(self, board: int) -> np.ndarray:
+        """
+        Returns one board of the current generation as a read-only view.
+
+        Args:
+        - board (int): Index of the board.
+
+        Returns:
+        - np.ndarray: Read-only (rows, cols) uint8 view.
+        """
+        view = self.cells[board].view()
+        view.flags.writeable = False
+        return view
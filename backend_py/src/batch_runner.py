@@ -0,0 +1,227 @@
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from src.game import Game
+from src.object_tracker import ObjectTracker
+from src.ship import Ship
+from src.ship_detector import ShipDetector
+
+
+def ship_from_dict(ship_data: dict) -> Ship:
+    """
+    Creates a Ship from a ship definition as stored in ships.json.
+
+    Args:
+    - ship_data (dict): Ship definition with 'id', 'name', 'designation' and 'initial_direction'.
+
+    Returns:
+    - Ship: The ship, positioned at (0, 0).
+    """
+    return Ship(
+        _id=ship_data['id'],
+        name=ship_data['name'],
+        designation=ship_data['designation'],
+        direction=ship_data['initial_direction']
+    )
+
+
+def ship_to_dict(ship: Ship) -> dict:
+    """
+    Converts a Ship into a ship definition as stored in ships.json.
+
+    Args:
+    - ship (Ship): The ship to convert.
+
+    Returns:
+    - dict: Ship definition with 'id', 'name', 'designation' and 'initial_direction'.
+    """
+    return {
+        'id': ship.id,
+        'name': ship.name,
+        'designation': ship.designation,
+        'initial_direction': ship.direction,
+    }
+
+
+class BatchRunner:
+    """
+    Runs ship candidates through the simulation without any display, one after another.
+
+    Each candidate is placed in the middle of an empty board and stepped until it is classified or the
+    generation limit is reached. The board and detector are reused between candidates. Nothing in this
+    module imports pygame.
+
+    Attributes:
+    - game (Game): The game whose grid is reused for every candidate.
+    - generations (int): Maximum number of generations simulated per candidate.
+    - time_limit (Optional[float]): Maximum wall time in seconds spent on one candidate.
+    - ship_detector (ShipDetector): Detector reset before every candidate.
+    - object_tracker (Optional[ObjectTracker]): Tracker reset before every candidate, when objects are tracked.
+
+    Methods:
+    - run_ship(ship_data): Simulates one ship definition and returns its result.
+    - run(ship_list): Yields the result of every ship definition in order.
+    - close(): Releases the grid's resources, the runner can be used as a context manager to do so.
+    """
+
+    def __init__(self, rows: int = 100, cols: int = 100, generations: int = 200, engine: str = "numpy",
+                 max_history: int = 7, time_limit: Optional[float] = None, rule: str = "B3/S23",
+                 track_objects: bool = False, boundary: Optional[str] = None) -> None:
+        """
+        Initializes the runner.
+
+        Args:
+        - rows (int): Number of rows of the board.
+        - cols (int): Number of columns of the board.
+        - generations (int): Maximum number of generations simulated per candidate.
+        - engine (str): Name of the grid engine to use (see src.engines.GRID_ENGINES).
+        - max_history (int): Number of past generations the detector compares against, the longest
+            period that can be classified.
+        - time_limit (Optional[float]): Maximum wall time in seconds spent on one candidate, None for no limit.
+        - rule (str): Life-like rule in B/S notation the candidates are simulated under.
+        - track_objects (bool): Also classify every object on the board on its own (see
+            src.object_tracker), so ships leaving debris behind are found.
+        - boundary (Optional[str]): What lies beyond the edges of the board, see src.grid.BOUNDARIES.
+            A torus keeps fast ships from hitting the edge on small boards.
+        """
+        self.game = Game(rows, cols, engine, rule, boundary)
+        self.generations = generations
+        self.time_limit = time_limit
+        self.ship_detector = ShipDetector(self.game.grid, max_history=max_history)
+        self.object_tracker = ObjectTracker(self.game.grid, max_history=max_history) if track_objects else None
+
+    def place_centered(self, ship: Ship) -> None:
+        """
+        Places a ship in the middle of the board.
+
+        Args:
+        - ship (Ship): The ship to place.
+        """
+        grid = self.game.grid
+        height = len(ship.direction)
+        width = len(ship.direction[0]) if height else 0
+        ship.position = ((grid.rows - height) // 2, (grid.cols - width) // 2)
+        grid.set_cells(ship.compute_cells())
+        self.game.ships.append(ship)
+
+    def run_ship(self, ship_data: dict) -> Dict:
+        """
+        Simulates one ship definition until it is classified or the generation limit is reached.
+
+        The initial state is generation 0 and stepping stops as soon as the detector proves the outcome.
+        The status is one of:
+        - 'died_out': every cell died.
+        - 'still_life': a generation left the board unchanged.
+        - 'oscillator': the pattern returned to the same cells after 'period' generations.
+        - 'spaceship': the pattern returned to the same shape, moved by 'displacement', after 'period' generations.
+        - 'timeout': the time limit was reached first.
+        - 'unclassified': none of the above happened within the generation limit.
+
+        When objects are tracked, stepping also stops once every object on the board is classified on its
+        own, before a ship can reach the board edge, and the result lists the classified objects under
+        'objects' (see ObjectTracker.classified). Objects may still collide later, so this describes the
+        board at that generation rather than proving the outcome of the whole run.
+
+        Args:
+        - ship_data (dict): Ship definition as returned by import_ships.
+
+        Returns:
+        - Dict: JSON serializable result with the ship identity, status, generations run, final
+            population and, for classified runs, the period, displacement, speed (rows and
+            columns per generation) and canonical digest (see src.canonical).
+        """
+        self.game.clear()
+        self.ship_detector.reset()
+        self.place_centered(ship_from_dict(ship_data))
+
+        grid = self.game.grid
+        detector = self.ship_detector
+        detector.grid = grid
+        detector.detect_and_classify_ships(0)
+        tracker = self.object_tracker
+        if tracker is not None:
+            tracker.reset()
+            tracker.grid = grid
+            tracker.update()
+
+        status = 'unclassified'
+        generation = 0
+        deadline = None if self.time_limit is None else time.perf_counter() + self.time_limit
+        while not (detector.is_classified or tracker is not None and tracker.all_classified) \
+                and generation < self.generations:
+            if deadline is not None and time.perf_counter() > deadline:
+                status = 'timeout'
+                break
+            self.game.update()
+            generation += 1
+            detector.detect_and_classify_ships(generation)
+            if tracker is not None:
+                tracker.update()
+
+        result = {
+            'id': ship_data['id'],
+            'name': ship_data['name'],
+            'designation': ship_data['designation'],
+            'status': status,
+            'generations': generation,
+            'population': grid.population,
+        }
+        if detector.is_classified:
+            classification = detector.classification
+            result.update({
+                'status': classification['status'],
+                'period': classification['period'],
+                'displacement': list(classification['displacement']),
+                'speed': list(classification['speed']),
+                'digest': classification['digest'],
+            })
+        if tracker is not None:
+            result['objects'] = tracker.classified()
+        return result
+
+    def run(self, ship_list: Iterable[dict]) -> Iterator[Dict]:
+        """
+        Simulates every ship definition in order, yielding each result as soon as it is ready.
+
+        Args:
+        - ship_list (Iterable[dict]): Ship definitions as returned by import_ships.
+
+        Returns:
+        - Iterator[Dict]: The result of every ship, see run_ship.
+        """
+        for ship_data in ship_list:
+            yield self.run_ship(ship_data)
+
+    def close(self) -> None:
+        """
+        Releases the resources of the grid engine (see Grid.close).
+
+        Returns:
+        - None
+        """
+        self.game.close()
+
+    def __enter__(self) -> "BatchRunner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def run_batch(ship_list: Iterable[dict], generations: int = 200, rows: int = 100, cols: int = 100,
+              engine: str = "numpy") -> List[Dict]:
+    """
+    Simulates every ship definition headlessly and collects the results.
+
+    Args:
+    - ship_list (Iterable[dict]): Ship definitions as returned by import_ships.
+    - generations (int): Maximum number of generations simulated per ship.
+    - rows (int): Number of rows of the board.
+    - cols (int): Number of columns of the board.
+    - engine (str): Name of the grid engine to use.
+
+    Returns:
+    - List[Dict]: The result of every ship, in input order.
+    """
+    with BatchRunner(rows, cols, generations, engine) as runner:
+        return list(runner.run(ship_list))
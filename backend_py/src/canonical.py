@@ -0,0 +1,209 @@
+import hashlib
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.rules import Rule, parse_rule
+from src.sparse_grid import SparseGrid
+
+# The 8 symmetries of the square (rotations and reflections) as matrices acting on (row, column)
+SYMMETRIES = np.array([
+    [[1, 0], [0, 1]],    # identity
+    [[0, 1], [-1, 0]],   # rotation by 90 degrees
+    [[-1, 0], [0, -1]],  # rotation by 180 degrees
+    [[0, -1], [1, 0]],   # rotation by 270 degrees
+    [[1, 0], [0, -1]],   # reflection, columns mirrored
+    [[-1, 0], [0, 1]],   # reflection, rows mirrored
+    [[0, 1], [1, 0]],    # reflection over the main diagonal
+    [[0, -1], [-1, 0]],  # reflection over the anti-diagonal
+], dtype=np.int64)
+
+
+def _as_cells(cells) -> np.ndarray:
+    """Converts (row, column) coordinates to an (n, 2) int64 array."""
+    return np.asarray(list(cells) if not isinstance(cells, np.ndarray) else cells, dtype=np.int64).reshape(-1, 2)
+
+
+def _sort_key(cells: np.ndarray) -> Tuple[int, bytes]:
+    """Orders normalized cell arrays: by population, then lexicographically by coordinates."""
+    # Big-endian bytes of non-negative ints compare like the numbers themselves
+    return len(cells), cells.astype('>i4').tobytes()
+
+
+def symmetry_images(cells) -> Iterator[np.ndarray]:
+    """
+    Yields the 8 images of a cell set under rotation and reflection, each moved to the origin
+    and sorted by row then column.
+
+    Args:
+    - cells (Iterable[Tuple[int, int]] | np.ndarray): (row, column) coordinates of the alive cells.
+
+    Returns:
+    - Iterator[np.ndarray]: Eight (n, 2) int64 arrays.
+    """
+    cells = _as_cells(cells)
+    for matrix in SYMMETRIES:
+        image = cells @ matrix.T
+        if len(image):
+            image -= image.min(axis=0)
+        yield image[np.lexsort((image[:, 1], image[:, 0]))]
+
+
+def canonical_cells(cells) -> np.ndarray:
+    """
+    Returns the canonical form of a cell set: the smallest of its 8 symmetry images.
+
+    Two cell sets have the same canonical form exactly when one is a rotated, reflected and/or
+    translated copy of the other.
+
+    Args:
+    - cells (Iterable[Tuple[int, int]] | np.ndarray): (row, column) coordinates of the alive cells.
+
+    Returns:
+    - np.ndarray: (n, 2) int64 array, sorted, with its bounding box at the origin.
+    """
+    return min(symmetry_images(cells), key=_sort_key)
+
+
+def ship_phases(cells, period: int, rule: Union[str, Rule] = "B3/S23") -> List[np.ndarray]:
+    """
+    Simulates a pattern through one period and returns every phase.
+
+    Args:
+    - cells (Iterable[Tuple[int, int]] | np.ndarray): (row, column) coordinates of the alive cells.
+    - period (int): Period of the pattern.
+    - rule (Union[str, Rule]): Life-like rule the pattern runs under.
+
+    Returns:
+    - List[np.ndarray]: period arrays of (row, column) coordinates, the first being cells. Only cells
+        itself under B0 rules, which cannot be simulated on an unbounded board.
+    """
+    cells = _as_cells(cells)
+    rule = parse_rule(rule)
+    if rule.births_from_nothing or period <= 1:
+        return [cells]
+
+    grid = SparseGrid(rule=rule)
+    grid.set_cells(map(tuple, cells.tolist()))
+    phases = [cells]
+    for _ in range(period - 1):
+        grid.update()
+        phases.append(_as_cells(sorted(grid.live_cells)))
+    return phases
+
+
+def canonical_digest(phases: Iterable) -> str:
+    """
+    Digests the canonical form of a pattern over all its phases and symmetries.
+
+    The digest only depends on the pattern, not on its position, orientation, mirror image or on
+    the phase it was captured in, so it identifies a ship (or oscillator, or still life).
+
+    Args:
+    - phases (Iterable): Every phase of the pattern, each as (row, column) coordinates (see ship_phases).
+
+    Returns:
+    - str: 32 character hexadecimal digest.
+    """
+    canonical = min((canonical_cells(phase) for phase in phases), key=_sort_key)
+    population, data = _sort_key(canonical)
+    return hashlib.blake2b(population.to_bytes(4, 'big') + data, digest_size=16).hexdigest()
+
+
+def ship_digest(cells, period: int = 1, rule: Union[str, Rule] = "B3/S23") -> str:
+    """
+    Digests a pattern given in one phase, see canonical_digest.
+
+    Args:
+    - cells (Iterable[Tuple[int, int]] | np.ndarray): (row, column) coordinates of the alive cells.
+    - period (int): Period of the pattern, 1 digests the given phase only.
+    - rule (Union[str, Rule]): Life-like rule the pattern runs under.
+
+    Returns:
+    - str: 32 character hexadecimal digest.
+    """
+    return canonical_digest(ship_phases(cells, period, rule))
+
+
+class DigestIndex:
+    """
+    Index of canonical ship digests for O(1) "have we seen this ship" checks.
+
+    Attributes:
+    - ships (Dict[str, str]): Digest -> id of the first ship stored with it.
+
+    Methods:
+    - add(digest, ship_id): Stores a digest, returns whether it was new.
+    - filter_new(results): Yields the results whose digest was not seen yet, adding them.
+    - from_results(results): Builds an index from BatchRunner results.
+    """
+
+    def __init__(self) -> None:
+        self.ships: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.ships)
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self.ships
+
+    def get(self, digest: str) -> Optional[str]:
+        """
+        Returns the id of the ship stored with a digest.
+
+        Args:
+        - digest (str): The canonical digest.
+
+        Returns:
+        - Optional[str]: The ship id, None if the digest is unknown.
+        """
+        return self.ships.get(digest)
+
+    def add(self, digest: str, ship_id: str) -> bool:
+        """
+        Stores a digest unless it is already known.
+
+        Args:
+        - digest (str): The canonical digest.
+        - ship_id (str): Id of the ship it belongs to.
+
+        Returns:
+        - bool: True if the digest was new.
+        """
+        if digest in self.ships:
+            return False
+        self.ships[digest] = ship_id
+        return True
+
+    def filter_new(self, results: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Deduplicates search output: yields every result with an unseen digest and records it.
+
+        Results without a digest (e.g. ships that died out or were not classified) are yielded as is.
+
+        Args:
+        - results (Iterable[Dict]): Results as produced by BatchRunner.run_ship.
+
+        Returns:
+        - Iterator[Dict]: The results of ships not seen before.
+        """
+        for result in results:
+            digest = result.get('digest')
+            if digest is None or self.add(digest, result.get('id')):
+                yield result
+
+    @classmethod
+    def from_results(cls, results: Iterable[Dict]) -> 'DigestIndex':
+        """
+        Builds an index from BatchRunner results, e.g. of the whole ship catalogue.
+
+        Args:
+        - results (Iterable[Dict]): Results as produced by BatchRunner.run_ship.
+
+        Returns:
+        - DigestIndex: The index of every digest in the results.
+        """
+        index = cls()
+        for _ in index.filter_new(results):
+            pass
+        return index
@@ -0,0 +1,43 @@
+from typing import Dict, Type, Union
+
+from src.bit_grid import BitGrid
+from src.grid import Grid
+from src.hashlife import HashlifeGrid
+from src.incremental_grid import IncrementalGrid
+from src.numpy_grid import NumpyGrid
+from src.shared_grid import SharedGrid
+from src.sparse_grid import SparseGrid
+from src.tiled_grid import TiledGrid
+
+# Available grid engines, selected by name through Game/GameLoop(engine=...)
+GRID_ENGINES: Dict[str, Union[Type[Grid], Type[HashlifeGrid]]] = {
+    "list": Grid,
+    "numpy": NumpyGrid,
+    "sparse": SparseGrid,
+    "incremental": IncrementalGrid,
+    "bit": BitGrid,
+    "hashlife": HashlifeGrid,
+    "tiled": TiledGrid,
+    "shared": SharedGrid,
+}
+
+
+def create_grid(rows: int, cols: int, engine: str = "list", **kwargs) -> Union[Grid, HashlifeGrid]:
+    """
+    Creates a grid using the named engine.
+
+    Args:
+    - rows (int): Number of rows in the grid_coordinates.
+    - cols (int): Number of columns in the grid_coordinates.
+    - engine (str): Name of the engine, one of GRID_ENGINES.
+    - **kwargs: Extra engine specific arguments.
+
+    Returns:
+    - Union[Grid, HashlifeGrid]: The created grid.
+
+    Raises:
+    - ValueError: If the engine name is unknown.
+    """
+    if engine not in GRID_ENGINES:
+        raise ValueError(f"Unknown grid engine '{engine}', expected one of {sorted(GRID_ENGINES)}")
+    return GRID_ENGINES[engine](rows, cols, **kwargs)
@@ -1,6 +1,7 @@
-from typing import Tuple
+from typing import Optional, Tuple, Union
 from src.ship import Ship
-from src.grid import Grid
+from src.engines import create_grid
+from src.rules import Rule
 
 
 class Game:
@@ -10,24 +11,31 @@ class Game:
     Attributes:
     - grid_coordinates (Grid): The grid_coordinates object that represents the game world.
     - ships (List[Ship]): A list of ships in the game.
-    - rules (dict): A dictionary defining the rules for cell survival and birth.
+    - grid.rule (Rule): The Life-like rule defining cell survival and birth (B3/S23 by default).
 
     Methods:
     - initialize(): Initializes the game with an empty grid_coordinates.
     - update(): Updates the game state (grid_coordinates) based on the Game of Life rules.
     - place_ship(ship, position): Places a ship on the grid_coordinates at a specified position.
     - clear(): Resets the game grid_coordinates to its initial state.
+    - close(): Releases the grid's resources (see Grid.close).
     """
 
-    def __init__(self, rows: int, cols: int) -> None:
+    def __init__(self, rows: int, cols: int, engine: str = "list", rule: Union[str, Rule] = "B3/S23",
+                 boundary: Optional[str] = None) -> None:
         """
         Initializes the game with the given grid_coordinates size and sets up the grid_coordinates.
 
         Args:
         - rows (int): The number of rows in the grid_coordinates.
         - cols (int): The number of columns in the grid_coordinates.
+        - engine (str): Name of the grid engine to use (see src.engines.GRID_ENGINES).
+        - rule (Union[str, Rule]): Life-like rule in B/S notation, e.g. 'B3/S23' or 'B36/S23'.
+        - boundary (Optional[str]): What lies beyond the edges, 'dead', 'torus' or 'expand' (see
+            src.grid.BOUNDARIES); None for the engine's default, dead edges except for hashlife.
         """
-        self.grid = Grid(rows, cols)
+        boundary_kwargs = {} if boundary is None else {'boundary': boundary}
+        self.grid = create_grid(rows, cols, engine, rule=rule, **boundary_kwargs)
         self.ships = []
 
     def initialize(self) -> None:
@@ -70,3 +78,12 @@ class Game:
         """
         self.grid.clear()
         self.ships.clear()
+
+    def close(self) -> None:
+        """
+        Releases the resources of the grid engine, e.g. the shared memory of a 'shared' grid.
+
+        Returns:
+        - None
+        """
+        self.grid.close()
@@ -1,45 +1,99 @@
+import logging
 import time
-from typing import Tuple, Optional, List
-
-import pygame
+from typing import Tuple, Optional, List, Union
 
 from src.game import Game
+from src.rules import Rule
 from src.ship import Ship
 from src.ship_detector import ShipDetector
 
+logger = logging.getLogger(__name__)
+
+
+class LoopObserver:
+    """
+    Something attached to a GameLoop that is shown the board, e.g. a window (see src.renderer.PygameView).
+
+    The loop works without any observer, so the simulation never depends on a display.
+
+    Methods:
+    - draw(grid): Shows the current generation.
+    - poll(): Processes input, returns False to stop the loop.
+    - classified(classification): Told once when the run is classified (see ShipDetector.classify).
+    - close(): Releases the observer's resources once the loop ended.
+    """
+
+    def draw(self, grid) -> None:
+        pass
+
+    def classified(self, classification: dict) -> None:
+        pass
+
+    def poll(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
+
 
 class GameLoop:
     def __init__(self, rows: int, cols: int, cell_size: int, ships: Optional[List[Ship]] = None,
-                 delay: float = 1.0, window_size: Tuple[int, int] = (800, 600), timer_limit: float = None):
-        self.game = Game(rows, cols)
+                 delay: float = 1.0, window_size: Tuple[int, int] = (800, 600), timer_limit: float = None,
+                 engine: str = "list", stop_when_classified: bool = False, fps: float = 60.0,
+                 headless: bool = False, rule: Union[str, Rule] = "B3/S23", boundary: Optional[str] = None,
+                 max_history: int = 7):
+        self.game = Game(rows, cols, engine, rule, boundary)
+        self.stop_when_classified = stop_when_classified  # Stop once the run died, stabilised or repeats
+        self.running = False
         self.ships = ships  # List of ships
-        self.delay = delay
-        self.timer_limit = timer_limit
-        self.start_time = pygame.time.get_ticks()
+        self.delay = delay  # Seconds between generations, 0 simulates as fast as possible
+        self.timer_limit = timer_limit  # Seconds the run may last, None runs until quit or classified
+        self.fps = fps  # Maximum frames per second, generations in between frames are not drawn
+        self.generation = 0
+        self.start_time = None
         self.window_size = window_size
-        self.ship_detector = ShipDetector(self.game.grid.grid_coordinates)
-
-        # Initialize Pygame
-        pygame.init()
-        self.screen = pygame.display.set_mode(self.window_size)
-        pygame.display.set_caption("Game of Life with Ship Movement")
+        # Reads the live cells straight from the engine, detects periods up to max_history
+        self.ship_detector = ShipDetector(self.game.grid, max_history=max_history)
+        self.classification = None  # The detector's classification, once the run is classified
 
         # Cell size (adjust this for the resolution of the grid)
         self.cell_size = cell_size
 
+        # Rendering is an optional observer, pygame is only imported when a window is wanted
+        self.observers: List[LoopObserver] = []
+        self.view = None
+        if not headless:
+            from src.renderer import PygameView
+            self.view = PygameView(self.window_size, self.cell_size, "Game of Life with Ship Movement")
+            self.add_observer(self.view)
+
         # Place the ships on the grid initially
         if ships:
             for ship in self.ships:
-                ship.place(self.game.grid.grid_coordinates)
+                self.game.grid.set_cells(ship.compute_cells())
 
     def update(self):
-        """Updates the game grid and processes the game state."""
+        """Advances one generation and draws it."""
+        self.step()
+
+        # Handle Pygame events (e.g., quitting the game)
+        self.handle_events()
+
+        # Draw the grid and ships
+        self.draw_grid()
+
+    def step(self):
+        """Updates the game grid and processes the game state, without drawing."""
+        # The initial state is generation 0, let the detector see it before the first update
+        if self.ship_detector.generation < self.generation:
+            self.ship_detector.detect_and_classify_ships(self.generation)
+
         # Update the grid with the Game of Life rules
         self.game.grid.update()  # Call the grid's update method
+        self.generation += 1
 
-        # Detect moving ships after the grid update
-        self.ship_detector.grid = self.game.grid.grid_coordinates
-        moving_ships = self.ship_detector.detect_and_classify_ships()
+        # Detect moving ships after the grid update, numbering generations like the loop
+        moving_ships = self.ship_detector.detect_and_classify_ships(self.generation)
 
         # Display moving ships' direction information
         if moving_ships:
@@ -47,59 +101,91 @@ class GameLoop:
             for ship_info in moving_ships:
                 print(x, ship_info)
                 x += 1
-        # Handle Pygame events (e.g., quitting the game)
-        self.handle_events()
 
-        # Draw the grid and ships
-        self.draw_grid()
+        # Tell the observers once, and stop at the earliest point the outcome of the run is known
+        if self.classification is None and self.ship_detector.is_classified:
+            self.classification = self.ship_detector.classification
+            logger.info("Run classified at generation %d: %s", self.generation, self.classification)
+            for observer in self.observers:
+                observer.classified(self.classification)
+        if self.stop_when_classified and self.classification is not None:
+            self.running = False
 
     @staticmethod
     def handle_events():
         """Handles Pygame events (e.g., quit, key press)."""
         pass
 
+    def add_observer(self, observer: LoopObserver):
+        """Attaches an observer that is shown the board at the frame rate."""
+        self.observers.append(observer)
+
     def draw_grid(self):
-        """Draws the grid and ships on the Pygame window."""
-        self.screen.fill((255, 255, 255))  # Fill the screen with white
-        # Draw the cells of the grid
-        for r in range(len(self.game.grid.grid_coordinates)):
-            for c in range(len(self.game.grid.grid_coordinates[0])):
-                color = (0, 0, 0) if self.game.grid.grid_coordinates[r][c] == 1 else (255, 255, 255)
-                pygame.draw.rect(self.screen, color,
-                                 (c * self.cell_size, r * self.cell_size, self.cell_size, self.cell_size))
-
-        # Update the display
-        pygame.display.flip()
+        """Shows the grid to every observer (e.g. the Pygame window)."""
+        for observer in self.observers:
+            observer.draw(self.game.grid)
 
     def add_ship(self, ship: Ship):
         """Adds a new ship to the game."""
         if not self.ships:
             self.ships = []
         self.ships.append(ship)
-        ship.place(self.game.grid.grid_coordinates)
+        self.game.grid.set_cells(ship.compute_cells())
 
     def run(self):
-        """Runs the game loop."""
-        running = True
-        while running:
-            self.update()
-            time.sleep(self.delay)  # Wait before the next update
-
-            # Check for quit event and time limit
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False  # Exit the loop
-                    break  # No more events should be processed after quitting
-
-        # Quit Pygame safely after the loop ends
+        """
+        Runs the game loop.
+
+        The simulation and the display are scheduled separately: generations are stepped every delay
+        seconds (or back to back when delay is 0) and the board is drawn at most fps times per second,
+        showing whatever generation is current. A slow display therefore never slows the simulation
+        down, it only skips generations. The run ends when the window is closed, when timer_limit
+        seconds have passed or, with stop_when_classified, once the outcome is known.
+        """
+        self.running = True
+        self.start_time = time.perf_counter()
+        frame_interval = 1.0 / self.fps if self.fps else 0.0
+        next_step = next_frame = self.start_time
+
+        while self.running:
+            now = time.perf_counter()
+            if self.timer_limit is not None and now - self.start_time >= self.timer_limit:
+                break
+
+            if self.observers and now >= next_frame:
+                self.poll_events()
+                self.draw_grid()
+                # Skip frames the display could not keep up with instead of catching up
+                next_frame = max(next_frame + frame_interval, now)
+
+            if not self.delay:
+                self.step()
+            elif now >= next_step:
+                self.step()
+                # Drop the backlog when the simulation is slower than the requested rate
+                next_step = max(next_step + self.delay, now)
+            elif self.observers:
+                time.sleep(max(0.0, min(next_step, next_frame) - time.perf_counter()))
+            else:
+                time.sleep(max(0.0, next_step - time.perf_counter()))
+
+        # Show the final generation, then quit Pygame safely after the loop ends
+        self.draw_grid()
         self.quit_game()
 
-    @staticmethod
-    def quit_game():
+    def poll_events(self):
+        """Processes pending input, stopping the loop when an observer asks to (e.g. the window was closed)."""
+        self.handle_events()
+        for observer in self.observers:
+            if not observer.poll():
+                self.running = False  # Exit the loop
+
+    def quit_game(self):
         """Handles quitting the game after the time limit is reached."""
         print("Game time has ended!")
-        pygame.quit()  # This safely quits the Pygame system after the loop
-        exit()  # Exit the program
+        for observer in self.observers:
+            observer.close()  # This safely quits the Pygame system after the loop
+        self.game.close()  # Releases the grid's resources, e.g. the shared memory of a 'shared' grid
 
     def clear_grid(self):
         """Just clears the grid, making way for new ship or runs."""
@@ -122,73 +208,10 @@ x = 19, y = 37, rule = b3/s23
 4o5b4o3b$b2o13b2ob$b2obo9bob2ob$2bobo4bo4bobo2b$4b2o7b2o!
     """
 
-    from typing import List
-
-    import re
+    from src.rle import header_rule, read_rle, rle_to_2d_grid
 
-
-    def rle_to_2d_grid(rle_data: str) -> list:
-        """
-        Convert RLE data for a Game of Life pattern into a 2D grid.
-
-        Args:
-            rle_data (str): The RLE-encoded pattern data.
-
-        Returns:
-            list: A 2D grid representing the pattern.
-        """
-        # Extract the grid size from the RLE header (x, y dimensions)
-        match = re.match(r"x = (\d+), y = (\d+), rule = .*$", rle_data.strip().splitlines()[0])
-        if not match:
-            raise ValueError("Invalid RLE header")
-
-        width, height = int(match.group(1)), int(match.group(2))
-
-        # Remove the header from the RLE data
-        rle_data = '\n'.join(rle_data.strip().splitlines()[1:])
-
-        # Initialize an empty grid with all cells set to 0 (dead)
-        grid = [[0] * width for _ in range(height)]
-
-        x = y = 0  # Starting position on the grid
-
-        # Loop through the RLE data and populate the grid
-        for line in rle_data.splitlines():
-            idx = 0
-            while idx < len(line):
-                # Check if it's a number (repetition count) or character (cell type)
-                if line[idx].isdigit():
-                    # Handle the run-length (repetition)
-                    count = 0
-                    while idx < len(line) and line[idx].isdigit():
-                        count = count * 10 + int(line[idx])
-                        idx += 1
-                else:
-                    # Handle the cells (one unit for each character 'b' or 'o')
-                    count = 1
-
-                char = line[idx]
-
-                if char == 'b':  # 'b' is for a dead cell (0)
-                    for _ in range(count):
-                        if 0 <= y < height and 0 <= x < width:
-                            grid[y][x] = 0
-                        x += 1
-                elif char == 'o':  # 'o' is for an alive cell (1)
-                    for _ in range(count):
-                        if 0 <= y < height and 0 <= x < width:
-                            grid[y][x] = 1
-                        x += 1
-                elif char == '$':  # End of a row
-                    y += 1
-                    x = 0
-                idx += 1
-
-        # Return the grid after populating all cells
-        return grid
-
-
-    # Decode and format the RLE
+    # Decode and format the RLE, the header tells which rule the pattern runs under
+    header, _ = read_rle(rle_data)
     decoded_grid = grid = rle_to_2d_grid(rle_data)
     for row in grid:
         print(row)
@@ -226,6 +249,7 @@ x = 19, y = 37, rule = b3/s23
     game_loop = GameLoop(
         rows=200, cols=200, cell_size=5,
         ships=[glider_ship],
-        delay=0.05
+        delay=0.05,
+        rule=header_rule(header)
     )
     game_loop.run()
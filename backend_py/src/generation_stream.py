@@ -0,0 +1,414 @@
+import json
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# Frame kinds
+KEYFRAME = 'key'
+DELTA = 'delta'
+
+
+def cell_keys(cells: np.ndarray) -> np.ndarray:
+    """
+    Packs (row, column) coordinates into one int64 per cell, ordered like the coordinates (by row,
+    then column), so that sets of cells can be compared with NumPy's sorted set routines.
+
+    Args:
+    - cells (np.ndarray): (n, 2) array of coordinates, columns within +-2**31.
+
+    Returns:
+    - np.ndarray: The n keys.
+    """
+    cells = np.asarray(cells, dtype=np.int64).reshape(-1, 2)
+    return (cells[:, 0] << 32) + cells[:, 1]
+
+
+def key_cells(keys: np.ndarray) -> np.ndarray:
+    """
+    Unpacks keys made by cell_keys back into coordinates.
+
+    Args:
+    - keys (np.ndarray): The keys.
+
+    Returns:
+    - np.ndarray: (n, 2) int64 array of (row, column) coordinates.
+    """
+    rows = (keys + (1 << 31)) >> 32
+    return np.stack([rows, keys - (rows << 32)], axis=1)
+
+
+def cell_array(grid) -> Optional[np.ndarray]:
+    """
+    Returns the cells of an array based engine (view() or to_array()) without copying them when it can.
+
+    Args:
+    - grid: The grid engine.
+
+    Returns:
+    - Optional[np.ndarray]: (rows, cols) array of cells starting at grid.origin, None for engines that
+        do not keep an array (list, sparse, hashlife).
+    """
+    if hasattr(grid, 'view'):
+        return grid.view()
+    if hasattr(grid, 'to_array'):
+        return grid.to_array()
+    return None
+
+
+class DeltaEncoder:
+    """
+    Turns consecutive generations of a grid engine into the cells born and the cells died.
+
+    encode() is meant to be called after every update(), as GenerationStream does. How much it costs
+    depends on the engine:
+
+    - Engines that track what their last update changed (changed_cells(): incremental, sparse, tiled,
+      hashlife) hand the changes over directly. Only those cells are sorted, so the cost follows the
+      change rate. When the engine cannot tell (the board was edited since the update), encode()
+      asks for a keyframe.
+    - Other engines that keep their cells in an array (view() or to_array(): numpy, bit, shared) are
+      diffed with one vectorized comparison against a copy of the previous generation. This costs
+      O(rows * cols) per generation whatever the change rate, at NumPy speed.
+    - The list Grid is diffed as sorted arrays of cell keys built from get_live_cells(), O(population)
+      per generation in Python.
+
+    Cells are returned as (n, 2) int64 arrays of (row, column) coordinates ordered by row, then column.
+    """
+
+    def __init__(self) -> None:
+        self._tracked = False
+        self._previous: Optional[np.ndarray] = None
+        self._previous_origin: Tuple[int, int] = (0, 0)
+        self._previous_keys: Optional[np.ndarray] = None
+
+    @staticmethod
+    def _keys(grid) -> np.ndarray:
+        """Returns the sorted keys of the alive cells of any engine."""
+        return np.unique(cell_keys(np.array(grid.get_live_cells(), dtype=np.int64)))
+
+    def reset(self, grid) -> np.ndarray:
+        """
+        Starts over from the current generation of a grid.
+
+        Args:
+        - grid: The grid engine.
+
+        Returns:
+        - np.ndarray: (n, 2) coordinates of every alive cell, for a keyframe.
+        """
+        self._tracked = hasattr(grid, 'changed_cells')
+        cells = cell_array(grid)
+        if self._tracked:
+            # The engine reports its own changes, no previous generation to keep
+            self._previous = self._previous_keys = None
+            if cells is None:
+                return key_cells(self._keys(grid))
+            return np.argwhere(cells) + np.array(getattr(grid, 'origin', (0, 0)), dtype=np.int64)
+        if cells is None:
+            self._previous = None
+            self._previous_keys = self._keys(grid)
+            return key_cells(self._previous_keys)
+        self._previous = cells.copy()
+        self._previous_origin = getattr(grid, 'origin', (0, 0))
+        self._previous_keys = None
+        return np.argwhere(cells) + np.array(self._previous_origin, dtype=np.int64)
+
+    def encode(self, grid) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Diffs the current generation of a grid against the previous one.
+
+        Args:
+        - grid: The grid engine, the same one reset() was last called with.
+
+        Returns:
+        - Optional[Tuple[np.ndarray, np.ndarray]]: (n, 2) coordinates of the cells born and of the cells
+            died, None when a keyframe is needed: the board changed shape (an 'expand' board grew) or
+            the engine does not know what its last update changed.
+        """
+        if self._tracked:
+            changes = grid.changed_cells()
+            if changes is None:
+                return None
+            return tuple(key_cells(np.sort(cell_keys(cells))) for cells in changes)
+
+        if self._previous_keys is not None:
+            keys = self._keys(grid)
+            born = np.setdiff1d(keys, self._previous_keys, assume_unique=True)
+            died = np.setdiff1d(self._previous_keys, keys, assume_unique=True)
+            self._previous_keys = keys
+            return key_cells(born), key_cells(died)
+
+        cells = cell_array(grid)
+        origin = getattr(grid, 'origin', (0, 0))
+        if cells.shape != self._previous.shape or origin != self._previous_origin:
+            return None
+        changed = np.flatnonzero(cells != self._previous)
+        alive = cells.ravel()[changed] != 0
+        self._previous.ravel()[changed] = alive
+        rows, cols = np.divmod(changed, cells.shape[1])
+        pairs = np.stack([rows + origin[0], cols + origin[1]], axis=1)
+        return pairs[alive], pairs[~alive]
+
+
+def coalesce(frames: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merges consecutive delta frames into the net change from before the first to after the last.
+
+    A cell flips with every frame that lists it, so it changed overall when it is listed an odd number
+    of times, and was born overall when its first listing is a birth. A cell born and died again in
+    between appears in neither array, so a lagging client receives each changed cell at most once
+    however many frames it missed.
+
+    Args:
+    - frames (List[Dict]): Delta frames in order, each with 'born' and 'died' coordinate arrays.
+
+    Returns:
+    - Tuple[np.ndarray, np.ndarray]: (n, 2) coordinates of the cells born and of the cells died.
+    """
+    if len(frames) == 1:
+        return frames[0]['born'], frames[0]['died']
+    keys = np.concatenate([cell_keys(frame[kind]) for frame in frames for kind in ('born', 'died')])
+    births = np.concatenate([np.full(len(frame[kind]), kind == 'born')
+                             for frame in frames for kind in ('born', 'died')])
+    order = np.argsort(keys, kind='stable')  # Stable: keeps each cell's listings in frame order
+    keys, first, counts = np.unique(keys[order], return_index=True, return_counts=True)
+    changed = counts % 2 == 1
+    born = births[order][first]
+    return key_cells(keys[changed & born]), key_cells(keys[changed & ~born])
+
+
+class GenerationStream:
+    """
+    Runs a simulation on a background thread and broadcasts its generations to any number of clients.
+
+    Every generation is published as a frame into a ring buffer of buffer_size frames: a keyframe
+    (every alive cell) every keyframe_interval generations, and in between a delta frame (the cells
+    born and died, see DeltaEncoder). The simulation never waits for clients. Each client only keeps
+    the sequence number of the last frame it received and asks for everything newer (next_message):
+
+    - A client that kept up receives the next delta.
+    - A client that fell behind receives all missed deltas coalesced into one message, so the
+      frames in between are dropped rather than queued and its bandwidth follows what it can take.
+    - A client whose frames already left the ring (or a new client) receives the newest keyframe
+      with the deltas after it applied, and continues with deltas from there.
+
+    Messages are dicts with 'seq', 'generation', 'kind' ('key' or 'delta') and either 'cells' or
+    'born' and 'died' as (n, 2) coordinate arrays (see DeltaEncoder); keyframes also carry 'rows' and
+    'cols'. sse_event and src.wire_format serialize them.
+
+    Attributes:
+    - grid: The grid engine being simulated.
+    - delay (float): Seconds per generation, 0 simulates as fast as possible.
+    - generation (int): Number of generations simulated.
+    - running (bool): Whether the simulation thread runs.
+    - lock (threading.Lock): Held while stepping; hold it to read grid and generation consistently.
+
+    Methods:
+    - start(): Starts the simulation thread.
+    - stop(): Stops it, clients get their last messages and end.
+    - close(): Stops it and releases the grid's resources (see Grid.close).
+    - next_message(after, timeout): Waits for and returns the message for a client.
+    - subscribe(after): Yields the messages for one client until the stream stops.
+    """
+
+    def __init__(self, grid, delay: float = 0.1, buffer_size: int = 256, keyframe_interval: int = 64,
+                 max_generations: Optional[int] = None) -> None:
+        """
+        Initializes the stream, publishing the current generation as the first keyframe.
+
+        Args:
+        - grid: The grid engine to simulate, with its initial pattern set.
+        - delay (float): Seconds per generation, 0 simulates as fast as possible.
+        - buffer_size (int): Number of frames kept for lagging clients.
+        - keyframe_interval (int): Generations between keyframes.
+        - max_generations (Optional[int]): Stop after this many generations, None runs until stop().
+
+        Raises:
+        - ValueError: If the buffer cannot hold a keyframe interval.
+        """
+        if keyframe_interval < 1 or buffer_size < keyframe_interval + 1:
+            raise ValueError("buffer_size must exceed keyframe_interval, so the ring always holds a keyframe")
+        self.grid = grid
+        self.delay = delay
+        self.keyframe_interval = keyframe_interval
+        self.max_generations = max_generations
+        self.generation = 0
+        self.running = False
+        self.lock = threading.Lock()
+        self._frames: deque = deque(maxlen=buffer_size)
+        self._sequence = 0
+        self._condition = threading.Condition()
+        self._encoder = DeltaEncoder()
+        self._thread: Optional[threading.Thread] = None
+        self._publish_keyframe()
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the newest frame."""
+        return self._sequence
+
+    def _publish(self, frame: Dict) -> None:
+        """Appends a frame to the ring and wakes the waiting clients."""
+        with self._condition:
+            self._sequence += 1
+            self._frames.append({'seq': self._sequence, 'generation': self.generation, **frame})
+            self._condition.notify_all()
+
+    def _publish_keyframe(self) -> None:
+        """Publishes every alive cell of the current generation."""
+        cells = self._encoder.reset(self.grid)
+        self._publish({'kind': KEYFRAME, 'cells': cells, 'rows': self.grid.rows, 'cols': self.grid.cols})
+
+    def step(self) -> None:
+        """
+        Advances the simulation one generation and publishes it.
+
+        Returns:
+        - None
+        """
+        with self.lock:
+            self.grid.update()
+            self.generation += 1
+            delta = None if self.generation % self.keyframe_interval == 0 else self._encoder.encode(self.grid)
+            if delta is None:
+                self._publish_keyframe()
+            else:
+                self._publish({'kind': DELTA, 'born': delta[0], 'died': delta[1]})
+
+    def _run(self) -> None:
+        """Simulation thread: steps on schedule until stopped, dropping backlog rather than catching up."""
+        next_step = time.perf_counter()
+        while self.running:
+            if self.max_generations is not None and self.generation >= self.max_generations:
+                break
+            self.step()
+            if self.delay > 0:
+                next_step = max(next_step + self.delay, time.perf_counter())
+                time.sleep(max(0.0, next_step - time.perf_counter()))
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Starts the simulation thread.
+
+        Returns:
+        - None
+        """
+        if self.running:
+            return
+        self.running = True
+        self._thread = threading.Thread(target=self._run, name="generation-stream", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the simulation thread and wakes every waiting client.
+
+        Returns:
+        - None
+        """
+        with self._condition:
+            self.running = False
+            self._condition.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def close(self) -> None:
+        """
+        Stops the simulation thread, then closes the grid, e.g. unlinking the shared memory of a 'shared'
+        grid or shutting down the threads of a 'tiled' one. Frames already published stay readable.
+
+        Returns:
+        - None
+        """
+        self.stop()
+        with self.lock:
+            self.grid.close()
+
+    def _message_after(self, after: Optional[int]) -> Optional[Dict]:
+        """Builds the message bringing a client at sequence after up to date, None if it is."""
+        with self._condition:
+            if after is not None and after == self._sequence:
+                return None
+            frames = list(self._frames)
+        oldest = frames[0]['seq']
+        newest = frames[-1]
+        if after is None or not oldest - 1 <= after < newest['seq']:
+            # Unknown or lost position: resynchronize from the newest keyframe
+            key = max(i for i, frame in enumerate(frames) if frame['kind'] == KEYFRAME)
+            cells = frames[key]['cells']
+            if key + 1 < len(frames):
+                born, died = coalesce(frames[key + 1:])
+                keys = np.setdiff1d(cell_keys(cells), cell_keys(died), assume_unique=True)
+                cells = key_cells(np.union1d(keys, cell_keys(born)))
+            return {'seq': newest['seq'], 'generation': newest['generation'], 'kind': KEYFRAME,
+                    'cells': cells, 'rows': frames[key]['rows'], 'cols': frames[key]['cols']}
+
+        missed = frames[after - oldest + 1:]
+        if len(missed) == 1:
+            return missed[0]
+        if any(frame['kind'] == KEYFRAME for frame in missed):
+            # No delta is published for a keyframe's generation, so the chain restarts there
+            return self._message_after(None)
+        born, died = coalesce(missed)
+        return {'seq': newest['seq'], 'generation': newest['generation'], 'kind': DELTA,
+                'born': born, 'died': died, 'dropped': len(missed) - 1}
+
+    def next_message(self, after: Optional[int] = None, timeout: Optional[float] = None) -> Optional[Dict]:
+        """
+        Returns the message that brings a client up to date, waiting for a new frame if it already is.
+
+        Args:
+        - after (Optional[int]): Sequence number of the last message the client received, None for a
+            new client.
+        - timeout (Optional[float]): Maximum seconds to wait for a new frame.
+
+        Returns:
+        - Optional[Dict]: The message, None when nothing new arrived in time or the stream stopped.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: after is None or self._sequence != after or not self.running, timeout)
+        return self._message_after(after)
+
+    def subscribe(self, after: Optional[int] = None, heartbeat: float = 15.0) -> Iterator[Optional[Dict]]:
+        """
+        Yields the messages for one client until the stream stops, None every heartbeat seconds without
+        a new frame (so idle connections can be kept alive).
+
+        Args:
+        - after (Optional[int]): Sequence number of the last message the client received, e.g. the
+            Last-Event-ID of a reconnecting EventSource.
+        - heartbeat (float): Seconds after which None is yielded when nothing happened.
+
+        Returns:
+        - Iterator[Optional[Dict]]: The messages.
+        """
+        while True:
+            message = self.next_message(after, heartbeat)
+            if message is not None:
+                after = message['seq']
+            elif not self.running:
+                return
+            yield message
+
+
+def sse_event(message: Optional[Dict]) -> str:
+    """
+    Formats a stream message as a server-sent event, or a keep-alive comment for None.
+
+    The event id is the sequence number, so a reconnecting EventSource resumes where it stopped, and
+    the event type is the frame kind ('key' or 'delta').
+
+    Args:
+    - message (Optional[Dict]): A message from GenerationStream.
+
+    Returns:
+    - str: The event, ready to be written to a text/event-stream response.
+    """
+    if message is None:
+        return ": keep-alive\n\n"
+    data = json.dumps(message, separators=(',', ':'), default=np.ndarray.tolist)
+    return f"id: {message['seq']}\nevent: {message['kind']}\ndata: {data}\n\n"
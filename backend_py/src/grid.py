@@ -1,4 +1,65 @@
-from typing import List, Tuple
+from typing import Iterable, List, Tuple, Union
+
+from src.rules import Rule, parse_rule
+
+NEIGHBOR_OFFSETS = (
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1),           (0, 1),
+    (1, -1), (1, 0), (1, 1)
+)
+
+# Boundary modes, what lies beyond the edges of the board:
+# - 'dead': nothing, cells beyond the edges are dead and cells placed there are dropped.
+# - 'torus': the opposite edge, the board wraps around in both directions.
+# - 'expand': more board, the board grows whenever the pattern gets close to an edge.
+BOUNDARY_DEAD = "dead"
+BOUNDARY_TORUS = "torus"
+BOUNDARY_EXPAND = "expand"
+BOUNDARIES = (BOUNDARY_DEAD, BOUNDARY_TORUS, BOUNDARY_EXPAND)
+
+# Number of rows or columns added to a side of an 'expand' board when the pattern reaches it
+EXPAND_MARGIN = 16
+
+
+def check_boundary(boundary: str, supported: Tuple[str, ...], engine: str) -> str:
+    """
+    Validates a boundary mode for an engine.
+
+    Args:
+    - boundary (str): The boundary mode, one of BOUNDARIES.
+    - supported (Tuple[str, ...]): The modes the engine implements.
+    - engine (str): Name of the engine, for the error message.
+
+    Returns:
+    - str: The boundary mode.
+
+    Raises:
+    - ValueError: If the mode is unknown or not supported by the engine.
+    """
+    if boundary not in BOUNDARIES:
+        raise ValueError(f"Unknown boundary '{boundary}', expected one of {list(BOUNDARIES)}")
+    if boundary not in supported:
+        raise ValueError(f"{engine} does not support the '{boundary}' boundary, use one of {list(supported)}")
+    return boundary
+
+
+def neighbor_windows(size: int, wrap: bool) -> List[Tuple[int, ...]]:
+    """
+    Returns, for every index along one axis of the board, the indices of its 3-cell neighborhood.
+
+    Looking neighbors up through these windows replaces a bounds check per neighbor: on a dead edge
+    the windows at the edges are simply shorter, on a torus they wrap around.
+
+    Args:
+    - size (int): Number of rows or columns.
+    - wrap (bool): Whether the axis wraps around.
+
+    Returns:
+    - List[Tuple[int, ...]]: The window of every index.
+    """
+    if wrap:
+        return [((i - 1) % size, i, (i + 1) % size) for i in range(size)]
+    return [tuple(range(max(i - 1, 0), min(i + 2, size))) for i in range(size)]
 
 
 class Grid:
@@ -9,25 +70,63 @@ class Grid:
     - rows (int): Number of rows in the grid_coordinates.
     - cols (int): Number of columns in the grid_coordinates.
     - grid_coordinates (List[List[int]]): 2D grid_coordinates of cells (0 = dead, 1 = alive).
+    - cells_changed (Optional[int]): Number of cells that changed in the last update (None before the first).
+    - rule (Rule): The Life-like rule the grid_coordinates evolves by.
+    - boundary (str): What lies beyond the edges, one of BOUNDARIES.
+    - origin (Tuple[int, int]): Board coordinates of grid_coordinates[0][0]; (0, 0) unless an
+        'expand' board grew up or left, coordinates of cells never change when the board grows.
 
     Methods:
     - initialize(): Initializes the grid_coordinates to be all dead cells (0).
     - update(): Updates the grid_coordinates based on the Game of Life rules.
     - place_ship(ship, position): Places a ship on the grid_coordinates at the specified position.
+    - set_cells(cells): Marks the given (row, column) cells as alive.
+    - to_indices(cells): Maps board coordinates to grid_coordinates indices according to the boundary.
+    - expand(): Grows an 'expand' board on the sides the pattern reached.
+    - get_live_cells(): Returns the (row, column) coordinates of all alive cells.
     - clear(): Clears the grid_coordinates (resets to all dead cells).
+    - close(): Releases resources held outside the object (shared memory, threads), see the engines.
+    - population: Number of alive cells.
+    - is_static: Whether the last update changed no cells.
+
+    Every engine can be closed the same way and used as a context manager, which closes it on exit.
     """
 
-    def __init__(self, rows: int, cols: int) -> None:
+    # Boundary modes this engine implements
+    BOUNDARIES = BOUNDARIES
+
+    def __init__(self, rows: int, cols: int, rule: Union[str, Rule] = "B3/S23", boundary: str = BOUNDARY_DEAD) -> None:
         """
         Initializes the grid_coordinates with the specified size and an empty state.
 
         Args:
         - rows (int): Number of rows in the grid_coordinates.
         - cols (int): Number of columns in the grid_coordinates.
+        - rule (Union[str, Rule]): Life-like rule in B/S notation, e.g. 'B3/S23' or 'B36/S23'.
+        - boundary (str): What lies beyond the edges: 'dead', 'torus' or 'expand' (see BOUNDARIES).
+
+        Raises:
+        - ValueError: If the boundary is not supported, or is 'expand' under a B0 rule.
         """
         self.rows = rows
         self.cols = cols
+        self.rule = parse_rule(rule)
+        self.boundary = check_boundary(boundary, self.BOUNDARIES, type(self).__name__)
+        if self.boundary == BOUNDARY_EXPAND and self.rule.births_from_nothing:
+            raise ValueError(f"An 'expand' board cannot run B0 rules such as {self.rule}, "
+                             "empty space would come alive everywhere; use 'dead' or 'torus' instead.")
+        self.origin = (0, 0)
         self.grid_coordinates = self.initialize()
+        self.cells_changed = None
+        # Back buffer the next generation is written into, swapped with grid_coordinates on update
+        self._next_grid = None
+        self._build_windows()
+
+    def _build_windows(self) -> None:
+        """Computes the neighbor windows of every row and column (see neighbor_windows)."""
+        wrap = self.boundary == BOUNDARY_TORUS
+        self._row_windows = neighbor_windows(self.rows, wrap)
+        self._col_windows = neighbor_windows(self.cols, wrap)
 
     def initialize(self) -> List[List[int]]:
         """
@@ -42,49 +141,128 @@ class Grid:
         """
         Updates the grid_coordinates based on the Game of Life rules.
 
-        Rules:
-        - A cell survives if it has 2 or 3 neighbors.
-        - A dead cell becomes alive if it has 3 neighbors.
+        Rules (self.rule, B3/S23 by default):
+        - A cell survives if its number of alive neighbors is in rule.survival.
+        - A dead cell becomes alive if its number of alive neighbors is in rule.birth.
 
         Returns:
         - None
         """
-        new_grid = self.initialize()
+        if self.boundary == BOUNDARY_EXPAND:
+            self.expand()
+        if self._next_grid is None:
+            self._next_grid = self.initialize()
+        new_grid = self._next_grid
+        next_state = self.rule.rows  # next_state[cell][alive_neighbors]
+        changed = 0
 
         for r in range(self.rows):
             for c in range(self.cols):
                 alive_neighbors = self.count_alive_neighbors(r, c)
-                if self.grid_coordinates[r][c] == 1:  # Alive cell
-                    new_grid[r][c] = 1 if alive_neighbors in [2, 3] else 0
-                else:  # Dead cell
-                    new_grid[r][c] = 1 if alive_neighbors == 3 else 0
+                new_grid[r][c] = next_state[self.grid_coordinates[r][c]][alive_neighbors]
+                changed += new_grid[r][c] != self.grid_coordinates[r][c]
 
+        self._next_grid = self.grid_coordinates
         self.grid_coordinates = new_grid
+        self.cells_changed = changed
+
+    @property
+    def population(self) -> int:
+        """Number of alive cells, summed row by row."""
+        return sum(sum(row) for row in self.grid_coordinates)
+
+    @property
+    def is_static(self) -> bool:
+        """Whether the last update left every cell unchanged (False before the first update)."""
+        return self.cells_changed == 0
 
     def count_alive_neighbors(self, row: int, col: int) -> int:
         """
         Counts the number of alive neighbors for a given cell.
 
         Args:
-        - row (int): Row index of the cell.
-        - col (int): Column index of the cell.
+        - row (int): Row index of the cell in grid_coordinates.
+        - col (int): Column index of the cell in grid_coordinates.
 
         Returns:
         - int: The number of alive neighbors.
         """
-        directions = [
-            (-1, -1), (-1, 0), (-1, 1),
-            (0, -1),         (0, 1),
-            (1, -1), (1, 0), (1, 1)
-        ]
-        count = 0
+        grid = self.grid_coordinates
+        cols = self._col_windows[col]
+        return sum(grid[r][c] for r in self._row_windows[row] for c in cols) - grid[row][col]
+
+    def edges_alive(self) -> Tuple[bool, bool, bool, bool]:
+        """
+        Checks which edges of grid_coordinates hold alive cells.
+
+        Returns:
+        - Tuple[bool, bool, bool, bool]: Whether the top, bottom, left and right edge hold an alive cell.
+        """
+        grid = self.grid_coordinates
+        return (any(grid[0]), any(grid[-1]),
+                any(row[0] for row in grid), any(row[-1] for row in grid))
+
+    def expand(self) -> None:
+        """
+        Grows an 'expand' board by EXPAND_MARGIN on every side whose edge holds an alive cell.
+
+        Cells beyond an edge can only be born next to an alive cell on it, so growing before every
+        update keeps the pattern from ever being clipped.
+
+        Returns:
+        - None
+        """
+        top, bottom, left, right = self.edges_alive()
+        if top or bottom or left or right:
+            self.grow(*(EXPAND_MARGIN if side else 0 for side in (top, bottom, left, right)))
 
-        for dr, dc in directions:
-            r, c = row + dr, col + dc
-            if 0 <= r < self.rows and 0 <= c < self.cols:
-                count += self.grid_coordinates[r][c]
+    def grow(self, top: int, bottom: int, left: int, right: int) -> None:
+        """
+        Adds dead rows and columns around the board, moving the origin so no cell changes coordinates.
 
-        return count
+        Args:
+        - top, bottom, left, right (int): Number of rows or columns added on each side.
+        """
+        cols = left + self.cols + right
+        grid = [[0] * cols for _ in range(top)]
+        grid += [[0] * left + list(row) + [0] * right for row in self.grid_coordinates]
+        grid += [[0] * cols for _ in range(bottom)]
+        self._resized(top, bottom, left, right)
+        self.grid_coordinates = grid
+
+    def _resized(self, top: int, bottom: int, left: int, right: int) -> None:
+        """Updates the size, origin and neighbor windows after the board grew."""
+        self.rows += top + bottom
+        self.cols += left + right
+        self.origin = (self.origin[0] - top, self.origin[1] - left)
+        self._next_grid = None
+        self._build_windows()
+
+    def to_indices(self, cells: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Maps board coordinates to (row, column) indices of grid_coordinates, following the boundary:
+        cells beyond a dead edge are dropped, cells beyond a torus edge wrap around and an 'expand'
+        board grows to include them.
+
+        Args:
+        - cells (Iterable[Tuple[int, int]]): Absolute (row, column) coordinates of the cells.
+
+        Returns:
+        - List[Tuple[int, int]]: Indices of the cells that are on the board.
+        """
+        if self.boundary == BOUNDARY_TORUS:
+            return [(r % self.rows, c % self.cols) for r, c in cells]
+        if self.boundary == BOUNDARY_EXPAND:
+            cells = list(cells)
+            if cells:
+                top, left = self.origin
+                bottom, right = top + self.rows - 1, left + self.cols - 1
+                min_r, max_r = min(r for r, _ in cells), max(r for r, _ in cells)
+                min_c, max_c = min(c for _, c in cells), max(c for _, c in cells)
+                if min_r < top or max_r > bottom or min_c < left or max_c > right:
+                    self.grow(max(top - min_r, 0), max(max_r - bottom, 0), max(left - min_c, 0), max(max_c - right, 0))
+            return [(r - self.origin[0], c - self.origin[1]) for r, c in cells]
+        return [(r, c) for r, c in cells if 0 <= r < self.rows and 0 <= c < self.cols]
 
     def place_ship(self, ship, position: Tuple[int, int]) -> None:
         """
@@ -94,17 +272,55 @@ class Grid:
         - ship (Ship): The ship object to place on the grid_coordinates.
         - position (Tuple[int, int]): The (row, column) position where the ship will be placed.
         """
-        cells = ship.get_cells()
-        for dr, dc in cells:
-            r, c = position[0] + dr, position[1] + dc
-            if 0 <= r < self.rows and 0 <= c < self.cols:
-                self.grid_coordinates[r][c] = 1  # Mark the cell as occupied by the ship
+        self.set_cells((position[0] + dr, position[1] + dc) for dr, dc in ship.get_cells())
+
+    def set_cells(self, cells: Iterable[Tuple[int, int]]) -> None:
+        """
+        Marks the given cells as alive. Every engine takes the same absolute coordinates, and cells beyond
+        the edges are dropped, wrapped or make the board grow as the boundary says (see to_indices).
+
+        Args:
+        - cells (Iterable[Tuple[int, int]]): Absolute (row, column) coordinates of the cells.
+        """
+        cells = self.to_indices(cells)  # May grow an 'expand' board, so look the buffer up after it
+        grid = self.grid_coordinates
+        for r, c in cells:
+            grid[r][c] = 1
+
+    def get_live_cells(self) -> List[Tuple[int, int]]:
+        """
+        Returns the coordinates of all alive cells, ordered by row then column.
+
+        Returns:
+        - List[Tuple[int, int]]: The (row, column) coordinates of the alive cells.
+        """
+        top, left = self.origin
+        return [(top + r, left + c) for r, row in enumerate(self.grid_coordinates)
+                for c, cell in enumerate(row) if cell == 1]
 
     def clear(self) -> None:
         """
-        Clears the grid_coordinates (resets it to all dead cells).
+        Clears the grid_coordinates (resets it to all dead cells) in place.
 
         Returns:
         - None
         """
-        self.grid_coordinates = self.initialize()
+        zero_row = [0] * self.cols
+        for row in self.grid_coordinates:
+            row[:] = zero_row
+
+    def close(self) -> None:
+        """
+        Releases what an engine holds outside the object, like the shared memory of SharedGrid or the
+        threads of TiledGrid. The nested lists of Grid need nothing, so here it only lets every engine be
+        closed the same way.
+
+        Returns:
+        - None
+        """
+
+    def __enter__(self) -> "Grid":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
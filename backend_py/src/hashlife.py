@@ -0,0 +1,526 @@
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.grid import BOUNDARY_EXPAND, NEIGHBOR_OFFSETS, check_boundary
+from src.rules import Rule, parse_rule
+
+
+class QuadNode:
+    """
+    Node of the canonical quadtree used by HashlifeGrid.
+
+    A node of level k covers a 2^k x 2^k square made of four level k-1 children. Level 0 nodes are
+    single cells. Nodes are immutable and canonical: two nodes with the same content are the same
+    object, so they can be compared and hashed by identity.
+
+    Attributes:
+    - nw, ne, sw, se (Optional[QuadNode]): The four quadrants (None for level 0 nodes).
+    - level (int): log2 of the side length.
+    - population (int): Number of alive cells.
+    """
+
+    __slots__ = ('nw', 'ne', 'sw', 'se', 'level', 'population')
+
+    def __init__(self, nw: Optional['QuadNode'], ne: Optional['QuadNode'], sw: Optional['QuadNode'],
+                 se: Optional['QuadNode'], level: int, population: int) -> None:
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.level = level
+        self.population = population
+
+
+class HashlifeGrid:
+    """
+    Hashlife engine: a memoized, canonical quadtree that can advance the pattern 2^k generations at once.
+
+    Identical regions of the board share one node, and the future of every node is cached, so
+    repetitive patterns such as spaceships and oscillators are advanced in time logarithmic in the
+    number of generations. The plane is unbounded (the 'expand' boundary is the only one); rows and
+    cols only define the window read back through grid_coordinates.
+
+    The node table is bounded by max_nodes, also in the middle of a jump: when a new node would grow
+    it past max_nodes, only the nodes reachable from the pattern and from the squares the recursion is
+    still working on are kept, along with the cached results between them. If those alone fill more
+    than half of max_nodes, the bound is raised to twice their number so that collection does not run
+    on every new node. A small bound keeps memory flat but makes long jumps recompute more.
+
+    Attributes:
+    - rows (Optional[int]): Number of rows of the grid_coordinates window.
+    - cols (Optional[int]): Number of columns of the grid_coordinates window.
+    - generation (int): Number of generations advanced since the last clear().
+    - max_nodes (int): Size of the node table above which it is garbage collected.
+    - node_limit (int): Current bound of the node table, max_nodes unless the live nodes alone need more.
+    - cells_changed (Optional[int]): Number of cells the last update() changed, counted on first access.
+
+    Methods:
+    - update(): Advances the pattern one generation.
+    - step(generations): Advances the pattern any number of generations.
+    - jump(k): Advances the pattern 2^k generations.
+    - changed_cells(): The cells the last update() turned on and off, found by walking both trees.
+    - place_ship(ship, position): Places a ship at the specified position.
+    - set_cells(cells): Marks the given (row, column) cells as alive.
+    - get_live_cells(): Returns the (row, column) coordinates of all alive cells.
+    - clear(): Removes every alive cell.
+    - close(): Nothing to release, present so every engine can be closed the same way.
+    """
+
+    # The quadtree grows with the pattern, there are no edges to be dead or to wrap
+    BOUNDARIES = (BOUNDARY_EXPAND,)
+
+    def __init__(self, rows: Optional[int] = None, cols: Optional[int] = None, max_nodes: int = 1_000_000,
+                 rule: Union[str, Rule] = "B3/S23", boundary: str = BOUNDARY_EXPAND) -> None:
+        """
+        Initializes an empty board.
+
+        Args:
+        - rows (Optional[int]): Number of rows of the grid_coordinates window.
+        - cols (Optional[int]): Number of columns of the grid_coordinates window.
+        - max_nodes (int): Size of the node table above which it is garbage collected.
+        - rule (Union[str, Rule]): Life-like rule in B/S notation, e.g. 'B3/S23' or 'B36/S23'.
+        - boundary (str): Must be 'expand', accepted so every engine can be created the same way.
+
+        Raises:
+        - ValueError: If the rule has B0, under which the empty plane does not stay empty, or the
+            boundary is not 'expand'.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.rule = parse_rule(rule)
+        self.boundary = check_boundary(boundary, self.BOUNDARIES, type(self).__name__)
+        if self.rule.births_from_nothing:
+            raise ValueError(f"{type(self).__name__} cannot run B0 rules such as {self.rule}, "
+                             "empty space would come alive everywhere; use a dense engine instead.")
+        self.max_nodes = max_nodes
+        self.node_limit = max_nodes
+        self._changed: Optional[int] = None
+        # (root, origin) before and after the last update(), None after jump() or step()
+        self._update_states: Optional[Tuple[Tuple[QuadNode, Tuple[int, int]], Tuple[QuadNode, Tuple[int, int]]]] = None
+        # Whether the pattern was edited (set_cells, clear) since the last update()
+        self._edited = False
+        self._off = QuadNode(None, None, None, None, 0, 0)
+        self._on = QuadNode(None, None, None, None, 0, 1)
+        self._nodes: Dict[Tuple[QuadNode, QuadNode, QuadNode, QuadNode], QuadNode] = {}
+        self._empty: List[QuadNode] = [self._off]
+        self._results: Dict[Tuple[QuadNode, int], QuadNode] = {}
+        # Nodes the _successor calls in progress still need: their inputs and the results computed so far
+        self._frames: List[QuadNode] = []
+        self.clear()
+
+    # Tree construction
+
+    def _join(self, nw: QuadNode, ne: QuadNode, sw: QuadNode, se: QuadNode) -> QuadNode:
+        """
+        Returns the canonical node made of the four quadrants. Inside a jump, collects the node table
+        first when the new node would grow it past node_limit.
+        """
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            if len(self._nodes) >= self.node_limit and self._frames:
+                self._collect(self._frames + [nw, ne, sw, se])
+            node = QuadNode(nw, ne, sw, se, nw.level + 1,
+                            nw.population + ne.population + sw.population + se.population)
+            self._nodes[key] = node
+        return node
+
+    def _empty_node(self, level: int) -> QuadNode:
+        """Returns the canonical empty node of the given level."""
+        while len(self._empty) <= level:
+            smaller = self._empty[-1]
+            self._empty.append(self._join(smaller, smaller, smaller, smaller))
+        return self._empty[level]
+
+    def _centre(self, node: QuadNode) -> QuadNode:
+        """Returns a node one level up with the given node in its middle and empty space around it."""
+        border = self._empty_node(node.level - 1)
+        return self._join(
+            self._join(border, border, border, node.nw),
+            self._join(border, border, node.ne, border),
+            self._join(border, node.sw, border, border),
+            self._join(node.se, border, border, border),
+        )
+
+    def _inner(self, node: QuadNode) -> QuadNode:
+        """Returns the middle half of a node, one level down."""
+        return self._join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+    def _build(self, cells: List[Tuple[int, int]], level: int) -> QuadNode:
+        """Builds the node of the given level holding the cells, given relative to its top-left corner."""
+        if not cells:
+            return self._empty_node(level)
+        if level == 0:
+            return self._on
+        half = 1 << (level - 1)
+        quadrants = ([], [], [], [])
+        for r, c in cells:
+            index = (2 if r >= half else 0) + (1 if c >= half else 0)
+            quadrants[index].append((r % half, c % half))
+        return self._join(*(self._build(quadrant, level - 1) for quadrant in quadrants))
+
+    # Evolution
+
+    def _base_case(self, node: QuadNode) -> QuadNode:
+        """Advances the middle 2x2 cells of a level 2 node by one generation."""
+        cells = [[0] * 4 for _ in range(4)]
+        for quadrant, (r0, c0) in ((node.nw, (0, 0)), (node.ne, (0, 2)), (node.sw, (2, 0)), (node.se, (2, 2))):
+            cells[r0][c0] = quadrant.nw.population
+            cells[r0][c0 + 1] = quadrant.ne.population
+            cells[r0 + 1][c0] = quadrant.sw.population
+            cells[r0 + 1][c0 + 1] = quadrant.se.population
+
+        next_state = self.rule.rows  # next_state[cell][alive_neighbors]
+        new_cells = []
+        for r, c in ((1, 1), (1, 2), (2, 1), (2, 2)):
+            alive_neighbors = sum(cells[r + dr][c + dc] for dr, dc in NEIGHBOR_OFFSETS)
+            new_cells.append(self._on if next_state[cells[r][c]][alive_neighbors] else self._off)
+        return self._join(*new_cells)
+
+    def _successor(self, node: QuadNode, j: int) -> QuadNode:
+        """
+        Returns the middle half of a node (level k >= 2) advanced 2^j generations, with j <= k - 2.
+        """
+        if node.population == 0:
+            return node.nw
+        key = (node, j)
+        result = self._results.get(key)
+        if result is not None:
+            return result
+
+        if node.level == 2:
+            result = self._base_case(node)
+        else:
+            # Every node this call still needs is pinned in _frames, so a collection half-way through
+            # the recursion keeps it (and its canonical identity)
+            frames = self._frames
+            mark = len(frames)
+            frames.append(node)
+
+            def pinned(square: QuadNode) -> QuadNode:
+                frames.append(square)
+                return square
+
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            # Nine overlapping sub-squares of half the size, each advanced 2^j (or 2^(j-1)) generations
+            full_speed = j == node.level - 2
+            inner_j = j - 1 if full_speed else j
+            c1 = pinned(self._successor(nw, inner_j))
+            c2 = pinned(self._successor(self._join(nw.ne, ne.nw, nw.se, ne.sw), inner_j))
+            c3 = pinned(self._successor(ne, inner_j))
+            c4 = pinned(self._successor(self._join(nw.sw, nw.se, sw.nw, sw.ne), inner_j))
+            c5 = pinned(self._successor(self._join(nw.se, ne.sw, sw.ne, se.nw), inner_j))
+            c6 = pinned(self._successor(self._join(ne.sw, ne.se, se.nw, se.ne), inner_j))
+            c7 = pinned(self._successor(sw, inner_j))
+            c8 = pinned(self._successor(self._join(sw.ne, se.nw, sw.se, se.sw), inner_j))
+            c9 = pinned(self._successor(se, inner_j))
+
+            if full_speed:
+                # Advance the four recombined squares another 2^(j-1) generations
+                result = self._join(
+                    pinned(self._successor(self._join(c1, c2, c4, c5), j - 1)),
+                    pinned(self._successor(self._join(c2, c3, c5, c6), j - 1)),
+                    pinned(self._successor(self._join(c4, c5, c7, c8), j - 1)),
+                    pinned(self._successor(self._join(c5, c6, c8, c9), j - 1)),
+                )
+            else:
+                # Already advanced 2^j generations, only take the middle of the recombined squares
+                result = self._join(
+                    pinned(self._join(c1.se, c2.sw, c4.ne, c5.nw)),
+                    pinned(self._join(c2.se, c3.sw, c5.ne, c6.nw)),
+                    pinned(self._join(c4.se, c5.sw, c7.ne, c8.nw)),
+                    pinned(self._join(c5.se, c6.sw, c8.ne, c9.nw)),
+                )
+            del frames[mark:]
+
+        self._results[key] = result
+        return result
+
+    def _expand_for(self, j: int) -> None:
+        """
+        Pads the root until it is large enough to be advanced 2^j generations without losing cells.
+
+        The pattern must lie in the middle quarter of a root of level >= j + 3, so it cannot grow out
+        of the middle half that _successor returns.
+        """
+        while self._root.level < j + 3 or self._inner(self._inner(self._root)).population != self._root.population:
+            quarter = 1 << (self._root.level - 1)
+            self._root = self._centre(self._root)
+            self._origin = (self._origin[0] - quarter, self._origin[1] - quarter)
+
+    def jump(self, k: int) -> None:
+        """
+        Advances the pattern 2^k generations.
+
+        Args:
+        - k (int): log2 of the number of generations.
+
+        Returns:
+        - None
+        """
+        self._expand_for(k)
+        self._frames.clear()  # Left over if a previous jump was interrupted
+        quarter = 1 << (self._root.level - 2)
+        self._root = self._successor(self._root, k)
+        self._origin = (self._origin[0] + quarter, self._origin[1] + quarter)
+        self.generation += 1 << k
+        self._changed = None
+        self._update_states = None
+
+        # Shrink the root again while its outer half is empty
+        while self._root.level > 3 and self._inner(self._root).population == self._root.population:
+            quarter = 1 << (self._root.level - 2)
+            self._root = self._inner(self._root)
+            self._origin = (self._origin[0] + quarter, self._origin[1] + quarter)
+        if len(self._nodes) >= self.node_limit:
+            self.collect()
+
+    def step(self, generations: int) -> None:
+        """
+        Advances the pattern any number of generations by jumping each power of two it contains.
+
+        Args:
+        - generations (int): Number of generations to advance.
+
+        Returns:
+        - None
+        """
+        k = 0
+        while generations:
+            if generations & 1:
+                self.jump(k)
+            generations >>= 1
+            k += 1
+
+    def update(self) -> None:
+        """
+        Updates the pattern one generation, like Grid.update.
+
+        Returns:
+        - None
+        """
+        before = (self._root, self._origin)
+        self.jump(0)
+        self._update_states = (before, (self._root, self._origin))
+        self._edited = False
+
+    @property
+    def cells_changed(self) -> Optional[int]:
+        """
+        Number of cells the last update() changed, None before the first update() and after jump() or
+        step(). Counting walks both generations (see changed_cells), so it is only done when asked for,
+        and once.
+        """
+        if self._changed is None and self._update_states is not None:
+            born, died = self._differences()
+            self._changed = len(born) + len(died)
+        return self._changed
+
+    def _differences(self) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """
+        Returns the cells born and the cells died in the last update(), unordered.
+
+        When both roots cover the same square, which is the usual case once the pattern has settled
+        into its root, the trees are walked together and every node shared by both generations is
+        skipped, so the cost follows the regions that changed. Otherwise both generations are listed
+        and compared.
+        """
+        (before, before_origin), (after, after_origin) = self._update_states
+        if before.level != after.level or before_origin != after_origin:
+            old, new = set(self._cells(before, before_origin)), set(self._cells(after, after_origin))
+            return list(new - old), list(old - new)
+        born, died = [], []
+        stack = [(before, after, before_origin[0], before_origin[1])]
+        while stack:
+            old, new, r, c = stack.pop()
+            if old is new:
+                continue
+            if old.population == 0:
+                born.extend(self._cells(new, (r, c)))
+            elif new.population == 0:
+                died.extend(self._cells(old, (r, c)))
+            else:
+                half = 1 << (old.level - 1)
+                stack.append((old.nw, new.nw, r, c))
+                stack.append((old.ne, new.ne, r, c + half))
+                stack.append((old.sw, new.sw, r + half, c))
+                stack.append((old.se, new.se, r + half, c + half))
+        return born, died
+
+    def changed_cells(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Returns the cells the last update() turned on and off, see _differences.
+
+        Returns:
+        - Optional[Tuple[np.ndarray, np.ndarray]]: (n, 2) int64 coordinates of the cells born and of the
+            cells died, in no particular order; None before the first update(), after jump() or step(),
+            or when the pattern was edited since the last update().
+        """
+        if self._update_states is None or self._edited:
+            return None
+        born, died = self._differences()
+        self._changed = len(born) + len(died)
+        return (np.array(born, dtype=np.int64).reshape(-1, 2), np.array(died, dtype=np.int64).reshape(-1, 2))
+
+    @property
+    def is_static(self) -> bool:
+        """
+        Whether the last update() changed no cells. Settled for free when the canonical root node and its
+        position did not change, or when the population did.
+        """
+        if self._update_states is not None:
+            (before, before_origin), (after, after_origin) = self._update_states
+            if before is after and before_origin == after_origin:
+                return True
+            if before.population != after.population:
+                return False
+        return self.cells_changed == 0
+
+    def collect(self) -> None:
+        """
+        Drops every node not reachable from the current pattern, and the cached results of those nodes.
+
+        Returns:
+        - None
+        """
+        self._collect([])
+
+    def _collect(self, keep: List[QuadNode]) -> None:
+        """
+        Drops every node not reachable from the pattern or from the nodes to keep, and the cached results
+        of dropped nodes, then sets node_limit back to max_nodes, or to twice the nodes left if more than half of it is left.
+        """
+        reachable = {}
+        stack = [self._root] + self._empty[1:] + keep
+        while stack:
+            node = stack.pop()
+            if node.level == 0:
+                continue
+            key = (node.nw, node.ne, node.sw, node.se)
+            if key not in reachable:
+                reachable[key] = node
+                stack.extend(key)
+        self._nodes = reachable
+        results = self._results
+        self._results = {key: result for key, result in results.items()
+                         if self._kept(key[0]) and self._kept(result)}
+        self.node_limit = max(self.max_nodes, 2 * len(reachable))
+
+    def _kept(self, node: QuadNode) -> bool:
+        """Whether the node is still the canonical node of the table."""
+        return node.level == 0 or self._nodes.get((node.nw, node.ne, node.sw, node.se)) is node
+
+    # Grid surface
+
+    @property
+    def population(self) -> int:
+        """Number of alive cells, cached on the root node."""
+        return self._root.population
+
+    @property
+    def node_count(self) -> int:
+        """Number of nodes in the canonical node table."""
+        return len(self._nodes)
+
+    @property
+    def grid_coordinates(self) -> List[List[int]]:
+        """
+        Dense 2D list of the rows x cols window starting at (0, 0) (0 = dead, 1 = alive).
+
+        Raises:
+        - ValueError: If no window size was given.
+        """
+        if self.rows is None or self.cols is None:
+            raise ValueError("HashlifeGrid needs rows and cols to build grid_coordinates, use get_live_cells instead.")
+        dense = [[0] * self.cols for _ in range(self.rows)]
+        for r, c in self.get_live_cells():
+            if 0 <= r < self.rows and 0 <= c < self.cols:
+                dense[r][c] = 1
+        return dense
+
+    def get_live_cells(self) -> List[Tuple[int, int]]:
+        """
+        Walks the populated quadrants of the tree and returns the alive cells ordered by row then column.
+
+        Returns:
+        - List[Tuple[int, int]]: The (row, column) coordinates of the alive cells.
+        """
+        return sorted(self._cells(self._root, self._origin))
+
+    @staticmethod
+    def _cells(root: QuadNode, origin: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Returns the coordinates of the alive cells of a tree whose top-left corner is at origin, unordered."""
+        cells = []
+        stack = [(root, origin[0], origin[1])]
+        while stack:
+            node, r, c = stack.pop()
+            if node.population == 0:
+                continue
+            if node.level == 0:
+                cells.append((r, c))
+                continue
+            half = 1 << (node.level - 1)
+            stack.append((node.nw, r, c))
+            stack.append((node.ne, r, c + half))
+            stack.append((node.sw, r + half, c))
+            stack.append((node.se, r + half, c + half))
+        return cells
+
+    def set_cells(self, cells: Iterable[Tuple[int, int]]) -> None:
+        """
+        Marks the given cells as alive by rebuilding the tree around the old and new cells; any
+        coordinates are accepted, the pattern is unbounded.
+
+        Args:
+        - cells (Iterable[Tuple[int, int]]): Absolute (row, column) coordinates of the cells.
+        """
+        all_cells = set(self.get_live_cells())
+        all_cells.update(cells)
+        if not all_cells:
+            return
+
+        top = min(r for r, _ in all_cells)
+        left = min(c for _, c in all_cells)
+        span = max(max(r for r, _ in all_cells) - top, max(c for _, c in all_cells) - left) + 1
+        level = max(3, (span - 1).bit_length())
+        self._root = self._build([(r - top, c - left) for r, c in all_cells], level)
+        self._origin = (top, left)
+        self._edited = True
+
+    def place_ship(self, ship, position: Tuple[int, int]) -> None:
+        """
+        Places a ship at the specified position.
+
+        Args:
+        - ship (Ship): The ship object to place.
+        - position (Tuple[int, int]): The (row, column) position where the ship will be placed.
+        """
+        self.set_cells((position[0] + dr, position[1] + dc) for dr, dc in ship.get_cells())
+
+    def clear(self) -> None:
+        """
+        Removes every alive cell and resets the generation counter.
+
+        Returns:
+        - None
+        """
+        self._root = self._empty_node(3)
+        self._origin = (0, 0)
+        self.generation = 0
+        self._edited = True
+
+    def close(self) -> None:
+        """
+        Does nothing: the node table is ordinary Python objects, freed with the grid. Present so a
+        HashlifeGrid can be closed like the Grid engines.
+
+        Returns:
+        - None
+        """
+
+    def __enter__(self) -> "HashlifeGrid":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
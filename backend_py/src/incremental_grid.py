@@ -0,0 +1,165 @@
+from itertools import product
+from typing import Iterable, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from src.grid import BOUNDARY_DEAD, BOUNDARY_TORUS, Grid
+from src.rules import Rule
+
+
+class IncrementalGrid(Grid):
+    """
+    Grid engine that only re-evaluates the neighborhoods of cells that changed in the previous generation.
+
+    A cell can only change if itself or one of its neighbors changed in the last step, so still lifes and
+    empty space are skipped entirely. Cells are updated in place, so no new grid is allocated per step.
+    The first update (and any update after invalidate()) evaluates the whole board.
+
+    Attributes:
+    - cells_changed (Optional[int]): Number of cells that changed in the last update (None before the first).
+
+    Methods:
+    - update(): Advances the board one generation, visiting only the active cells.
+    - invalidate(): Forces the next update to evaluate every cell, needed after writing to
+      grid_coordinates directly.
+    - changed_cells(): The cells the last update turned on and off, from its list of changes.
+    - active_cells: Number of cells the next update will evaluate.
+    """
+
+    # The active set holds grid_coordinates indices, which an 'expand' board would shift
+    BOUNDARIES = (BOUNDARY_DEAD, BOUNDARY_TORUS)
+
+    def __init__(self, rows: int, cols: int, rule: Union[str, Rule] = "B3/S23", boundary: str = BOUNDARY_DEAD) -> None:
+        """
+        Initializes an empty board like Grid, with nothing for the first update to visit (every cell
+        under a B0 rule, where empty space comes alive).
+
+        Args:
+        - rows (int): Number of rows in the grid_coordinates.
+        - cols (int): Number of columns in the grid_coordinates.
+        - rule (Union[str, Rule]): Life-like rule in B/S notation, e.g. 'B3/S23' or 'B36/S23'.
+        - boundary (str): What lies beyond the edges: 'dead' or 'torus'.
+
+        Raises:
+        - ValueError: If the boundary is not supported.
+        """
+        super().__init__(rows, cols, rule, boundary)
+        # Under B0 rules an empty board changes, so it starts fully active
+        self._active: Optional[Set[Tuple[int, int]]] = None if self.rule.births_from_nothing else set()
+        # Cells the last update flipped, None once the board was edited after it
+        self._flipped: Optional[List[Tuple[int, int]]] = None
+
+    @property
+    def active_cells(self) -> int:
+        """Number of cells the next update will evaluate."""
+        return self.rows * self.cols if self._active is None else len(self._active)
+
+    def invalidate(self) -> None:
+        """
+        Marks every cell as active, so the next update evaluates the whole board.
+
+        Returns:
+        - None
+        """
+        self._active = None
+        self._flipped = None
+
+    def update(self) -> None:
+        """
+        Updates the grid_coordinates based on the Game of Life rules, visiting only active cells.
+
+        Rules (self.rule, B3/S23 by default):
+        - A cell survives if its number of alive neighbors is in rule.survival.
+        - A dead cell becomes alive if its number of alive neighbors is in rule.birth.
+
+        Returns:
+        - None
+        """
+        grid = self.grid_coordinates
+        if self._active is None:
+            candidates = product(range(self.rows), range(self.cols))
+        else:
+            candidates = self._active
+
+        # Collect every change first so that the whole generation sees the old state
+        next_state = self.rule.rows  # next_state[cell][alive_neighbors]
+        changed = []
+        for r, c in candidates:
+            cell = grid[r][c]
+            if next_state[cell][self.count_alive_neighbors(r, c)] != cell:
+                changed.append((r, c))
+
+        for r, c in changed:
+            grid[r][c] ^= 1
+
+        self.cells_changed = len(changed)
+        self._active = self._neighborhoods(changed)
+        self._flipped = changed
+
+    def changed_cells(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Returns the cells the last update turned on and off, in time proportional to their number.
+
+        Returns:
+        - Optional[Tuple[np.ndarray, np.ndarray]]: (n, 2) int64 coordinates of the cells born and of the
+            cells died, in no particular order; None before the first update or when the board was edited
+            (set_cells, clear, invalidate) since the last one.
+        """
+        if self._flipped is None:
+            return None
+        cells = np.array(self._flipped, dtype=np.int64).reshape(-1, 2)
+        grid = self.grid_coordinates
+        alive = np.array([grid[r][c] for r, c in self._flipped], dtype=bool)
+        return cells[alive], cells[~alive]
+
+    def _neighborhoods(self, cells: Iterable[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+        """
+        Returns the given cells together with all their neighbors on the board (see neighbor_windows).
+
+        Args:
+        - cells (Iterable[Tuple[int, int]]): (row, column) coordinates of the cells.
+
+        Returns:
+        - Set[Tuple[int, int]]: The cells and their neighbors.
+        """
+        area = set()
+        row_windows, col_windows = self._row_windows, self._col_windows
+        for r, c in cells:
+            cols = col_windows[c]
+            area.update((rr, cc) for rr in row_windows[r] for cc in cols)
+        return area
+
+    def _mark(self, cells: List[Tuple[int, int]]) -> None:
+        """
+        Adds the neighborhoods of externally changed cells to the active set.
+
+        Args:
+        - cells (List[Tuple[int, int]]): (row, column) coordinates of the changed cells.
+        """
+        if self._active is not None:
+            self._active |= self._neighborhoods(cells)
+
+    def set_cells(self, cells: Iterable[Tuple[int, int]]) -> None:
+        """
+        Marks the given cells as alive and adds their neighborhoods to the cells the next update visits.
+
+        Args:
+        - cells (Iterable[Tuple[int, int]]): Absolute (row, column) coordinates of the cells.
+        """
+        cells = self.to_indices(cells)
+        grid = self.grid_coordinates
+        for r, c in cells:
+            grid[r][c] = 1
+        self._mark(cells)
+        self._flipped = None
+
+    def clear(self) -> None:
+        """
+        Clears the board and resets the cells the next update visits, as on a new board.
+
+        Returns:
+        - None
+        """
+        super().clear()
+        self._active = None if self.rule.births_from_nothing else set()
+        self._flipped = None
@@ -0,0 +1,394 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.ship_detector import ShipDetector, SPACESHIP
+
+# Cells at most this many rows and columns apart belong to the same object. Objects further apart
+# cannot influence each other within one generation, so each of them evolves on its own.
+DEFAULT_REACH = 2
+
+
+class CellIndex:
+    """
+    Spatial index of a set of live cells for vectorized "is there a cell at (row, column)" queries.
+
+    Cells are linearized to keys row * width + column over their bounding box (padded by a margin)
+    and sorted, so a batch of queries is one np.searchsorted call over the population instead of a
+    lookup per cell or an array the size of the board.
+
+    Attributes:
+    - cells (np.ndarray): (n, 2) int64 array of the indexed (row, column) coordinates.
+    """
+
+    def __init__(self, cells: np.ndarray, margin: int = DEFAULT_REACH) -> None:
+        """
+        Indexes the cells.
+
+        Args:
+        - cells (np.ndarray): (n, 2) array of (row, column) coordinates.
+        - margin (int): Distance around the bounding box that queries can reach without clipping.
+        """
+        self.cells = np.asarray(cells, dtype=np.int64).reshape(-1, 2)
+        if len(self.cells):
+            self._origin = self.cells.min(axis=0) - margin
+            self._shape = self.cells.max(axis=0) - self._origin + margin + 1
+        else:
+            self._origin = np.zeros(2, dtype=np.int64)
+            self._shape = np.zeros(2, dtype=np.int64)
+        keys = self._keys(self.cells)
+        self._order = np.argsort(keys, kind='stable')
+        self._sorted_keys = keys[self._order]
+
+    def _keys(self, cells: np.ndarray) -> np.ndarray:
+        """Linear keys of cells, -1 for cells outside the padded bounding box."""
+        relative = cells - self._origin
+        inside = np.all((relative >= 0) & (relative < self._shape), axis=1)
+        return np.where(inside, relative[:, 0] * self._shape[1] + relative[:, 1], -1)
+
+    def find(self, cells: np.ndarray) -> np.ndarray:
+        """
+        Looks cells up in the index.
+
+        Args:
+        - cells (np.ndarray): (m, 2) array of (row, column) coordinates.
+
+        Returns:
+        - np.ndarray: (m,) int64 array, the position of each cell in self.cells or -1 if it is not indexed.
+        """
+        keys = self._keys(np.asarray(cells, dtype=np.int64).reshape(-1, 2))
+        if not len(self._sorted_keys):
+            return np.full(len(keys), -1, dtype=np.int64)
+        positions = np.minimum(np.searchsorted(self._sorted_keys, keys), len(self._sorted_keys) - 1)
+        found = (self._sorted_keys[positions] == keys) & (keys >= 0)
+        return np.where(found, self._order[positions], -1)
+
+    def pairs(self, cells: np.ndarray, offsets) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Finds every (query cell, indexed cell) pair where the indexed cell lies at one of the offsets
+        from the query cell.
+
+        Args:
+        - cells (np.ndarray): (m, 2) array of (row, column) coordinates.
+        - offsets (Iterable[Tuple[int, int]]): (d_row, d_col) offsets to look at.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: Positions of the pairs in cells and in self.cells.
+        """
+        cells = np.asarray(cells, dtype=np.int64).reshape(-1, 2)
+        queries, matches = [], []
+        for offset in offsets:
+            found = self.find(cells + np.asarray(offset, dtype=np.int64))
+            hit = np.flatnonzero(found >= 0)
+            queries.append(hit)
+            matches.append(found[hit])
+        if not queries:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(queries), np.concatenate(matches)
+
+
+def neighborhood_offsets(reach: int, half: bool = False) -> List[Tuple[int, int]]:
+    """
+    Returns the offsets of a (2 * reach + 1) square around a cell, without the cell itself.
+
+    Args:
+    - reach (int): Chebyshev radius of the square.
+    - half (bool): Only return one offset of each pair (d, -d), enough to find every pair of cells once.
+
+    Returns:
+    - List[Tuple[int, int]]: (d_row, d_col) offsets.
+    """
+    offsets = [(dr, dc) for dr in range(-reach, reach + 1) for dc in range(-reach, reach + 1) if dr or dc]
+    if half:
+        offsets = [(dr, dc) for dr, dc in offsets if dr > 0 or (dr == 0 and dc > 0)]
+    return offsets
+
+
+def union_find(size: int, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Merges the sets joined by the edges (a[i], b[i]) with a vectorized union-find.
+
+    Every round hooks the larger root of each edge under the smaller one and then compresses the
+    parent array by pointer jumping (parent = parent[parent]) until every element points at its root.
+    Edges within one set are dropped after each round, so the work shrinks as components merge.
+
+    Args:
+    - size (int): Number of elements.
+    - a, b (np.ndarray): int64 arrays of element indices joined by an edge.
+
+    Returns:
+    - np.ndarray: (size,) int64 array, the root of each element (the smallest index in its set).
+    """
+    parent = np.arange(size, dtype=np.int64)
+    while len(a):
+        root_a, root_b = parent[a], parent[b]
+        apart = root_a != root_b
+        if not apart.any():
+            break
+        a, b, root_a, root_b = a[apart], b[apart], root_a[apart], root_b[apart]
+        np.minimum.at(parent, np.maximum(root_a, root_b), np.minimum(root_a, root_b))
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+    return parent
+
+
+def label_cells(cells: np.ndarray, reach: int = DEFAULT_REACH) -> Tuple[np.ndarray, int]:
+    """
+    Labels the connected components (objects) of a set of live cells.
+
+    Two cells are connected when they are at most reach rows and reach columns apart; reach 1 is the
+    usual 8-connectivity, the default 2 keeps together the parts of an object that interact, such as
+    the separated arms of a pulsar. The work is vectorized over the population: the neighbor pairs come
+    from a CellIndex and are merged by union_find.
+
+    Args:
+    - cells (np.ndarray): (n, 2) array of (row, column) coordinates.
+    - reach (int): Connection distance.
+
+    Returns:
+    - Tuple[np.ndarray, int]: (n,) int64 array with the label of each cell, and the number of
+        components. Labels are numbered from 0 in order of the first cell of each component.
+    """
+    cells = np.asarray(cells, dtype=np.int64).reshape(-1, 2)
+    if not len(cells):
+        return np.empty(0, dtype=np.int64), 0
+    index = CellIndex(cells, margin=reach)
+    a, b = index.pairs(cells, neighborhood_offsets(reach, half=True))
+    roots = union_find(len(cells), a, b)
+    # Roots are the smallest member index, so ranking them numbers the components in order
+    is_root = roots == np.arange(len(cells))
+    rank = np.cumsum(is_root) - 1
+    return rank[roots], int(is_root.sum())
+
+
+def label_grid(grid, reach: int = DEFAULT_REACH) -> Tuple[np.ndarray, int]:
+    """
+    Labels the objects of a 2D array of 0/1 cells, see label_cells.
+
+    Args:
+    - grid (np.ndarray): 2D array of cells.
+    - reach (int): Connection distance.
+
+    Returns:
+    - Tuple[np.ndarray, int]: int32 array of the grid's shape, 0 for dead cells and 1..count for the
+        cells of each object, and the number of objects.
+    """
+    grid = np.asarray(grid)
+    cells = np.argwhere(grid == 1)
+    labels, count = label_cells(cells, reach)
+    out = np.zeros(grid.shape, dtype=np.int32)
+    out[cells[:, 0], cells[:, 1]] = labels + 1
+    return out, count
+
+
+def split_components(cells: np.ndarray, labels: np.ndarray, count: int) -> List[np.ndarray]:
+    """
+    Splits labeled cells into one array per component, keeping the order of the cells.
+
+    Args:
+    - cells (np.ndarray): (n, 2) array of (row, column) coordinates.
+    - labels (np.ndarray): (n,) array of labels in range(count).
+    - count (int): Number of components.
+
+    Returns:
+    - List[np.ndarray]: count arrays of (row, column) coordinates.
+    """
+    order = np.argsort(labels, kind='stable')
+    return np.split(cells[order], np.cumsum(np.bincount(labels, minlength=count))[:-1])
+
+
+class TrackedObject:
+    """
+    One object followed across generations by an ObjectTracker, with its own detector.
+
+    Attributes:
+    - id (int): Identifier, unique within the tracker.
+    - born (int): Tracker generation the object appeared in.
+    - cells (np.ndarray): (n, 2) array of the object's (row, column) coordinates in the current generation.
+    - detector (ShipDetector): Detector fed with the object's cells every generation.
+    """
+
+    def __init__(self, _id: int, born: int, cells: np.ndarray, detector: ShipDetector) -> None:
+        self.id = _id
+        self.born = born
+        self.cells = cells
+        self.detector = detector
+
+    @property
+    def population(self) -> int:
+        """Number of alive cells of the object."""
+        return len(self.cells)
+
+    @property
+    def classification(self) -> Optional[Dict]:
+        """The classification of the object's detector, None until it is proven."""
+        return self.detector.classification
+
+    def to_dict(self) -> Dict:
+        """
+        Summarizes the object as a JSON serializable dict.
+
+        Returns:
+        - Dict: id, born, population, origin (top-left corner of the bounding box) and, once
+            classified, status, period, displacement, speed and digest.
+        """
+        origin = self.cells.min(axis=0).tolist() if len(self.cells) else [0, 0]
+        result = {'id': self.id, 'born': self.born, 'population': self.population, 'origin': origin}
+        classification = self.classification
+        if classification is not None:
+            result.update({
+                'status': classification['status'],
+                'period': classification['period'],
+                'displacement': list(classification['displacement']),
+                'speed': list(classification['speed']),
+                'digest': classification['digest'],
+            })
+        return result
+
+
+class ObjectTracker:
+    """
+    Segments the board into objects every generation and classifies each object on its own.
+
+    ShipDetector sees the whole board as one pattern, so a ship leaving debris behind, or several
+    objects with different periods, never repeat as a whole. The tracker labels the live cells into
+    objects (see label_cells) and follows them across generations:
+
+    - Every cell of the new generation descends from the old cells within one row and column, so an
+      object's parents are found by looking its cells' neighborhoods up in a CellIndex of the
+      previous generation, one vectorized query for all objects.
+    - An object with exactly one parent, which has no other child, continues that parent's track and
+      its detector observes the object's cells. Objects that split, merged or appeared start new tracks.
+    - Once a track is classified its phases are known (ShipDetector.digests), so further generations
+      only check that the object is still in one of them. An object that leaves its cycle, e.g. by
+      hitting the board edge, starts a new track.
+
+    Each track therefore gets its own period, displacement and speed, and the cost per generation
+    grows with the population and the number of objects, not with the board area.
+
+    Attributes:
+    - grid: The grid engine (anything with get_live_cells()) or 2D array being observed.
+    - max_history (int): Number of past generations each object's detector compares against.
+    - reach (int): Connection distance used to segment objects, see label_cells.
+    - generation (int): Generation of the last observed state, the first observed state is generation 0.
+    - objects (Dict[int, TrackedObject]): The objects of the current generation by id.
+
+    Methods:
+    - update(): Observes the current generation of the grid.
+    - classified(): Summaries of the classified objects.
+    - ships(): Summaries of the objects classified as spaceships.
+    """
+
+    def __init__(self, grid, max_history: int = 7, reach: int = DEFAULT_REACH) -> None:
+        """
+        Initializes the tracker.
+
+        Args:
+        - grid: A grid engine (anything with get_live_cells()) or a 2D array of cells.
+        - max_history (int): Number of past generations each object's detector compares against.
+        - reach (int): Connection distance used to segment objects.
+        """
+        self.grid = grid
+        self.max_history = max_history
+        self.reach = reach
+        self.generation = -1
+        self.objects: Dict[int, TrackedObject] = {}
+        self._next_id = 0
+        self._index = CellIndex(np.empty((0, 2), dtype=np.int64), margin=1)
+        self._owners = np.empty(0, dtype=np.int64)  # Id of the object owning each cell of _index
+
+    def reset(self) -> None:
+        """
+        Forgets every object.
+        """
+        self.generation = -1
+        self.objects = {}
+        self._next_id = 0
+        self._index = CellIndex(np.empty((0, 2), dtype=np.int64), margin=1)
+        self._owners = np.empty(0, dtype=np.int64)
+
+    @property
+    def all_classified(self) -> bool:
+        """Whether every current object is classified (False when there is no object)."""
+        return bool(self.objects) and all(obj.classification is not None for obj in self.objects.values())
+
+    def _new_object(self, cells: np.ndarray) -> TrackedObject:
+        """Starts a track for cells and lets its detector observe them."""
+        obj = TrackedObject(self._next_id, self.generation, cells, ShipDetector(self.grid, self.max_history))
+        self._next_id += 1
+        obj.detector.observe(cells)
+        return obj
+
+    def _continue(self, obj: TrackedObject, cells: np.ndarray) -> TrackedObject:
+        """Moves a track to its cells in the new generation, starting a new track if it left its cycle."""
+        detector = obj.detector
+        if detector.is_classified and detector.digests:
+            if ShipDetector.canonical_hash(cells)[0] not in detector.digests:
+                return self._new_object(cells)
+            obj.cells = cells
+            detector.generation += 1
+        else:
+            obj.cells = cells
+            detector.observe(cells)
+        return obj
+
+    def update(self) -> Dict[int, TrackedObject]:
+        """
+        Observes the current generation: segments it, matches the objects to the previous generation
+        and advances the detector of every object.
+
+        Returns:
+        - Dict[int, TrackedObject]: The objects of the current generation by id.
+        """
+        self.generation += 1
+        cells = ShipDetector.live_cell_array(self.grid)
+        labels, count = label_cells(cells, self.reach)
+        components = split_components(cells, labels, count)
+
+        # Parents: the previous objects owning a cell in the 3x3 neighborhood of a cell of the component
+        children, parents = self._index.pairs(cells, [(0, 0)] + neighborhood_offsets(1))
+        stride = self._next_id + 1
+        links = np.unique(labels[children] * stride + self._owners[parents])
+        link_components, link_parents = links // stride, links % stride
+        parent_count = np.bincount(link_components, minlength=count)
+        unique_parent, child_count = np.unique(link_parents, return_counts=True)
+        only_child = dict(zip(unique_parent.tolist(), (child_count == 1).tolist()))
+        single_parent = np.full(count, -1, dtype=np.int64)
+        single_parent[link_components] = link_parents  # Only read where parent_count == 1
+
+        objects = {}
+        owners = np.empty(count, dtype=np.int64)
+        for label, component in enumerate(components):
+            parent_id = int(single_parent[label]) if parent_count[label] == 1 else -1
+            if parent_id >= 0 and only_child[parent_id]:
+                obj = self._continue(self.objects[parent_id], component)
+            else:
+                obj = self._new_object(component)
+            objects[obj.id] = obj
+            owners[label] = obj.id
+
+        self.objects = objects
+        self._index = CellIndex(cells, margin=1)
+        self._owners = owners[labels]
+        return objects
+
+    def classified(self) -> List[Dict]:
+        """
+        Summarizes every classified object of the current generation.
+
+        Returns:
+        - List[Dict]: See TrackedObject.to_dict, ordered by id.
+        """
+        return [obj.to_dict() for _, obj in sorted(self.objects.items()) if obj.classification is not None]
+
+    def ships(self) -> List[Dict]:
+        """
+        Summarizes the objects of the current generation classified as spaceships.
+
+        Returns:
+        - List[Dict]: See TrackedObject.to_dict, ordered by id.
+        """
+        return [summary for summary in self.classified() if summary['status'] == SPACESHIP]
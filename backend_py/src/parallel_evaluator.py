@@ -0,0 +1,298 @@
+import multiprocessing
+import multiprocessing.pool
+import multiprocessing.queues
+import os
+import queue
+import signal
+import time
+from multiprocessing.util import Finalize
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from src.batch_runner import BatchRunner, ship_to_dict
+from src.ship import Ship
+
+# Runner of the current worker process, created once by _init_worker
+_worker_runner: Optional[BatchRunner] = None
+# Queue the current worker process reports (chunk id, pid) on when it starts a chunk
+_worker_started: Optional[multiprocessing.queues.SimpleQueue] = None
+
+
+def _init_worker(settings: dict, started: multiprocessing.queues.SimpleQueue) -> None:
+    """
+    Creates the BatchRunner a worker process reuses for every chunk it evaluates.
+
+    Args:
+    - settings (dict): Keyword arguments for BatchRunner.
+    - started (SimpleQueue): Queue to report the chunks the worker starts on.
+    """
+    global _worker_runner, _worker_started
+    _worker_runner = BatchRunner(**settings)
+    _worker_started = started
+    # Release the runner's grid (e.g. its shared memory) when the worker exits normally
+    Finalize(None, _worker_runner.close, exitpriority=10)
+
+
+def _error_result(ship_data: dict, status: str, error: str) -> Dict:
+    """
+    Builds the result of a ship that could not be evaluated.
+
+    Args:
+    - ship_data (dict): The ship definition.
+    - status (str): 'error', 'crash' or 'timeout'.
+    - error (str): Description of what went wrong.
+
+    Returns:
+    - Dict: Result with the same identity keys as BatchRunner.run_ship.
+    """
+    return {
+        'id': ship_data.get('id'),
+        'name': ship_data.get('name'),
+        'designation': ship_data.get('designation'),
+        'status': status,
+        'error': error,
+    }
+
+
+def _evaluate_chunk(chunk_id: int, chunk: List[dict]) -> List[Dict]:
+    """
+    Evaluates a chunk of ship definitions inside a worker process.
+
+    Reports the chunk id and the worker's pid first, so the parent can tell which chunk a worker that
+    dies was running. Exceptions raised by one ship are turned into an 'error' result so the rest of
+    the chunk still runs.
+
+    Args:
+    - chunk_id (int): Id of the chunk, reported back with the pid.
+    - chunk (List[dict]): Ship definitions.
+
+    Returns:
+    - List[Dict]: One result per ship, in chunk order.
+    """
+    # SimpleQueue writes before put() returns, so the report is not lost if the worker dies right after
+    _worker_started.put((chunk_id, os.getpid()))
+    results = []
+    for ship_data in chunk:
+        try:
+            results.append(_worker_runner.run_ship(ship_data))
+        except Exception as e:
+            results.append(_error_result(ship_data, 'error', f"{type(e).__name__}: {e}"))
+    return results
+
+
+class ParallelEvaluator:
+    """
+    Evaluates independent ship candidates on a pool of worker processes, each with its own Game, Grid
+    and ShipDetector (see BatchRunner).
+
+    Candidates are sent to the workers in chunks and the results are yielded as soon as each chunk
+    finishes, so they arrive in completion order rather than input order.
+
+    A worker that crashes or hangs never completes its chunk. Every worker reports its pid when it
+    starts a chunk, and the evaluator checks twice a second which of those workers are still alive:
+    the chunk of a worker that died is split into single ships and resubmitted, and a single ship
+    whose worker dies is reported with a 'crash' result, without waiting for chunk_timeout. The pool
+    replaces the dead worker itself, so the other chunks keep running. chunk_timeout is only for
+    workers that hang: such a worker is killed and its chunk split or reported with a 'timeout'
+    result the same way. Exceptions raised while simulating a ship are reported as 'error' results.
+
+    Attributes:
+    - workers (int): Number of worker processes.
+    - chunk_size (int): Number of candidates sent to a worker at once.
+    - chunk_timeout (float): Seconds a chunk may run before its worker is considered hung.
+    - runner_settings (dict): Keyword arguments for the BatchRunner of every worker.
+
+    Methods:
+    - evaluate(candidates): Yields the result of every candidate as it finishes.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 16, chunk_timeout: float = 300.0,
+                 rows: int = 100, cols: int = 100, generations: int = 200, engine: str = "numpy",
+                 ship_time_limit: Optional[float] = None, rule: str = "B3/S23",
+                 track_objects: bool = False, boundary: Optional[str] = None, max_history: int = 7) -> None:
+        """
+        Initializes the evaluator.
+
+        Args:
+        - workers (Optional[int]): Number of worker processes, defaults to the number of CPUs.
+        - chunk_size (int): Number of candidates sent to a worker at once.
+        - chunk_timeout (float): Seconds a chunk may run before its worker is considered hung.
+        - rows (int): Number of rows of every board.
+        - cols (int): Number of columns of every board.
+        - generations (int): Maximum number of generations simulated per candidate.
+        - engine (str): Name of the grid engine to use (see src.engines.GRID_ENGINES).
+        - ship_time_limit (Optional[float]): Wall time limit per candidate, enforced inside the worker.
+        - rule (str): Life-like rule in B/S notation the candidates are simulated under.
+        - track_objects (bool): Also classify every object on the board on its own (see BatchRunner).
+        - boundary (Optional[str]): What lies beyond the edges of every board, see src.grid.BOUNDARIES.
+        - max_history (int): Number of past generations the detectors compare against, the longest
+            period that can be classified.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.chunk_timeout = chunk_timeout
+        self.runner_settings = {
+            'rows': rows,
+            'cols': cols,
+            'generations': generations,
+            'engine': engine,
+            'time_limit': ship_time_limit,
+            'rule': rule,
+            'track_objects': track_objects,
+            'boundary': boundary,
+            'max_history': max_history,
+        }
+
+    def _new_pool(self, started: multiprocessing.queues.SimpleQueue) -> multiprocessing.pool.Pool:
+        """Starts a pool of worker processes reporting the chunks they start on started."""
+        return multiprocessing.Pool(self.workers, initializer=_init_worker,
+                                    initargs=(self.runner_settings, started))
+
+    def _chunks(self, candidates: Iterable[Union[Ship, dict]]) -> Iterator[List[dict]]:
+        """Groups the candidates into chunks of ship definitions."""
+        ship_dicts = (ship_to_dict(c) if isinstance(c, Ship) else c for c in candidates)
+        while True:
+            chunk = list(islice(ship_dicts, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def evaluate(self, candidates: Iterable[Union[Ship, dict]]) -> Iterator[Dict]:
+        """
+        Evaluates every candidate on the worker pool.
+
+        Args:
+        - candidates (Iterable[Union[Ship, dict]]): Ships or ship definitions as returned by import_ships.
+
+        Returns:
+        - Iterator[Dict]: One result per candidate (see BatchRunner.run_ship), in completion order.
+        """
+        chunk_source = self._chunks(candidates)
+        retry: Deque[List[dict]] = deque()
+        finished: "queue.Queue[Tuple[int, int, object]]" = queue.Queue()
+        started = multiprocessing.SimpleQueue()
+        # chunk id -> (chunk, deadline, pid of the worker running it once it started)
+        running: Dict[int, Tuple[List[dict], float, Optional[int]]] = {}
+        next_id = 0
+        epoch = 0
+        source_done = False
+        # Whether the pool holds a task that will never finish, because its worker died or was killed
+        abandoned = False
+        pool = self._new_pool(started)
+
+        try:
+            while True:
+                # One chunk per worker, so a chunk's deadline starts when a worker picks it up
+                while len(running) < self.workers:
+                    if retry:
+                        chunk = retry.popleft()
+                    elif not source_done:
+                        chunk = next(chunk_source, None)
+                        if chunk is None:
+                            source_done = True
+                            continue
+                    else:
+                        break
+                    chunk_id, next_id = next_id, next_id + 1
+                    running[chunk_id] = (chunk, time.monotonic() + self.chunk_timeout, None)
+                    pool.apply_async(
+                        _evaluate_chunk, (chunk_id, chunk),
+                        callback=lambda res, cid=chunk_id, ep=epoch: finished.put((ep, cid, res)),
+                        error_callback=lambda exc, cid=chunk_id, ep=epoch: finished.put((ep, cid, exc))
+                    )
+
+                if not running:
+                    return
+
+                try:
+                    result_epoch, chunk_id, outcome = finished.get(timeout=0.5)
+                except queue.Empty:
+                    result_epoch, chunk_id, outcome = None, None, None
+
+                if result_epoch == epoch and chunk_id in running:
+                    chunk, _, _ = running.pop(chunk_id)
+                    if isinstance(outcome, BaseException):
+                        # The chunk could not be sent or returned (e.g. unpicklable); report every ship
+                        for ship_data in chunk:
+                            yield _error_result(ship_data, 'error', f"{type(outcome).__name__}: {outcome}")
+                    else:
+                        yield from outcome
+                    continue
+
+                while not started.empty():
+                    chunk_id, pid = started.get()
+                    if chunk_id in running:
+                        chunk, deadline, _ = running[chunk_id]
+                        running[chunk_id] = (chunk, deadline, pid)
+
+                # active_children() also reaps the workers that exited
+                alive = {process.pid for process in multiprocessing.active_children()}
+                now = time.monotonic()
+                lost = []
+                for cid, (chunk, deadline, pid) in list(running.items()):
+                    if pid is not None and pid not in alive:
+                        status, error = 'crash', f"The worker running this ship exited (pid {pid})."
+                    elif deadline < now:
+                        status, error = 'timeout', f"No result within {self.chunk_timeout}s, the worker hung."
+                        if pid is None:
+                            lost.append(cid)
+                            continue
+                        # The pool starts a new worker in its place. A killed worker cannot close its
+                        # runner; the resource tracker removes any shared memory it leaves behind
+                        # when the program exits.
+                        os.kill(pid, signal.SIGTERM)
+                    else:
+                        continue
+                    del running[cid]
+                    abandoned = True
+                    if len(chunk) > 1:
+                        retry.extend([ship_data] for ship_data in chunk)
+                    else:
+                        yield _error_result(chunk[0], status, error)
+
+                if not lost:
+                    continue
+
+                # A chunk timed out without any worker starting it, the pool itself is stuck: restart
+                # it and resubmit everything that was running
+                pool.terminate()
+                pool.join()
+                epoch += 1
+                for cid in list(running):
+                    chunk, _, _ = running.pop(cid)
+                    if cid not in lost:
+                        retry.appendleft(chunk)
+                    elif len(chunk) > 1:
+                        retry.extend([ship_data] for ship_data in chunk)
+                    else:
+                        yield _error_result(chunk[0], 'timeout',
+                                            f"No result within {self.chunk_timeout}s, no worker started it.")
+                pool = self._new_pool(started)
+                abandoned = False
+        finally:
+            if running or abandoned:
+                # Stopped early, or the pool waits for a task whose worker is gone and would never close
+                pool.terminate()
+            else:
+                pool.close()  # Lets the workers exit normally and close their runners
+            pool.join()
+
+
+def evaluate_parallel(candidates: Iterable[Union[Ship, dict]], workers: Optional[int] = None,
+                      chunk_size: int = 16, **kwargs) -> List[Dict]:
+    """
+    Evaluates every candidate on a pool of worker processes and collects the results.
+
+    Args:
+    - candidates (Iterable[Union[Ship, dict]]): Ships or ship definitions as returned by import_ships.
+    - workers (Optional[int]): Number of worker processes, defaults to the number of CPUs.
+    - chunk_size (int): Number of candidates sent to a worker at once.
+    - **kwargs: Further ParallelEvaluator arguments.
+
+    Returns:
+    - List[Dict]: One result per candidate, in completion order.
+    """
+    return list(ParallelEvaluator(workers, chunk_size, **kwargs).evaluate(candidates))
@@ -0,0 +1,192 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from src.game_loop import LoopObserver
+
+# Size in cells of the square tiles that are redrawn when only part of the board changed
+TILE_SIZE = 32
+
+
+class GridRenderer:
+    """
+    Draws a grid engine on a pygame surface with a handful of array operations per frame.
+
+    The board is copied into an 8-bit palette surface with one pixel per cell (cell value 0 or 1 is the
+    palette index), scaled by cell_size and blitted in one call, instead of one pygame.draw.rect call
+    per cell. When only a few cells changed since the previous frame, only the tiles of TILE_SIZE
+    cells that contain changes are scaled and blitted, and only their rectangles are sent to the
+    display.
+
+    Attributes:
+    - screen (pygame.Surface): The surface to draw on, usually the display surface.
+    - cell_size (int): Size of a cell in pixels.
+    - max_dirty_fraction (float): Fraction of dirty tiles above which the whole board is redrawn.
+
+    Methods:
+    - draw(grid): Draws the grid and returns the rectangles of the screen that changed.
+    - present(grid): Draws the grid and updates the display.
+    - invalidate(): Forces the next frame to redraw the whole board.
+    """
+
+    def __init__(self, screen: pygame.Surface, cell_size: int,
+                 alive_color: Tuple[int, int, int] = (0, 0, 0), dead_color: Tuple[int, int, int] = (255, 255, 255),
+                 max_dirty_fraction: float = 0.25) -> None:
+        """
+        Initializes the renderer.
+
+        Args:
+        - screen (pygame.Surface): The surface to draw on.
+        - cell_size (int): Size of a cell in pixels.
+        - alive_color (Tuple[int, int, int]): Color of alive cells.
+        - dead_color (Tuple[int, int, int]): Color of dead cells.
+        - max_dirty_fraction (float): Fraction of dirty tiles above which the whole board is redrawn.
+        """
+        self.screen = screen
+        self.cell_size = cell_size
+        self.alive_color = alive_color
+        self.dead_color = dead_color
+        self.max_dirty_fraction = max_dirty_fraction
+
+        self._shape = None  # (rows, cols) the buffers below were allocated for
+        self._cells = None  # One pixel per cell, palette indices
+        self._previous = None  # Cells of the last drawn frame
+        self._dirty = None  # Changed cells, padded to whole tiles
+        self._full_redraw = True
+
+    def invalidate(self) -> None:
+        """
+        Forces the next frame to redraw the whole board, e.g. after the screen was cleared.
+        """
+        self._full_redraw = True
+
+    def _allocate(self, rows: int, cols: int) -> None:
+        """Allocates the cell surface and the change buffers for a board size."""
+        self._shape = (rows, cols)
+        self._cells = pygame.Surface((cols, rows), depth=8)
+        self._cells.set_palette([self.dead_color, self.alive_color] + [self.dead_color] * 254)
+        self._previous = np.zeros((cols, rows), dtype=np.uint8)
+        tiles_x = -(-cols // TILE_SIZE)
+        tiles_y = -(-rows // TILE_SIZE)
+        self._dirty = np.zeros((tiles_x * TILE_SIZE, tiles_y * TILE_SIZE), dtype=bool)
+        self._full_redraw = True
+
+    @staticmethod
+    def cell_array(grid) -> np.ndarray:
+        """
+        Returns the cells of a grid engine as a 2D uint8 array of 0/1, without copying when the engine
+        keeps its cells in an array.
+
+        Args:
+        - grid (Grid): Any bounded grid engine.
+
+        Returns:
+        - np.ndarray: Array of shape (rows, cols).
+        """
+        if hasattr(grid, 'view'):
+            return grid.view()
+        if hasattr(grid, 'to_array'):
+            return grid.to_array()
+        return np.asarray(grid.grid_coordinates, dtype=np.uint8)
+
+    def draw(self, grid) -> List[pygame.Rect]:
+        """
+        Draws the grid on the screen.
+
+        Args:
+        - grid (Grid): Any bounded grid engine, or a 2D list / array of cells.
+
+        Returns:
+        - List[pygame.Rect]: The rectangles of the screen that changed, empty if nothing changed.
+        """
+        cells = self.cell_array(grid) if hasattr(grid, 'rows') else np.asarray(grid, dtype=np.uint8)
+        rows, cols = cells.shape
+        if self._shape != (rows, cols):
+            self._allocate(rows, cols)
+
+        # Surfaces are indexed (x, y), i.e. (column, row)
+        cells = cells.T
+        dirty = self._dirty[:cols, :rows]
+        np.not_equal(cells, self._previous, out=dirty)
+        tiles = self._dirty.reshape(self._dirty.shape[0] // TILE_SIZE, TILE_SIZE,
+                                    self._dirty.shape[1] // TILE_SIZE, TILE_SIZE).any(axis=(1, 3))
+        dirty_tiles = np.argwhere(tiles)
+        if not self._full_redraw and len(dirty_tiles) == 0:
+            return []
+
+        np.copyto(self._previous, cells)
+        pygame.surfarray.blit_array(self._cells, self._previous)
+
+        size = self.cell_size
+        if self._full_redraw or len(dirty_tiles) > self.max_dirty_fraction * tiles.size:
+            self._full_redraw = False
+            if size == 1:
+                return [self.screen.blit(self._cells, (0, 0))]
+            return [self.screen.blit(pygame.transform.scale(self._cells, (cols * size, rows * size)), (0, 0))]
+
+        changed = []
+        for tile_x, tile_y in dirty_tiles.tolist():
+            x, y = tile_x * TILE_SIZE, tile_y * TILE_SIZE
+            tile = self._cells.subsurface((x, y, min(TILE_SIZE, cols - x), min(TILE_SIZE, rows - y)))
+            if size != 1:
+                tile = pygame.transform.scale(tile, (tile.get_width() * size, tile.get_height() * size))
+            changed.append(self.screen.blit(tile, (x * size, y * size)))
+        return changed
+
+    def present(self, grid, rects: Optional[List[pygame.Rect]] = None) -> None:
+        """
+        Draws the grid and sends the changed part of the screen to the display.
+
+        Args:
+        - grid (Grid): Any bounded grid engine.
+        - rects (Optional[List[pygame.Rect]]): Additional rectangles to update (e.g. an overlay).
+        """
+        changed = self.draw(grid)
+        if rects:
+            changed.extend(rects)
+        if changed:
+            pygame.display.update(changed)
+
+
+class PygameView(LoopObserver):
+    """
+    A Pygame window showing the board of a GameLoop, drawn by a GridRenderer.
+
+    Importing this module imports pygame, nothing in the simulation core does.
+
+    Attributes:
+    - screen (pygame.Surface): The display surface.
+    - renderer (GridRenderer): Draws the board on the screen.
+    """
+
+    def __init__(self, window_size: Tuple[int, int], cell_size: int,
+                 caption: str = "Game of Life with Ship Movement") -> None:
+        """
+        Opens the window.
+
+        Args:
+        - window_size (Tuple[int, int]): Size of the window in pixels.
+        - cell_size (int): Size of a cell in pixels.
+        - caption (str): Title of the window.
+        """
+        pygame.init()
+        self.screen = pygame.display.set_mode(window_size)
+        pygame.display.set_caption(caption)
+        self.screen.fill((255, 255, 255))  # Fill the screen with white
+        self.renderer = GridRenderer(self.screen, cell_size)
+
+    def draw(self, grid) -> None:
+        """Draws the grid, only the regions that changed are sent to the display."""
+        self.renderer.present(grid)
+
+    def poll(self) -> bool:
+        """Processes pending Pygame events, returns False once the window is closed."""
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+        return True
+
+    def close(self) -> None:
+        """Quits Pygame."""
+        pygame.quit()
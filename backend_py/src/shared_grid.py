@@ -0,0 +1,395 @@
+import os
+import time
+import weakref
+from multiprocessing import resource_tracker, shared_memory
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.grid import BOUNDARY_DEAD, BOUNDARY_TORUS
+from src.numpy_grid import NumpyGrid
+from src.rules import Rule
+
+# Identifies a shared memory block laid out by SharedGrid
+MAGIC = 0x5352_4647_5249_4431  # "SRFGRID1"
+
+# Header fields, int64 each, in front of the two cell slots
+HEADER_FIELDS = ('magic', 'rows', 'cols', 'sequence',
+                 'generation_0', 'population_0', 'changed_0',
+                 'generation_1', 'population_1', 'changed_1')
+_MAGIC, _ROWS, _COLS, _SEQUENCE = range(4)
+_SLOT_FIELDS = 3  # generation, population, cells changed
+HEADER_BYTES = 8 * len(HEADER_FIELDS)
+
+
+def _slot_header(slot: int) -> int:
+    """Index of the first header field of a slot."""
+    return 4 + slot * _SLOT_FIELDS
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Attaches to an existing shared memory block without letting this process's resource tracker
+    unlink it at exit; the block belongs to the SharedGrid that created it.
+
+    Before Python 3.13 attaching always registers the block with the resource tracker, so the
+    registration is undone right away.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python >= 3.13
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+def _release(shm: shared_memory.SharedMemory, owner: int) -> None:
+    """
+    Closes and unlinks a block created by SharedGrid, in the process that created it only: a forked
+    child holding a copy of the grid must not remove the parent's block.
+
+    Called by SharedGrid.close or, when that was never called, once the grid is garbage collected or
+    the interpreter exits (see weakref.finalize).
+    """
+    if os.getpid() != owner:
+        return
+    try:
+        shm.close()
+    except BufferError:
+        pass  # Views of the board are still alive, the mapping goes with them
+    # A reader process sharing this process's resource tracker may have unregistered the block
+    # (see _attach), register it again so unlinking does not unregister an unknown name
+    resource_tracker.register(shm._name, "shared_memory")
+    shm.unlink()
+
+
+class SharedGrid(NumpyGrid):
+    """
+    NumpyGrid whose two cell buffers live in a multiprocessing.shared_memory block, so other processes
+    read every generation in place instead of receiving a pickled copy.
+
+    The block holds a small int64 header followed by two (rows, cols) uint8 slots. Published frames
+    alternate between the slots: frame f lives in slot f % 2, so the back buffer the next update
+    writes into is always the slot readers are not looking at. A seqlock sequence number in the
+    header orders writer and readers:
+
+    - Before writing frame f the writer sets sequence to 2f - 1 (odd), after it to 2f (even), so
+      sequence // 2 is always the latest complete frame.
+    - A reader of frame f may use slot f % 2 until the writer starts frame f + 2, i.e. as long as
+      sequence <= 2f + 2. Checking this after reading tells the reader whether what it read is
+      consistent (see SharedGridReader).
+
+    Every update publishes a frame, and so does every edit (set_cells, clear, assigning
+    grid_coordinates): the current cells are copied to the back slot, edited there and published,
+    so readers never see a half-edited generation. Writing into grid_coordinates in place bypasses
+    this and is only safe while no reader is attached.
+
+    Attributes:
+    - name (str): Name of the shared memory block, pass it to SharedGridReader.
+    - generation (int): Number of updates done.
+    - frame (int): Number of the latest published frame.
+
+    Methods:
+    - update(): Advances the board one generation and publishes it.
+    - close(): Releases the block, unlinking it so no new reader can attach.
+
+    The block is also released when the grid is garbage collected or the interpreter exits, but
+    close() it (or use the grid as a context manager) to free it at a known point.
+    """
+
+    # The block cannot be resized, so the board cannot expand
+    BOUNDARIES = (BOUNDARY_DEAD, BOUNDARY_TORUS)
+
+    def __init__(self, rows: int, cols: int, rule: Union[str, Rule] = "B3/S23", boundary: str = BOUNDARY_DEAD,
+                 name: Optional[str] = None) -> None:
+        """
+        Creates the shared memory block and an empty board in it.
+
+        Args:
+        - rows (int): Number of rows in the grid_coordinates.
+        - cols (int): Number of columns in the grid_coordinates.
+        - rule (Union[str, Rule]): Life-like rule in B/S notation, e.g. 'B3/S23' or 'B36/S23'.
+        - boundary (str): What lies beyond the edges: 'dead' or 'torus'.
+        - name (Optional[str]): Name of the block, a unique name is generated when None.
+
+        Raises:
+        - ValueError: If the boundary is not supported.
+        - FileExistsError: If a block with that name already exists.
+        """
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=HEADER_BYTES + 2 * rows * cols)
+        self._finalizer = weakref.finalize(self, _release, self._shm, os.getpid())
+        self._header = np.ndarray((len(HEADER_FIELDS),), dtype=np.int64, buffer=self._shm.buf)
+        self._header[:] = 0
+        self._header[[_MAGIC, _ROWS, _COLS]] = MAGIC, rows, cols
+        self.generation = 0
+        super().__init__(rows, cols, rule, boundary)
+
+    def _new_buffers(self) -> List[np.ndarray]:
+        """Maps the two board buffers onto the slots of the shared memory block."""
+        slots = np.ndarray((2, self.rows, self.cols), dtype=np.uint8, buffer=self._shm.buf, offset=HEADER_BYTES)
+        slots.fill(0)
+        return [slots[0], slots[1]]
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block."""
+        return self._shm.name
+
+    @property
+    def frame(self) -> int:
+        """Number of the latest published frame."""
+        return int(self._header[_SEQUENCE]) // 2
+
+    def _begin_frame(self) -> None:
+        """Marks the back slot as being written (odd sequence)."""
+        self._header[_SEQUENCE] += 1
+
+    def _end_frame(self) -> None:
+        """Records the front slot's metadata and publishes it (even sequence)."""
+        field = _slot_header(self._front)
+        self._header[field:field + _SLOT_FIELDS] = self.generation, self.population, self.cells_changed or 0
+        self._header[_SEQUENCE] += 1
+
+    def _edit(self) -> np.ndarray:
+        """Starts a frame that edits the current generation: copies it to the back slot and makes that the front."""
+        self._begin_frame()
+        np.copyto(self._buffers[1 - self._front], self._buffers[self._front])
+        self._front = 1 - self._front
+        return self._buffers[self._front]
+
+    @property
+    def grid_coordinates(self) -> np.ndarray:
+        """The current generation as a (rows, cols) uint8 array in shared memory."""
+        return self._buffers[self._front]
+
+    @grid_coordinates.setter
+    def grid_coordinates(self, value) -> None:
+        if self._header[_SEQUENCE] == 0 and not np.any(value):
+            return  # Initializing the already zeroed block, nothing to publish
+        np.copyto(self._edit(), value, casting="unsafe")
+        self._end_frame()
+
+    def update(self) -> None:
+        """
+        Updates the grid_coordinates based on the Game of Life rules and publishes the new generation.
+
+        Rules (self.rule, B3/S23 by default):
+        - A cell survives if its number of alive neighbors is in rule.survival.
+        - A dead cell becomes alive if its number of alive neighbors is in rule.birth.
+
+        Returns:
+        - None
+        """
+        self._begin_frame()
+        super().update()
+        self.generation += 1
+        self._end_frame()
+
+    def set_cells(self, cells: Iterable[Tuple[int, int]]) -> None:
+        """
+        Marks the given cells as alive and publishes the result, see Grid.set_cells.
+
+        Args:
+        - cells (Iterable[Tuple[int, int]]): Absolute (row, column) coordinates of the cells.
+        """
+        cells = self.to_indices(cells)
+        board = self._edit()
+        for r, c in cells:
+            board[r, c] = 1
+        self._end_frame()
+
+    def clear(self) -> None:
+        """
+        Clears the grid_coordinates (resets it to all dead cells) and publishes the empty board.
+
+        Returns:
+        - None
+        """
+        self._edit().fill(0)
+        self._end_frame()
+
+    def close(self) -> None:
+        """
+        Releases the shared memory block and unlinks it. Attached readers keep their mapping; the
+        grid cannot be used afterwards.
+
+        Returns:
+        - None
+        """
+        # The views must go before the mapping can be closed
+        self._buffers = None
+        self._header = None
+        self._finalizer()  # Runs _release once, later calls do nothing
+
+
+class SharedGridReader:
+    """
+    Read-only view of a SharedGrid from any process, e.g. a detector, a renderer or an API server.
+
+    It has the read side of the grid engine API (rows, cols, get_live_cells, population, view), so it
+    can be handed to ShipDetector, ObjectTracker or GridRenderer in place of the grid.
+
+    Attributes:
+    - name (str): Name of the shared memory block.
+    - rows (int): Number of rows of the board.
+    - cols (int): Number of columns of the board.
+
+    Methods:
+    - frame(): Zero-copy view of the latest frame, together with its number.
+    - is_valid(frame): Whether a frame returned by frame() has not been overwritten yet.
+    - read(out): Consistent copy of the latest frame.
+    - wait(after, timeout): Waits for a frame newer than after.
+    - get_live_cells(): The alive cells of the latest frame.
+    - close(): Detaches from the block.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Attaches to the block of a SharedGrid.
+
+        Args:
+        - name (str): Name of the block (SharedGrid.name).
+
+        Raises:
+        - FileNotFoundError: If no block has that name.
+        - ValueError: If the block was not created by a SharedGrid.
+        """
+        self._shm = _attach(name)
+        self._header = np.ndarray((len(HEADER_FIELDS),), dtype=np.int64, buffer=self._shm.buf)
+        if self._header[_MAGIC] != MAGIC:
+            self._shm.close()
+            raise ValueError(f"Shared memory block {name!r} does not hold a SharedGrid")
+        self.name = name
+        self.rows = int(self._header[_ROWS])
+        self.cols = int(self._header[_COLS])
+        self._slots = np.ndarray((2, self.rows, self.cols), dtype=np.uint8, buffer=self._shm.buf,
+                                 offset=HEADER_BYTES)
+        self._slots.flags.writeable = False
+
+    @property
+    def sequence(self) -> int:
+        """The writer's seqlock sequence number."""
+        return int(self._header[_SEQUENCE])
+
+    def frame(self) -> Tuple[int, np.ndarray]:
+        """
+        Returns the latest published frame without copying it.
+
+        The view stays valid until the writer starts the frame after next; check is_valid(frame) after
+        using it, or use read() for a copy that is always consistent.
+
+        Returns:
+        - Tuple[int, np.ndarray]: The frame number and a read-only (rows, cols) uint8 view of it.
+        """
+        frame = self.sequence // 2
+        return frame, self._slots[frame % 2]
+
+    def is_valid(self, frame: int) -> bool:
+        """
+        Checks that a frame has not been overwritten since frame() returned it.
+
+        Args:
+        - frame (int): The frame number returned by frame().
+
+        Returns:
+        - bool: True if everything read from the frame's view so far is consistent.
+        """
+        return self.sequence <= 2 * frame + 2
+
+    def metadata(self, frame: int) -> Tuple[int, int, int]:
+        """
+        Returns the generation, population and number of changed cells recorded for a frame.
+
+        Like the cells, the values are only consistent while is_valid(frame).
+
+        Args:
+        - frame (int): The frame number returned by frame().
+
+        Returns:
+        - Tuple[int, int, int]: Generation, population and cells changed by the update that produced it.
+        """
+        field = _slot_header(frame % 2)
+        generation, population, changed = self._header[field:field + _SLOT_FIELDS].tolist()
+        return generation, population, changed
+
+    def read(self, out: Optional[np.ndarray] = None) -> Tuple[int, np.ndarray]:
+        """
+        Copies the latest frame, retrying when the writer overwrote it during the copy.
+
+        Args:
+        - out (Optional[np.ndarray]): (rows, cols) uint8 array to copy into.
+
+        Returns:
+        - Tuple[int, np.ndarray]: The frame number and the copy.
+        """
+        if out is None:
+            out = np.empty((self.rows, self.cols), dtype=np.uint8)
+        while True:
+            frame, view = self.frame()
+            np.copyto(out, view)
+            if self.is_valid(frame):
+                return frame, out
+
+    def wait(self, after: int, timeout: Optional[float] = None, poll_interval: float = 0.001) -> Optional[int]:
+        """
+        Waits until a frame newer than after is published.
+
+        Args:
+        - after (int): The last frame the caller has seen.
+        - timeout (Optional[float]): Maximum seconds to wait, None waits forever.
+        - poll_interval (float): Seconds between checks.
+
+        Returns:
+        - Optional[int]: The newest frame number, None on timeout.
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            frame = self.sequence // 2
+            if frame > after:
+                return frame
+            if deadline is not None and time.perf_counter() > deadline:
+                return None
+            time.sleep(poll_interval)
+
+    def view(self) -> np.ndarray:
+        """
+        Returns a read-only view of the latest frame, see frame().
+
+        Returns:
+        - np.ndarray: Read-only (rows, cols) uint8 view.
+        """
+        return self.frame()[1]
+
+    @property
+    def generation(self) -> int:
+        """Generation of the latest frame."""
+        return self.metadata(self.sequence // 2)[0]
+
+    @property
+    def population(self) -> int:
+        """Number of alive cells of the latest frame."""
+        return self.metadata(self.sequence // 2)[1]
+
+    def get_live_cells(self) -> List[Tuple[int, int]]:
+        """
+        Returns the coordinates of all alive cells of the latest frame, ordered by row then column.
+
+        Returns:
+        - List[Tuple[int, int]]: The (row, column) coordinates of the alive cells.
+        """
+        while True:
+            frame, view = self.frame()
+            rows, cols = np.nonzero(view)
+            if self.is_valid(frame):
+                return list(zip(rows.tolist(), cols.tolist()))
+
+    def close(self) -> None:
+        """
+        Detaches from the block.
+
+        Returns:
+        - None
+        """
+        self._slots = None
+        self._header = None
+        self._shm.close()
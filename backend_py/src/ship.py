@@ -17,8 +17,8 @@ class Ship:
             self.direction = [list(row) for row in zip(*self.direction[::-1])]
         self.cells = []  # Reset the cells as the direction has changed
 
-    def place(self, grid: list):
-        """Places the ship on the grid at the current position."""
+    def compute_cells(self) -> list:
+        """Computes and returns the absolute cells occupied by the ship at its current position."""
         self.cells = []
         for r, row in enumerate(self.direction):
             for c, cell in enumerate(row):
@@ -27,10 +27,24 @@ class Ship:
                     #occupied_c = c + self.position[1]
                     self.cells.append((r + self.position[0], c + self.position[1]))
                     #print(f"Placing at ({occupied_r}, {occupied_c})")
+        return self.cells
+
+    def place(self, grid):
+        """
+        Places the ship on the grid at the current position.
+
+        On a grid engine the cells go through set_cells, so the engine's boundary decides what happens
+        to cells beyond its edges (dropped, wrapped or grown into); on a 2D list they are dropped.
+        """
+        self.compute_cells()
+        if hasattr(grid, 'set_cells'):
+            grid.set_cells(self.cells)
+            return
 
         # Mark the cells on the grid as alive
+        rows, cols = len(grid), len(grid[0]) if grid else 0
         for r, c in self.cells:
-            if 0 <= r < len(grid) and 0 <= c < len(grid[0]):
+            if 0 <= r < rows and 0 <= c < cols:
                 grid[r][c] = 1
 
     def get_cells(self):
@@ -1,91 +1,244 @@
-from typing import List, Dict, Tuple
+import hashlib
+from collections import deque
+from typing import List, Dict, Optional, Tuple
 import numpy as np
 
+from src.canonical import canonical_digest, ship_phases
+from src.grid import BOUNDARY_DEAD
+from src.rules import CONWAY
+
+# Classification statuses
+DIED_OUT = 'died_out'
+STILL_LIFE = 'still_life'
+OSCILLATOR = 'oscillator'
+SPACESHIP = 'spaceship'
+
 
 class ShipDetector:
-    #TODO : moving bolean output
-    #TODO : add detector if its completely the same, and stop checking cuz simulation is dead
-    #TODO : separate if one smaler part separated and is moving rest is stationary or just separate totaly in parts
+    """
+    Classifies a run by looking each generation up in a short history of translation invariant hashes.
+
+    The whole board is treated as one pattern, so a ship leaving debris behind is never classified;
+    src.object_tracker.ObjectTracker segments the board into objects and runs one detector per object.
+
+    Limits of the classification:
+    - Only the last max_history generations are remembered, so a pattern repeating with a longer
+      period is never classified. Raise max_history (the callers pass it through) to find longer
+      periods, at the cost of one more remembered hash per generation.
+    - Evolution is translation invariant on unbounded and torus boards, so the first repeat proves
+      the outcome. On a board with dead edges cells cannot be born beyond the edge, so a cycle is only
+      proof of a spaceship when no generation of it touched an edge; cycles that did are ignored.
+      Even then the ship will reach an edge eventually: the classification describes the pattern
+      in free space, not the end of the run on that board. Still lifes and oscillators repeat at the
+      same place on the same board, so they are proven either way.
+    """
 
-    # TODO : posible way to go, have a patern history where we store patterns, if its been repeating same couple paterns in a loop, its a nice moving ship, we dont need to check anymroe, same logic as ded simulation we can move on
     def __init__(self, grid: np.ndarray, max_history: int = 7):
         """
         Initializes the ShipDetector with the grid and an optional maximum history for grid states.
+
+        The grid can be a 2D array / list of cells or a grid engine (anything with get_live_cells()),
+        the latter keeps the cost per generation proportional to the population. max_history is the
+        longest period that can be detected.
         """
         self.grid = grid
-        self.past_states = []  # Stores past grid states for comparison
         self.max_history = max_history
-        self.patterns = {}  # Stores detected patterns and their repeat counts
+        self.generation = -1  # Generation of the last observed state, the first observed state is generation 0
+        self.edge_generation = None  # Last generation whose cells touched a dead edge of the board
+        self.history = deque()  # (generation, shape hash) of the last max_history generations, oldest first
+        self.seen = {}  # shape hash -> (generation, origin) of its latest occurrence within the history
+        self.patterns = {}  # Stores detected patterns (by canonical digest) and their repeat counts
+        self.digests = {}  # shape hash -> canonical digest, for every phase of the detected cycle
+        self.classification = None  # Set once the run is proven to have died, stabilised or to repeat
+
+    @property
+    def is_classified(self) -> bool:
+        """
+        Whether the run is classified, after which further generations cannot change the outcome.
+        """
+        return self.classification is not None
 
-    def detect_and_classify_ships(self) -> List[Dict]:
+    def reset(self) -> None:
+        """
+        Forgets the history and detected patterns.
         """
-        Detects moving ships in the current grid state by comparing it with past grid states.
+        self.generation = -1
+        self.edge_generation = None
+        self.history.clear()
+        self.seen.clear()
+        self.patterns = {}
+        self.digests = {}
+        self.classification = None
+
+    def detect_and_classify_ships(self, generation: Optional[int] = None) -> List[Dict]:
+        """
+        Detects moving ships in the current grid state by looking up its shape in the recent history.
         Identifies repeating patterns and waits for them to repeat at least twice.
+
+        Each generation is reduced to a translation invariant hash of its live cells, so a repeat is
+        found with one dictionary lookup, and the period and displacement (d_row, d_col) follow from
+        the generation and position of the previous occurrence. Repeats are counted per canonical
+        digest (see src.canonical), which is the same for every phase, rotation and reflection of a ship.
+
+        generation is the number of the observed generation, e.g. the caller's generation counter so
+        that the classification refers to the same generation; None counts one past the last observation.
+        """
+        return self.observe(self.live_cell_array(self.grid), generation)
+
+    def observe(self, cells: np.ndarray, generation: Optional[int] = None) -> List[Dict]:
+        """
+        Observes the next generation given as its live cells, see detect_and_classify_ships.
+
+        The cells must be an (n, 2) array of (row, column) ordered by row then column, as returned by
+        live_cell_array. This lets callers feed the detector a part of the board, such as one object.
         """
         moving_ships = []
+        self.generation = self.generation + 1 if generation is None else generation
+
+        shape_hash, origin = self.canonical_hash(cells)
+        if len(cells) and self.touches_edge(cells):
+            self.edge_generation = self.generation
+
+        # Step 1: Look the current shape up in the history to identify movement and repeating patterns
+        previous = self.seen.get(shape_hash)
+        if len(cells) == 0:
+            self.classify(DIED_OUT, 1, (0, 0))
+        elif previous is not None:
+            previous_generation, previous_origin = previous
+            period = self.generation - previous_generation
+            displacement = (origin[0] - previous_origin[0], origin[1] - previous_origin[1])
+            digest = self.digests.get(shape_hash)
+            if digest is None:
+                digest = self.digest_cycle(cells, period)
+            self.patterns[digest] = self.patterns.get(digest, 0) + 1
+
+            # The first repeat is proof: the same shape always evolves the same way from here on,
+            # unless a dead edge clipped the cycle of a moving pattern (see the class docstring)
+            if displacement != (0, 0):
+                if self.edge_generation is None or self.edge_generation < previous_generation:
+                    self.classify(SPACESHIP, period, displacement, digest)
+            else:
+                self.classify(STILL_LIFE if period == 1 else OSCILLATOR, period, displacement, digest)
+
+            # Only add the pattern if it has been repeated more than once
+            if self.patterns[digest] > 1:
+                relative = cells - np.asarray(origin, dtype=np.int64)
+                moving_ships.append({
+                    'pattern': tuple(map(tuple, relative.tolist())),
+                    'digest': digest,
+                    'repeated': self.patterns[digest],
+                    'period': period,
+                    'displacement': displacement,
+                })
+
+        # Step 2: Store the current shape for future lookups, forgetting the oldest one
+        self.seen[shape_hash] = (self.generation, origin)
+        self.history.append((self.generation, shape_hash))
+        if len(self.history) > self.max_history:
+            old_generation, old_hash = self.history.popleft()
+            if self.seen[old_hash][0] == old_generation:
+                del self.seen[old_hash]
 
-        # Step 1: Compare current grid with past states to identify movement and repeating patterns
-        for past_state in self.past_states:
-            _, pattern = self.compare_grids(past_state, self.grid)
+        return moving_ships
 
-            # If a repeating pattern is detected
-            if pattern:
-                # Convert the pattern to a tuple for hashing
-                pattern_tuple = tuple(pattern)
+    def classify(self, status: str, period: int, displacement: Tuple[int, int], digest: str = None) -> None:
+        """
+        Records the classification of the run, keeping the first one found.
 
-                # Increment the pattern count, or initialize it
-                if pattern_tuple in self.patterns:
-                    self.patterns[pattern_tuple] += 1
-                else:
-                    self.patterns[pattern_tuple] = 1
+        The speed is the displacement per generation, (d_row / period, d_col / period), and the digest
+        the canonical digest of the repeating pattern (None when the run died out).
+        """
+        if self.classification is None:
+            self.classification = {
+                'status': status,
+                'period': period,
+                'displacement': displacement,
+                'speed': (displacement[0] / period, displacement[1] / period),
+                'generation': self.generation,
+                'digest': digest,
+            }
+
+    def digest_cycle(self, cells: np.ndarray, period: int) -> str:
+        """
+        Computes the canonical digest of a repeating pattern and remembers it for the shape hash of
+        every phase, so later repeats of any phase are counted under the same digest without
+        recomputing it.
 
-                # Only add the pattern if it has been repeated more than once
-                if self.patterns[pattern_tuple] > 1:
-                    moving_ships.append({'pattern': pattern_tuple, 'repeated': self.patterns[pattern_tuple]})
-                    # Optional: Remove the pattern after it has been returned to avoid redundant results
+        The phases are simulated from the current cells under the rule of the grid (B3/S23 if it has none).
+        """
+        phases = ship_phases(cells, period, getattr(self.grid, 'rule', CONWAY))
+        digest = canonical_digest(phases)
+        for phase in phases:
+            self.digests[self.canonical_hash(phase)[0]] = digest
+        return digest
 
-        # Step 2: Store the current grid state for future comparisons
-        self.past_states.append(np.copy(self.grid))  # Ensure deep copy
+    def dead_edges(self) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Returns the first and last row and column of the board when it has dead edges, None when
+        the board is unbounded ('expand') or a torus.
+        """
+        grid = self.grid
+        boundary = getattr(grid, 'boundary', BOUNDARY_DEAD)  # Plain arrays and lists end in dead cells
+        if boundary != BOUNDARY_DEAD:
+            return None
+        if hasattr(grid, 'rows'):
+            top, left = getattr(grid, 'origin', (0, 0))
+            return top, left, top + grid.rows - 1, left + grid.cols - 1
+        rows = len(grid)
+        return 0, 0, rows - 1, (len(grid[0]) if rows else 0) - 1
+
+    def touches_edge(self, cells: np.ndarray) -> bool:
+        """
+        Whether alive cells lie on a dead edge of the board, where the cells they would give birth
+        to beyond the edge are lost.
+        """
+        edges = self.dead_edges()
+        if edges is None:
+            return False
+        top, left, bottom, right = edges
+        (min_row, min_col), (max_row, max_col) = cells.min(axis=0), cells.max(axis=0)
+        return min_row <= top or min_col <= left or max_row >= bottom or max_col >= right
+
+    @staticmethod
+    def live_cell_array(grid) -> np.ndarray:
+        """
+        Extracts live cells (value 1) as an (n, 2) array of (row, column), ordered by row then column.
+        """
+        if not isinstance(grid, np.ndarray) and hasattr(grid, 'get_live_cells'):
+            return np.array(grid.get_live_cells(), dtype=np.int64).reshape(-1, 2)
+        return np.argwhere(np.asarray(grid) == 1).astype(np.int64, copy=False)
 
-        # Limit the history of past states
-        if len(self.past_states) > self.max_history:
-            self.past_states.pop(0)
+    @staticmethod
+    def canonical_hash(cells: np.ndarray) -> Tuple[bytes, Tuple[int, int]]:
+        """
+        Hashes live cells relative to the top-left corner of their bounding box.
 
-        return moving_ships
+        Two generations get the same hash when one is a translation of the other.
+        Returns the hash and the bounding box corner (the origin).
+        """
+        if len(cells) == 0:
+            return hashlib.blake2b(b'', digest_size=16).digest(), (0, 0)
+        origin = cells.min(axis=0)
+        normalized = (cells - origin).astype(np.int32)
+        return hashlib.blake2b(normalized.tobytes(), digest_size=16).digest(), (int(origin[0]), int(origin[1]))
 
     def get_live_cells(self, grid: np.ndarray) -> List[Tuple[int, int]]:
         """
         Extracts live cells (value 1) from the grid.
         """
-        return [(r, c) for r in range(len(grid)) for c in range(len(grid[0])) if grid[r][c] == 1]
+        return list(map(tuple, self.live_cell_array(grid).tolist()))
 
     def compare_grids(self, grid_a: np.ndarray, grid_b: np.ndarray) -> Tuple[bool, List[Tuple[int, int]]]:
         """
         Compares two grids to detect movement of cells based on their relative positions.
         Also detects repeating patterns by comparing relative positions.
         """
-        # Extract live cells from both grids
-        live_cells_a = self.get_live_cells(grid_a)
-        live_cells_b = self.get_live_cells(grid_b)
-
-        # If number of live cells is different, definitely moved
-        if len(live_cells_a) != len(live_cells_b):
-            return False, []
-
-        # Find the reference cell in grid_a (for example, top-left-most cell)
-        ref_cell_a = live_cells_a[0]
-
-        # Calculate relative positions of live cells in grid_a based on the reference
-        rel_positions_a = [(r - ref_cell_a[0], c - ref_cell_a[1]) for (r, c) in live_cells_a]
-
-        # Find the reference cell in grid_b (top-left-most cell)
-        ref_cell_b = live_cells_b[0]
-
-        # Calculate relative positions of live cells in grid_b based on the reference
-        rel_positions_b = [(r - ref_cell_b[0], c - ref_cell_b[1]) for (r, c) in live_cells_b]
+        cells_a = self.live_cell_array(grid_a)
+        hash_a, _ = self.canonical_hash(cells_a)
+        hash_b, _ = self.canonical_hash(self.live_cell_array(grid_b))
 
-        # If relative positions match, there has been no movement (or the movement is consistent)
-        if sorted(rel_positions_a) == sorted(rel_positions_b):
-            return True, rel_positions_a  # Identified a repeating pattern
+        # If the translation invariant hashes match, there has been no movement (or the movement is consistent)
+        if len(cells_a) and hash_a == hash_b:
+            return True, list(map(tuple, (cells_a - cells_a[0]).tolist()))  # Identified a repeating pattern
 
         return False, []  # No movement or no repeating pattern
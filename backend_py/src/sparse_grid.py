@@ -0,0 +1,207 @@
+from collections import Counter
+from typing import Iterable, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from src.grid import BOUNDARY_DEAD, BOUNDARY_TORUS, Grid, NEIGHBOR_OFFSETS, check_boundary
+from src.rules import Rule, parse_rule
+
+
+class SparseGrid(Grid):
+    """
+    Grid engine that stores only the coordinates of alive cells.
+
+    Each generation touches only the alive cells and their neighbors, so the cost of update() and the
+    memory used scale with the population instead of the board area. When rows and cols are None, or
+    the boundary is 'expand', the board is unbounded and rows and cols (if given) only define the
+    window read back through grid_coordinates. Otherwise cells outside the board are dead, as in Grid,
+    or on a torus neighbor coordinates wrap around modulo rows and cols.
+
+    Attributes:
+    - rows (Optional[int]): Number of rows, or None for an unbounded board.
+    - cols (Optional[int]): Number of columns, or None for an unbounded board.
+    - live_cells (Set[Tuple[int, int]]): (row, column) coordinates of the alive cells.
+    - cells_changed (Optional[int]): Number of cells that changed in the last update (None before the first).
+
+    Methods:
+    - update(): Advances the board one generation, visiting only alive cells and their neighbors.
+    - changed_cells(): The cells the last update turned on and off.
+    - population: Number of alive cells.
+    - grid_coordinates: Dense 2D list view of a bounded board, built on request.
+    """
+
+    def __init__(self, rows: Optional[int] = None, cols: Optional[int] = None,
+                 rule: Union[str, Rule] = "B3/S23", boundary: str = BOUNDARY_DEAD) -> None:
+        """
+        Initializes an empty sparse grid.
+
+        Args:
+        - rows (Optional[int]): Number of rows, or None for an unbounded board.
+        - cols (Optional[int]): Number of columns, or None for an unbounded board.
+        - rule (Union[str, Rule]): Life-like rule in B/S notation, e.g. 'B3/S23' or 'B36/S23'.
+        - boundary (str): What lies beyond the edges of a board with rows and cols: 'dead', 'torus'
+            or 'expand' (unbounded).
+
+        Raises:
+        - ValueError: If the rule has B0, which a sparse board cannot represent, or the boundary is
+            'torus' without rows and cols.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.rule = parse_rule(rule)
+        self.boundary = check_boundary(boundary, self.BOUNDARIES, type(self).__name__)
+        self.origin = (0, 0)
+        if self.rule.births_from_nothing:
+            raise ValueError(f"{type(self).__name__} cannot run B0 rules such as {self.rule}, "
+                             "empty space would come alive everywhere; use a dense engine instead.")
+        if self.boundary == BOUNDARY_TORUS and (rows is None or cols is None):
+            raise ValueError("A torus needs rows and cols.")
+        self.live_cells = self.initialize()
+        self.cells_changed = None
+        # Cells the last update turned on and off, None once the board was edited after it
+        self._changes: Optional[Tuple[Set[Tuple[int, int]], Set[Tuple[int, int]]]] = None
+
+    @property
+    def bounded(self) -> bool:
+        """Whether the board has a fixed size with dead cells beyond its edges."""
+        return self.rows is not None and self.cols is not None and self.boundary == BOUNDARY_DEAD
+
+    @property
+    def population(self) -> int:
+        """Number of cells in the live cell set."""
+        return len(self.live_cells)
+
+    @property
+    def grid_coordinates(self) -> List[List[int]]:
+        """
+        Builds a dense 2D list of the board (0 = dead, 1 = alive).
+
+        This allocates rows x cols cells and is meant for small boards and compatibility with code
+        that expects Grid.grid_coordinates; use live_cells for large boards.
+
+        Raises:
+        - ValueError: If rows or cols is None.
+        """
+        if self.rows is None or self.cols is None:
+            raise ValueError("An unbounded SparseGrid has no dense grid_coordinates, use live_cells instead.")
+        dense = [[0] * self.cols for _ in range(self.rows)]
+        for r, c in self.live_cells:
+            if 0 <= r < self.rows and 0 <= c < self.cols:
+                dense[r][c] = 1
+        return dense
+
+    def initialize(self) -> Set[Tuple[int, int]]:
+        """
+        Initializes the board with no alive cells.
+
+        Returns:
+        - Set[Tuple[int, int]]: An empty set of alive cells.
+        """
+        return set()
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        """
+        Checks whether a cell lies on the board.
+
+        Args:
+        - row (int): Row index of the cell.
+        - col (int): Column index of the cell.
+
+        Returns:
+        - bool: True if the cell is on the board (always True for an unbounded board).
+        """
+        return not self.bounded or (0 <= row < self.rows and 0 <= col < self.cols)
+
+    def update(self) -> None:
+        """
+        Advances the board one generation, counting neighbors around the alive cells only.
+
+        Rules (self.rule, B3/S23 by default):
+        - A cell survives if its number of alive neighbors is in rule.survival.
+        - A dead cell becomes alive if its number of alive neighbors is in rule.birth.
+
+        Returns:
+        - None
+        """
+        live = self.live_cells
+        # Every alive cell adds one to each of its neighbors; cells never reached have 0 neighbors
+        if self.boundary == BOUNDARY_TORUS:
+            rows, cols = self.rows, self.cols
+            counts = Counter(((r + dr) % rows, (c + dc) % cols) for r, c in live for dr, dc in NEIGHBOR_OFFSETS)
+        else:
+            counts = Counter((r + dr, c + dc) for r, c in live for dr, dc in NEIGHBOR_OFFSETS)
+
+        next_state = self.rule.rows  # next_state[cell][alive_neighbors]
+        new_cells = {cell for cell, n in counts.items() if next_state[cell in live][n]}
+        if 0 in self.rule.survival:
+            # Isolated cells are not in counts
+            new_cells.update(cell for cell in live if cell not in counts)
+        if self.bounded:
+            new_cells = {(r, c) for r, c in new_cells if 0 <= r < self.rows and 0 <= c < self.cols}
+
+        born, died = new_cells - live, live - new_cells
+        self.cells_changed = len(born) + len(died)
+        self._changes = (born, died)
+        self.live_cells = new_cells
+
+    def changed_cells(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Returns the cells the last update turned on and off, kept by update() so that nothing has to be
+        compared again.
+
+        Returns:
+        - Optional[Tuple[np.ndarray, np.ndarray]]: (n, 2) int64 coordinates of the cells born and of the
+            cells died, in no particular order; None before the first update or when the board was edited
+            (set_cells, clear) since the last one.
+        """
+        if self._changes is None:
+            return None
+        return tuple(np.array(list(cells), dtype=np.int64).reshape(-1, 2) for cells in self._changes)
+
+    def count_alive_neighbors(self, row: int, col: int) -> int:
+        """
+        Counts the neighbors of a cell that are in the live cell set.
+
+        Args:
+        - row (int): Row index of the cell.
+        - col (int): Column index of the cell.
+
+        Returns:
+        - int: The number of alive neighbors.
+        """
+        if self.boundary == BOUNDARY_TORUS:
+            return sum(((row + dr) % self.rows, (col + dc) % self.cols) in self.live_cells
+                       for dr, dc in NEIGHBOR_OFFSETS)
+        return sum((row + dr, col + dc) in self.live_cells for dr, dc in NEIGHBOR_OFFSETS)
+
+    def set_cells(self, cells: Iterable[Tuple[int, int]]) -> None:
+        """
+        Marks the given cells as alive, ignoring cells outside a bounded board or wrapping them on a torus.
+
+        Args:
+        - cells (Iterable[Tuple[int, int]]): Absolute (row, column) coordinates of the cells.
+        """
+        if self.boundary == BOUNDARY_TORUS:
+            self.live_cells.update((r % self.rows, c % self.cols) for r, c in cells)
+        else:
+            self.live_cells.update(cell for cell in cells if self.in_bounds(*cell))
+        self._changes = None
+
+    def get_live_cells(self) -> List[Tuple[int, int]]:
+        """
+        Returns the live cell set sorted by row then column.
+
+        Returns:
+        - List[Tuple[int, int]]: The (row, column) coordinates of the alive cells.
+        """
+        return sorted(self.live_cells)
+
+    def clear(self) -> None:
+        """
+        Clears the board (removes all alive cells).
+
+        Returns:
+        - None
+        """
+        self.live_cells = self.initialize()
+        self._changes = None
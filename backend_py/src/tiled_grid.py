@@ -0,0 +1,251 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.grid import BOUNDARY_DEAD, BOUNDARY_TORUS
+from src.numpy_grid import NumpyGrid, apply_rule, count_neighbors
+from src.rules import Rule
+
+# Side of the square tiles in cells: a tile with its halo, counts and masks stays within the L2 cache
+DEFAULT_TILE_SIZE = 256
+
+
+class TiledGrid(NumpyGrid):
+    """
+    Grid engine that splits one large board into square tiles and steps them in parallel on a thread pool.
+
+    The board is stored with a one-cell border (dead, or a copy of the opposite edges on a torus), so
+    every tile reads its cells plus a one-cell halo as a plain slice of the board, with no special case
+    at the edges. Each tile is stepped with the NumPy kernels of NumpyGrid into per-thread scratch
+    buffers; the ufunc loops release the GIL, so tiles run concurrently on all cores.
+
+    A tile whose 3x3 block of tiles did not change in the last generation cannot change in the next
+    one, and the back buffer already holds its cells, so it is skipped entirely. Empty space and still
+    lifes therefore cost nothing, and the work per generation follows the active part of the pattern.
+
+    Writing to grid_coordinates directly bypasses this bookkeeping: call invalidate() afterwards, as
+    set_cells() and clear() do.
+
+    Attributes:
+    - tile_size (int): Side of the tiles in cells.
+    - workers (int): Number of threads stepping tiles, 1 steps them on the calling thread.
+    - active_tiles (int): Number of tiles the next update will step.
+
+    Methods:
+    - update(): Advances the board one generation, stepping the active tiles in parallel.
+    - invalidate(): Marks every tile as active.
+    - changed_cells(): The cells the last update turned on and off, compared in the tiles that changed only.
+    - close(): Shuts the thread pool down.
+    """
+
+    # The tile layout is fixed at construction, so the board cannot expand
+    BOUNDARIES = (BOUNDARY_DEAD, BOUNDARY_TORUS)
+
+    def __init__(self, rows: int, cols: int, rule: Union[str, Rule] = "B3/S23", boundary: str = BOUNDARY_DEAD,
+                 tile_size: int = DEFAULT_TILE_SIZE, workers: Optional[int] = None) -> None:
+        """
+        Initializes an empty bordered board split into tiles. The thread pool is started by the first
+        update with more than one active tile.
+
+        Args:
+        - rows (int): Number of rows in the grid_coordinates.
+        - cols (int): Number of columns in the grid_coordinates.
+        - rule (Union[str, Rule]): Life-like rule in B/S notation, e.g. 'B3/S23' or 'B36/S23'.
+        - boundary (str): What lies beyond the edges: 'dead' or 'torus'.
+        - tile_size (int): Side of the tiles in cells.
+        - workers (Optional[int]): Number of threads, defaults to the number of CPUs.
+
+        Raises:
+        - ValueError: If the boundary is not supported or tile_size is below 1.
+        """
+        if tile_size < 1:
+            raise ValueError("tile_size must be at least 1")
+        self.tile_size = tile_size
+        self.workers = workers or os.cpu_count() or 1
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._local = threading.local()
+        super().__init__(rows, cols, rule, boundary)
+
+    def _allocate(self) -> None:
+        """Allocates the bordered board buffers and the per-tile bookkeeping."""
+        rows, cols, size = self.rows, self.cols, self.tile_size
+        self._buffers = [np.zeros((rows + 2, cols + 2), dtype=np.uint8) for _ in range(2)]
+        self._front = 0
+        self._tiles = [(r, c, min(r + size, rows), min(c + size, cols))
+                       for r in range(0, rows, size) for c in range(0, cols, size)]
+        self._tile_shape = (-(-rows // size), -(-cols // size))
+        self._tile_changed = np.zeros(self._tile_shape, dtype=np.int64)
+        self._active = np.ones(self._tile_shape, dtype=bool)
+        # Whether the back buffer holds the generation before the last update, i.e. nothing was edited since
+        self._changes_known = False
+
+    @property
+    def grid_coordinates(self) -> np.ndarray:
+        """The current generation as a writable (rows, cols) uint8 view, without the border."""
+        return self._buffers[self._front][1:-1, 1:-1]
+
+    @grid_coordinates.setter
+    def grid_coordinates(self, value) -> None:
+        np.copyto(self._buffers[self._front][1:-1, 1:-1], value, casting="unsafe")
+        self.invalidate()
+
+    @property
+    def active_tiles(self) -> int:
+        """Number of tiles the next update will step."""
+        return int(np.count_nonzero(self._active))
+
+    def invalidate(self) -> None:
+        """
+        Marks every tile as active, so the next update steps the whole board.
+
+        Returns:
+        - None
+        """
+        self._active = np.ones(self._tile_shape, dtype=bool)
+        self._changes_known = False
+
+    def _scratch_buffers(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the counts, row sum and mask buffers of the calling thread, allocated on first use."""
+        local = self._local
+        if getattr(local, 'size', None) != self.tile_size:
+            shape = (self.tile_size + 2, self.tile_size + 2)
+            local.counts = np.empty(shape, dtype=np.uint8)
+            local.scratch = np.empty(shape, dtype=np.uint8)
+            local.masks = np.empty((3, self.tile_size, self.tile_size), dtype=bool)
+            local.size = self.tile_size
+        return local.counts, local.scratch, local.masks
+
+    def _step_tile(self, tile: Tuple[int, int, int, int]) -> int:
+        """
+        Steps one tile from the front into the back buffer.
+
+        Args:
+        - tile (Tuple[int, int, int, int]): First row, first column, end row and end column of the tile.
+
+        Returns:
+        - int: The number of cells of the tile that changed.
+        """
+        r0, c0, r1, c1 = tile
+        height, width = r1 - r0, c1 - c0
+        counts, scratch, masks = self._scratch_buffers()
+        # In the bordered buffers the tile starts at (r0 + 1, c0 + 1) and its halo at (r0, c0)
+        block = self._buffers[self._front][r0:r1 + 2, c0:c1 + 2]
+        neighbors = count_neighbors(block, out=counts[:height + 2, :width + 2],
+                                    scratch=scratch[:height + 2, :width + 2])[1:-1, 1:-1]
+        cells = block[1:-1, 1:-1]
+        new_cells = self._buffers[1 - self._front][r0 + 1:r1 + 1, c0 + 1:c1 + 1]
+        masks = masks[:, :height, :width]
+        apply_rule(self.rule, cells, neighbors, out=new_cells, scratch=masks)
+        np.not_equal(new_cells, cells, out=masks[0])
+        return int(np.count_nonzero(masks[0]))
+
+    def _fill_border(self) -> None:
+        """Copies the opposite edges into the border of the front buffer on a torus (it stays dead otherwise)."""
+        if self.boundary == BOUNDARY_TORUS:
+            board = self._buffers[self._front]
+            board[0, 1:-1] = board[-2, 1:-1]
+            board[-1, 1:-1] = board[1, 1:-1]
+            board[:, 0] = board[:, -2]
+            board[:, -1] = board[:, 1]
+
+    def _next_active(self) -> np.ndarray:
+        """Marks the tiles next to (or on) a tile that changed in the last update as active."""
+        changed = self._tile_changed > 0
+        mode = 'wrap' if self.boundary == BOUNDARY_TORUS else 'constant'
+        padded = np.pad(changed, 1, mode=mode)
+        active = np.zeros_like(changed)
+        rows, cols = changed.shape
+        for dr in range(3):
+            for dc in range(3):
+                active |= padded[dr:dr + rows, dc:dc + cols]
+        return active
+
+    def update(self) -> None:
+        """
+        Updates the grid_coordinates based on the Game of Life rules, stepping the active tiles in parallel.
+
+        Rules (self.rule, B3/S23 by default):
+        - A cell survives if its number of alive neighbors is in rule.survival.
+        - A dead cell becomes alive if its number of alive neighbors is in rule.birth.
+
+        Returns:
+        - None
+        """
+        self._fill_border()
+        indices = np.flatnonzero(self._active.ravel())
+        tiles = [self._tiles[i] for i in indices.tolist()]
+        if self.workers > 1 and len(tiles) > 1:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="tiled-grid")
+            changed = list(self._pool.map(self._step_tile, tiles))
+        else:
+            changed = [self._step_tile(tile) for tile in tiles]
+
+        self._tile_changed.fill(0)
+        self._tile_changed.ravel()[indices] = changed
+        self.cells_changed = int(self._tile_changed.sum())
+        self._front = 1 - self._front
+        self._active = self._next_active()
+        self._changes_known = True
+
+    def changed_cells(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Returns the cells the last update turned on and off. Only the tiles that changed are compared with
+        the back buffer, which still holds the previous generation, so the cost follows the active part of
+        the pattern rather than the board.
+
+        Returns:
+        - Optional[Tuple[np.ndarray, np.ndarray]]: (n, 2) int64 coordinates of the cells born and of the
+            cells died, in no particular order; None before the first update or when the board was edited
+            (set_cells, clear, grid_coordinates, invalidate) since the last one.
+        """
+        if not self._changes_known:
+            return None
+        board = self.grid_coordinates
+        previous = self._buffers[1 - self._front][1:-1, 1:-1]
+        born, died = [np.zeros((0, 2), dtype=np.int64)], [np.zeros((0, 2), dtype=np.int64)]
+        for index in np.flatnonzero(self._tile_changed.ravel()).tolist():
+            r0, c0, r1, c1 = self._tiles[index]
+            tile = board[r0:r1, c0:c1]
+            cells = np.argwhere(tile != previous[r0:r1, c0:c1])
+            alive = tile[cells[:, 0], cells[:, 1]] != 0
+            cells += np.array([r0, c0], dtype=np.int64)
+            born.append(cells[alive])
+            died.append(cells[~alive])
+        return np.concatenate(born), np.concatenate(died)
+
+    def set_cells(self, cells: Iterable[Tuple[int, int]]) -> None:
+        """
+        Marks the given cells as alive and every tile as active, so the next update steps the whole board.
+
+        Args:
+        - cells (Iterable[Tuple[int, int]]): Absolute (row, column) coordinates of the cells.
+        """
+        super().set_cells(cells)
+        self.invalidate()
+
+    def clear(self) -> None:
+        """
+        Zeroes both bordered buffers, so that tiles the next updates skip stay dead, and marks every tile
+        as active.
+
+        Returns:
+        - None
+        """
+        for board in self._buffers:
+            board.fill(0)
+        self.invalidate()
+
+    def close(self) -> None:
+        """
+        Shuts the thread pool down, a later update starts a new one.
+
+        Returns:
+        - None
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
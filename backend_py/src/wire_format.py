@@ -0,0 +1,279 @@
+import struct
+import zlib
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from src.generation_stream import DELTA, KEYFRAME, cell_array, cell_keys
+
+# Media type of one binary frame, and of a stream of them each prefixed with its length (uint32)
+MEDIA_TYPE = 'application/x-life-frame'
+STREAM_MEDIA_TYPE = 'application/x-life-frame-stream'
+
+MAGIC = b'LF'
+VERSION = 1
+KINDS = (KEYFRAME, DELTA)
+
+# Frame header, little-endian: magic, version, kind, flags, padding, seq, generation, rows, cols (0 = unbounded)
+HEADER = struct.Struct('<2sBBBxqqII')
+FLAG_ZLIB = 1
+
+# Cell section: encoding, count, top, left, height, width, byte length of the data that follows
+SECTION = struct.Struct('<BIqqIII')
+SECTION_VARINT = 0
+SECTION_BITMAP = 1
+
+LENGTH = struct.Struct('<I')
+
+
+def encode_varints(values: np.ndarray) -> np.ndarray:
+    """
+    Encodes non-negative integers as LEB128 varints (7 bits per byte, high bit set on all but the
+    last byte of a value), in a few array passes rather than one Python step per value.
+
+    Args:
+    - values (np.ndarray): The integers, below 2**64.
+
+    Returns:
+    - np.ndarray: The encoded uint8 bytes.
+    """
+    values = np.asarray(values, dtype=np.uint64)
+    lengths = np.ones(len(values), dtype=np.int64)
+    rest = values >> np.uint64(7)
+    while rest.any():
+        lengths += rest > 0
+        rest >>= np.uint64(7)
+    out = np.empty(int(lengths.sum()), dtype=np.uint8)
+    starts = np.cumsum(lengths) - lengths
+    for k in range(int(lengths.max(initial=0))):
+        has = lengths > k
+        byte = (values[has] >> np.uint64(7 * k)) & np.uint64(0x7F)
+        out[starts[has] + k] = byte | np.where(lengths[has] > k + 1, np.uint64(0x80), np.uint64(0))
+    return out
+
+
+def decode_varints(data: np.ndarray) -> np.ndarray:
+    """
+    Decodes LEB128 varints written by encode_varints.
+
+    Args:
+    - data (np.ndarray): The uint8 bytes.
+
+    Returns:
+    - np.ndarray: The uint64 integers.
+    """
+    data = np.asarray(data, dtype=np.uint8)
+    if len(data) == 0:
+        return np.zeros(0, dtype=np.uint64)
+    ends = np.flatnonzero(data < 0x80)
+    starts = np.concatenate([[0], ends[:-1] + 1])
+    shifts = (np.arange(len(data)) - np.repeat(starts, ends - starts + 1)) * 7
+    parts = (data & 0x7F).astype(np.uint64) << shifts.astype(np.uint64)
+    return np.add.reduceat(parts, starts)
+
+
+def _varint_cells(cells: np.ndarray, top: int, left: int) -> np.ndarray:
+    """
+    Encodes cells ordered by row, then column, as two varints each: the number of rows down from the
+    previous cell, then the column from the left edge on a new row, or the number of cells skipped
+    since the previous cell on the same row. Clustered cells take two or three bytes each.
+    """
+    rows, cols = cells[:, 0] - top, cells[:, 1] - left
+    row_steps = np.diff(rows, prepend=0)
+    new_row = row_steps > 0
+    new_row[0] = True
+    col_steps = np.where(new_row, cols, cols - np.roll(cols, 1) - 1)
+    return encode_varints(np.stack([row_steps, col_steps], axis=1).ravel())
+
+
+def _decode_varint_cells(data: np.ndarray, top: int, left: int) -> np.ndarray:
+    """Decodes cells written by _varint_cells."""
+    values = decode_varints(data).astype(np.int64).reshape(-1, 2)
+    row_steps, col_steps = values[:, 0], values[:, 1]
+    new_row = row_steps > 0
+    new_row[0] = True
+    # Columns accumulate within a row and restart from the left edge on a new one
+    steps = np.where(new_row, col_steps, col_steps + 1)
+    totals = np.cumsum(steps)
+    starts = np.flatnonzero(new_row)
+    cols = totals - (totals[starts] - steps[starts])[np.cumsum(new_row) - 1]
+    return np.stack([top + np.cumsum(row_steps), left + cols], axis=1)
+
+
+def _section(encoding: int, count: int, top: int, left: int, height: int, width: int, data: np.ndarray) -> bytes:
+    """Packs a cell section header and its data."""
+    return SECTION.pack(encoding, count, top, left, height, width, len(data)) + data.tobytes()
+
+
+def encode_bitmap(board: np.ndarray, top: int = 0, left: int = 0) -> bytes:
+    """
+    Encodes a dense board as a cell section of one bit per cell, straight from its buffer.
+
+    Args:
+    - board (np.ndarray): (height, width) array of cells, 0 = dead.
+    - top, left (int): Coordinates of the first cell of the board.
+
+    Returns:
+    - bytes: The section, the bits row by row, most significant bit first.
+    """
+    height, width = board.shape
+    bits = np.packbits(board.ravel() != 0)
+    return _section(SECTION_BITMAP, int(np.count_nonzero(board)), top, left, height, width, bits)
+
+
+def encode_cells(cells: np.ndarray) -> bytes:
+    """
+    Encodes cells as a section, as varints or as a bitmap of their bounding box, whichever is smaller.
+
+    Args:
+    - cells (np.ndarray): (n, 2) array of (row, column) coordinates.
+
+    Returns:
+    - bytes: The section.
+    """
+    cells = np.asarray(cells, dtype=np.int64).reshape(-1, 2)
+    if len(cells) == 0:
+        return _section(SECTION_VARINT, 0, 0, 0, 0, 0, np.zeros(0, dtype=np.uint8))
+    keys = cell_keys(cells)
+    if np.any(keys[1:] < keys[:-1]):
+        cells = cells[np.argsort(keys, kind='stable')]
+    (top, left), (bottom, right) = cells.min(axis=0), cells.max(axis=0)
+    height, width = int(bottom - top + 1), int(right - left + 1)
+    varints = _varint_cells(cells, top, left)
+    if height * width >= 8 * len(varints):
+        return _section(SECTION_VARINT, len(cells), int(top), int(left), height, width, varints)
+    board = np.zeros((height, width), dtype=bool)
+    board[cells[:, 0] - top, cells[:, 1] - left] = True
+    return encode_bitmap(board, int(top), int(left))
+
+
+def decode_section(data: memoryview, offset: int = 0) -> Tuple[np.ndarray, int]:
+    """
+    Decodes a cell section.
+
+    Args:
+    - data (memoryview): The buffer holding the section.
+    - offset (int): Position of the section in data.
+
+    Returns:
+    - Tuple[np.ndarray, int]: (n, 2) coordinates of the cells ordered by row, then column, and the
+        position after the section.
+    """
+    encoding, count, top, left, height, width, length = SECTION.unpack_from(data, offset)
+    offset += SECTION.size
+    payload = np.frombuffer(data, dtype=np.uint8, count=length, offset=offset)
+    if count == 0:
+        cells = np.zeros((0, 2), dtype=np.int64)
+    elif encoding == SECTION_BITMAP:
+        board = np.unpackbits(payload, count=height * width).reshape(height, width)
+        cells = np.argwhere(board) + np.array([top, left], dtype=np.int64)
+    else:
+        cells = _decode_varint_cells(payload, top, left)
+    return cells, offset + length
+
+
+def _frame(kind: str, seq: int, generation: int, rows: Optional[int], cols: Optional[int], body: bytes,
+           compress: bool) -> bytes:
+    """Prefixes the sections of a frame with its header, compressing them with zlib when that helps."""
+    flags = 0
+    if compress:
+        packed = zlib.compress(body, 1)
+        if len(packed) < len(body):
+            body, flags = packed, FLAG_ZLIB
+    return HEADER.pack(MAGIC, VERSION, KINDS.index(kind), flags, seq, generation, rows or 0, cols or 0) + body
+
+
+def encode_message(message: Dict, compress: bool = False) -> bytes:
+    """
+    Encodes a GenerationStream message as a binary frame.
+
+    A frame is a header (see HEADER) followed by cell sections (see SECTION): one with the alive cells
+    for a keyframe, two with the cells born and the cells died for a delta. Each section holds
+    varint coordinate steps for sparse cells or a bitmap of their bounding box for dense ones.
+
+    Args:
+    - message (Dict): The message, with 'cells' or 'born' and 'died' as (n, 2) coordinate arrays.
+    - compress (bool): Whether to compress the sections with zlib.
+
+    Returns:
+    - bytes: The frame.
+    """
+    if message['kind'] == KEYFRAME:
+        body = encode_cells(message['cells'])
+    else:
+        body = encode_cells(message['born']) + encode_cells(message['died'])
+    return _frame(message['kind'], message['seq'], message['generation'],
+                  message.get('rows', 0), message.get('cols', 0), body, compress)
+
+
+def encode_grid(grid, generation: int = 0, seq: int = 0, compress: bool = False) -> bytes:
+    """
+    Encodes the current generation of a grid engine as a binary keyframe.
+
+    Array engines are encoded from their buffer: packed into a bitmap when at least one cell in
+    sixteen is alive, as varints of np.argwhere otherwise. Other engines are encoded from their
+    alive cells.
+
+    Args:
+    - grid: The grid engine.
+    - generation (int): Generation number written to the frame.
+    - seq (int): Sequence number written to the frame.
+    - compress (bool): Whether to compress the sections with zlib.
+
+    Returns:
+    - bytes: The frame.
+    """
+    board = cell_array(grid)
+    if board is None:
+        body = encode_cells(np.array(grid.get_live_cells(), dtype=np.int64))
+    else:
+        top, left = getattr(grid, 'origin', (0, 0))
+        if np.count_nonzero(board) * 16 >= board.size:
+            body = encode_bitmap(board, top, left)
+        else:
+            body = encode_cells(np.argwhere(board) + np.array([top, left], dtype=np.int64))
+    return _frame(KEYFRAME, seq, generation, grid.rows, grid.cols, body, compress)
+
+
+def decode_frame(data: bytes) -> Dict:
+    """
+    Decodes a binary frame back into a message.
+
+    Args:
+    - data (bytes): The frame.
+
+    Returns:
+    - Dict: The message, with 'seq', 'generation', 'kind', 'rows', 'cols' and either 'cells' or
+        'born' and 'died' as (n, 2) coordinate arrays.
+
+    Raises:
+    - ValueError: If data is not a frame of this version.
+    """
+    magic, version, kind, flags, seq, generation, rows, cols = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a cell frame of version %d" % VERSION)
+    body = memoryview(data)[HEADER.size:]
+    if flags & FLAG_ZLIB:
+        body = memoryview(zlib.decompress(body))
+    message = {'seq': seq, 'generation': generation, 'kind': KINDS[kind], 'rows': rows, 'cols': cols}
+    if message['kind'] == KEYFRAME:
+        message['cells'], _ = decode_section(body)
+    else:
+        message['born'], offset = decode_section(body)
+        message['died'], _ = decode_section(body, offset)
+    return message
+
+
+def stream_chunk(frame: Optional[bytes]) -> bytes:
+    """
+    Prefixes a frame with its length for a STREAM_MEDIA_TYPE response; None gives an empty keep-alive chunk.
+
+    Args:
+    - frame (Optional[bytes]): The frame.
+
+    Returns:
+    - bytes: The chunk.
+    """
+    if frame is None:
+        return LENGTH.pack(0)
+    return LENGTH.pack(len(frame)) + frame
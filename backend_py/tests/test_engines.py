@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from src.engines import GRID_ENGINES, create_grid
+from src.grid import BOUNDARY_DEAD, BOUNDARY_EXPAND, BOUNDARY_TORUS
+from src.rules import parse_rule
+
+RULES = ["B3/S23", "B36/S23", "B2/S", "B0123478/S01234678"]
+BOUNDARIES = [BOUNDARY_DEAD, BOUNDARY_TORUS, BOUNDARY_EXPAND]
+# Odd sizes, more than one 64 bit word per row for BitGrid and several tiles for TiledGrid
+ROWS, COLS = 17, 70
+GENERATIONS = 25
+ENGINE_KWARGS = {"tiled": {"tile_size": 8, "workers": 2}}
+# Engines that only store alive cells, which cannot run B0 rules on any boundary
+SPARSE_ENGINES = {"sparse", "hashlife"}
+
+
+def supported(engine, rule, boundary):
+    """Whether the engine can run the rule on the boundary (B0 rules need a dense, bounded board)."""
+    if boundary not in GRID_ENGINES[engine].BOUNDARIES:
+        return False
+    return not parse_rule(rule).births_from_nothing or (boundary != BOUNDARY_EXPAND and engine not in SPARSE_ENGINES)
+
+
+CASES = [(engine, rule, boundary) for engine in GRID_ENGINES if engine != "list"
+         for rule in RULES for boundary in BOUNDARIES if supported(engine, rule, boundary)]
+
+
+def soup(seed, density=0.35):
+    rng = random.Random(seed)
+    return [(r, c) for r in range(ROWS) for c in range(COLS) if rng.random() < density]
+
+
+@pytest.mark.parametrize("engine,rule,boundary", CASES)
+def test_engine_matches_list_grid(engine, rule, boundary):
+    cells = soup(hash((rule, boundary)) & 0xFFFF)
+    with create_grid(ROWS, COLS, "list", rule=rule, boundary=boundary) as reference, \
+            create_grid(ROWS, COLS, engine, rule=rule, boundary=boundary, **ENGINE_KWARGS.get(engine, {})) as grid:
+        reference.set_cells(cells)
+        grid.set_cells(cells)
+        for generation in range(1, GENERATIONS + 1):
+            reference.update()
+            grid.update()
+            expected = reference.get_live_cells()
+            assert sorted(grid.get_live_cells()) == expected, f"generation {generation}"
+            assert grid.population == len(expected)
+            assert grid.cells_changed == reference.cells_changed
+            assert grid.is_static == reference.is_static
+
+
+@pytest.mark.parametrize("engine", [engine for engine in GRID_ENGINES if engine != "list"])
+def test_glider_crosses_torus_edges(engine):
+    if BOUNDARY_TORUS not in GRID_ENGINES[engine].BOUNDARIES:
+        pytest.skip(f"{engine} has no torus boundary")
+    glider = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+    with create_grid(8, 8, engine, boundary=BOUNDARY_TORUS, **ENGINE_KWARGS.get(engine, {})) as grid:
+        grid.set_cells(glider)
+        for _ in range(32):  # A glider moves one cell diagonally every 4 generations, so it comes back
+            grid.update()
+        assert sorted(grid.get_live_cells()) == sorted(glider)
+
+
+def test_unsupported_boundary_raises():
+    with pytest.raises(ValueError):
+        create_grid(8, 8, "hashlife", boundary=BOUNDARY_DEAD)
+    with pytest.raises(ValueError):
+        create_grid(8, 8, "numpy", boundary=BOUNDARY_EXPAND, rule="B0/S8")
+
+
+@pytest.mark.parametrize("engine", ["numpy", "tiled", "shared"])
+def test_snapshot_outlives_updates(engine):
+    with create_grid(8, 8, engine, **ENGINE_KWARGS.get(engine, {})) as grid:
+        grid.set_cells([(3, 2), (3, 3), (3, 4)])
+        snapshot = grid.snapshot()
+        out = grid.snapshot(out=snapshot.copy())
+        grid.update()
+
+        assert snapshot.shape == (8, 8) and snapshot.dtype.name == "uint8"
+        assert sorted(zip(*snapshot.nonzero())) == [(3, 2), (3, 3), (3, 4)]
+        assert (out == snapshot).all()
+        assert grid.snapshot(out=out) is out
+        assert sorted(zip(*out.nonzero())) == [(2, 3), (3, 3), (4, 3)]
@@ -0,0 +1,142 @@
+import json
+import random
+
+import numpy as np
+import pytest
+
+import app as server
+from src.engines import GRID_ENGINES, create_grid
+from src.generation_stream import DELTA, KEYFRAME, DeltaEncoder, GenerationStream, cell_keys, coalesce
+from src.wire_format import LENGTH, STREAM_MEDIA_TYPE, decode_frame
+
+ROWS, COLS = 24, 40
+
+
+def soup(seed=5, density=0.35):
+    rng = random.Random(seed)
+    return [(r, c) for r in range(ROWS) for c in range(COLS) if rng.random() < density]
+
+
+def cells_of(array):
+    return set(map(tuple, np.asarray(array).tolist()))
+
+
+def apply(cells, born, died):
+    """Applies a delta to a set of cells, checking it only turns dead cells on and alive cells off."""
+    born, died = cells_of(born), cells_of(died)
+    assert not born & cells and died <= cells
+    return (cells - died) | born
+
+
+def stream_of(engine="numpy", **kwargs):
+    boundary = "expand" if engine == "hashlife" else "dead"
+    rows, cols = (None, None) if engine == "hashlife" else (ROWS, COLS)
+    grid = create_grid(rows, cols, engine, boundary=boundary)
+    grid.set_cells(soup())
+    return GenerationStream(grid, delay=0, **kwargs)
+
+
+def frame(born=(), died=()):
+    as_array = lambda cells: np.array(cells, dtype=np.int64).reshape(-1, 2)
+    return {'kind': DELTA, 'born': as_array(born), 'died': as_array(died)}
+
+
+@pytest.mark.parametrize("engine", sorted(GRID_ENGINES))
+def test_delta_encoder_follows_every_engine(engine):
+    boundary = "expand" if engine == "hashlife" else "torus"
+    rows, cols = (None, None) if engine == "hashlife" else (ROWS, COLS)
+    with create_grid(rows, cols, engine, boundary=boundary) as grid:
+        grid.set_cells(soup())
+        encoder = DeltaEncoder()
+        cells = cells_of(encoder.reset(grid))
+        assert cells == set(grid.get_live_cells())
+        for _ in range(30):
+            grid.update()
+            born, died = encoder.encode(grid)
+            for changes in (born, died):
+                keys = cell_keys(changes)
+                assert np.all(keys[1:] > keys[:-1])  # Ordered by row, then column
+            cells = apply(cells, born, died)
+            assert cells == set(grid.get_live_cells())
+            assert len(born) + len(died) == grid.cells_changed
+
+
+@pytest.mark.parametrize("engine", ["incremental", "sparse", "tiled", "hashlife"])
+def test_tracking_engines_ask_for_a_keyframe_after_an_edit(engine):
+    with create_grid(ROWS, COLS, engine, boundary="expand" if engine == "hashlife" else "dead") as grid:
+        grid.set_cells(soup())
+        encoder = DeltaEncoder()
+        encoder.reset(grid)
+        assert grid.changed_cells() is None  # Nothing updated yet
+        grid.update()
+        assert encoder.encode(grid) is not None
+        grid.set_cells([(0, 0), (0, 1)])
+        assert encoder.encode(grid) is None
+
+
+def test_coalesce_drops_cells_that_changed_back():
+    frames = [frame(born=[(1, 1), (2, 2)], died=[(5, 5)]),
+              frame(born=[(7, 7)], died=[(1, 1)]),
+              frame(born=[(5, 5)], died=[(9, 9)])]
+    born, died = coalesce(frames)
+    # (1, 1) was born then died and (5, 5) died then was born: neither is sent
+    assert born.tolist() == [[2, 2], [7, 7]]
+    assert died.tolist() == [[9, 9]]
+
+
+def test_slow_subscriber_gets_one_coalesced_delta():
+    stream = stream_of(keyframe_interval=64, buffer_size=128)
+    first = stream.next_message(None, timeout=0)
+    assert first['kind'] == KEYFRAME
+    for _ in range(5):
+        stream.step()
+    messages = list(stream.subscribe(first['seq']))
+    assert len(messages) == 1
+    message = messages[0]
+    assert (message['kind'], message['seq'], message['dropped']) == (DELTA, stream.sequence, 4)
+    assert apply(cells_of(first['cells']), message['born'], message['died']) == set(stream.grid.get_live_cells())
+
+
+def test_up_to_date_subscriber_gets_the_next_delta():
+    stream = stream_of()
+    after = stream.sequence
+    stream.step()
+    message = stream.next_message(after, timeout=0)
+    assert message['kind'] == DELTA and message['seq'] == after + 1 and 'dropped' not in message
+
+
+@pytest.mark.parametrize("engine", ["numpy", "hashlife"])
+def test_resume_after_the_ring_gives_a_keyframe(engine):
+    stream = stream_of(engine, keyframe_interval=4, buffer_size=8)
+    for _ in range(21):  # The newest keyframe is 1 generation old, with its delta applied on top
+        stream.step()
+    message = stream.next_message(2, timeout=0)
+    assert (message['kind'], message['seq'], message['generation']) == (KEYFRAME, stream.sequence, 21)
+    assert cells_of(message['cells']) == set(stream.grid.get_live_cells())
+    assert stream.next_message(None, timeout=0)['kind'] == KEYFRAME  # A new client as well
+
+
+def test_app_resumes_from_last_event_id(monkeypatch):
+    stream = stream_of(keyframe_interval=64, buffer_size=128)
+    first = stream.next_message(None, timeout=0)
+    for _ in range(3):
+        stream.step()
+    monkeypatch.setattr(server, "stream", stream)
+    client = server.app.test_client()
+
+    response = client.get("/stream", headers={"Last-Event-ID": str(first['seq'])})
+    events = [event for event in response.get_data(as_text=True).split("\n\n") if event]
+    assert len(events) == 1
+    lines = dict(line.split(": ", 1) for line in events[0].splitlines())
+    assert (lines["id"], lines["event"]) == (str(stream.sequence), DELTA)
+    data = json.loads(lines["data"])
+    assert data["dropped"] == 2
+    assert apply(cells_of(first['cells']), data["born"], data["died"]) == set(stream.grid.get_live_cells())
+
+    response = client.get(f"/stream?after={first['seq']}", headers={"Accept": STREAM_MEDIA_TYPE})
+    body = response.get_data()
+    length, = LENGTH.unpack_from(body)
+    assert len(body) == LENGTH.size + length
+    message = decode_frame(body[LENGTH.size:])
+    assert (message['kind'], message['seq']) == (DELTA, stream.sequence)
+    assert message['born'].tolist() == data["born"] and message['died'].tolist() == data["died"]
@@ -0,0 +1,48 @@
+import random
+
+from src.hashlife import HashlifeGrid
+
+
+class PeakHashlifeGrid(HashlifeGrid):
+    """Records the largest size the node table reaches."""
+
+    peak = 0
+
+    def _join(self, nw, ne, sw, se):
+        node = super()._join(nw, ne, sw, se)
+        self.peak = max(self.peak, len(self._nodes))
+        return node
+
+
+def soup(size, seed=1, density=0.4):
+    rng = random.Random(seed)
+    return [(r, c) for r in range(size) for c in range(size) if rng.random() < density]
+
+
+def test_node_table_stays_bounded_during_a_jump():
+    cells = soup(48)
+    reference = HashlifeGrid()
+    reference.set_cells(cells)
+    reference.jump(8)
+    assert reference.node_count > 20_000  # A whole jump needs far more nodes than the bound below
+
+    grid = PeakHashlifeGrid(max_nodes=5000)
+    grid.set_cells(cells)
+    grid.jump(8)
+    assert grid.peak <= 5000
+    assert grid.node_count <= 5000
+    assert grid.get_live_cells() == reference.get_live_cells()
+
+
+def test_step_matches_single_updates_with_a_small_table():
+    cells = soup(24, seed=2)
+    stepped = PeakHashlifeGrid(max_nodes=2000)
+    stepped.set_cells(cells)
+    stepped.step(100)
+    updated = HashlifeGrid()
+    updated.set_cells(cells)
+    for _ in range(100):
+        updated.update()
+    assert stepped.generation == updated.generation == 100
+    assert stepped.get_live_cells() == updated.get_live_cells()
+    assert stepped.peak <= 2000
@@ -0,0 +1,67 @@
+from src.object_tracker import ObjectTracker
+from src.ship_detector import OSCILLATOR, SPACESHIP, STILL_LIFE, ShipDetector
+from src.sparse_grid import SparseGrid
+
+GLIDER = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]  # Moves down and right
+BLOCK = [(0, 0), (0, 1), (1, 0), (1, 1)]
+BLINKER = [(0, 0), (0, 1), (0, 2)]
+R_PENTOMINO = [(0, 1), (0, 2), (1, 0), (1, 1), (2, 1)]
+
+
+def board(*patterns):
+    """An unbounded board with each (cells, (row, column)) pattern placed at its position."""
+    grid = SparseGrid(None, None, boundary="expand")
+    for cells, (row, col) in patterns:
+        grid.set_cells((row + r, col + c) for r, c in cells)
+    return grid
+
+
+def run(grid, generations, tracker=None):
+    tracker = tracker or ObjectTracker(grid)
+    tracker.update()
+    for _ in range(generations):
+        grid.update()
+        tracker.update()
+    return tracker
+
+
+def test_objects_are_classified_separately():
+    grid = board((GLIDER, (0, 0)), (BLOCK, (0, 40)), (BLINKER, (40, 0)))
+    tracker = run(grid, 12)
+    assert tracker.all_classified
+    by_status = {summary['status']: summary for summary in tracker.classified()}
+    assert set(by_status) == {SPACESHIP, STILL_LIFE, OSCILLATOR}
+    glider = by_status[SPACESHIP]
+    assert (glider['period'], glider['speed'], glider['population']) == (4, [0.25, 0.25], 5)
+    assert by_status[STILL_LIFE]['period'] == 1
+    assert by_status[OSCILLATOR]['period'] == 2
+    assert [summary['id'] for summary in tracker.ships()] == [glider['id']]
+
+    # The board as a whole never repeats, so the whole-board detector cannot classify it
+    whole = ShipDetector(board((GLIDER, (0, 0)), (BLOCK, (0, 40)), (BLINKER, (40, 0))))
+    grid = whole.grid
+    whole.detect_and_classify_ships(0)
+    for generation in range(1, 13):
+        grid.update()
+        whole.detect_and_classify_ships(generation)
+    assert not whole.is_classified
+
+
+def test_glider_emitted_by_debris_is_found():
+    # The R-pentomino grows into changing debris and throws its first glider off around generation 70
+    grid = board((R_PENTOMINO, (0, 0)))
+    tracker = ObjectTracker(grid)
+    tracker.update()
+    ships = []
+    for _ in range(100):
+        grid.update()
+        tracker.update()
+        ships = tracker.ships()
+        if ships:
+            break
+    assert len(ships) == 1
+    ship = ships[0]
+    assert (ship['period'], ship['population']) == (4, 5)
+    assert [abs(speed) for speed in ship['speed']] == [0.25, 0.25]
+    assert ship['born'] > 0  # A track that split off the debris, not the initial object
+    assert grid.population > 5 and not tracker.all_classified  # The debris is still evolving
@@ -0,0 +1,60 @@
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from src.batch_runner import BatchRunner
+from src.parallel_evaluator import ParallelEvaluator
+
+# The faulty run_ship below reaches the workers by forking the patched test process
+pytestmark = pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                                reason="needs workers forked from the test process")
+
+BLOCK = [[1, 1], [1, 1]]
+
+
+def ship(ship_id):
+    return {"id": ship_id, "name": ship_id, "designation": "", "initial_direction": BLOCK}
+
+
+@pytest.fixture
+def faulty_runner(monkeypatch):
+    """Makes the worker die on the ship 'crash' and sleep forever on the ship 'hang'."""
+    run_ship = BatchRunner.run_ship
+
+    def faulty_run_ship(self, ship_data):
+        if ship_data["id"] == "crash":
+            os._exit(1)
+        if ship_data["id"] == "hang":
+            time.sleep(3600)
+        return run_ship(self, ship_data)
+
+    monkeypatch.setattr(BatchRunner, "run_ship", faulty_run_ship)
+
+
+def evaluate(ships, **kwargs):
+    evaluator = ParallelEvaluator(rows=20, cols=20, generations=10, **kwargs)
+    start = time.monotonic()
+    results = {result["id"]: result for result in evaluator.evaluate(ships)}
+    return results, time.monotonic() - start
+
+
+def test_crashing_worker_is_detected_without_the_timeout(faulty_runner):
+    ships = [ship(f"block-{n}") for n in range(6)] + [ship("crash")]
+    results, elapsed = evaluate(ships, workers=2, chunk_size=4, chunk_timeout=60.0)
+    assert results.pop("crash")["status"] == "crash"
+    assert {result["status"] for result in results.values()} == {"still_life"}
+    assert len(results) == 6
+    assert elapsed < 30.0  # Far below one chunk_timeout
+
+
+def test_hanging_worker_times_out_alone(faulty_runner):
+    ships = [ship("hang")] + [ship(f"block-{n}") for n in range(6)] + [ship("crash")]
+    results, elapsed = evaluate(ships, workers=2, chunk_size=2, chunk_timeout=2.0)
+    assert results.pop("hang")["status"] == "timeout"
+    assert results.pop("crash")["status"] == "crash"
+    assert {result["status"] for result in results.values()} == {"still_life"}
+    assert len(results) == 6
+    # One timeout for the chunk holding 'hang' and one once it runs on its own, nothing for 'crash'
+    assert elapsed < 4 * 2.0 + 3.0
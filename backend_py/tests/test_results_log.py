@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+from utils import results_log
+from utils.general_utils import GeneralUtils
+from utils.results_log import ResultsWriter, append_result, read_results
+
+
+def lines(path):
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+def test_partial_last_record_is_dropped_on_the_next_append(tmp_path):
+    path = tmp_path / "results.jsonl"
+    append_result({"id": 1}, str(path))
+    append_result({"id": 2}, str(path))
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"id": 3, "sta')  # Interrupted in the middle of a record
+    assert list(read_results(str(path))) == [{"id": 1}, {"id": 2}]
+
+    append_result({"id": 4}, str(path))
+    assert lines(path) == ['{"id":1}', '{"id":2}', '{"id":4}']
+    assert list(read_results(str(path))) == [{"id": 1}, {"id": 2}, {"id": 4}]
+
+
+def test_file_without_any_newline_is_emptied(tmp_path):
+    path = tmp_path / "results.jsonl"
+    path.write_text('{"id"', encoding="utf-8")
+    append_result({"id": 1}, str(path))
+    assert lines(path) == ['{"id":1}']
+
+
+def test_invalid_complete_line_raises(tmp_path):
+    path = tmp_path / "results.jsonl"
+    path.write_text('{"id":1}\nnot json\n{"id":2}\n', encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(read_results(str(path)))
+
+
+def test_records_are_written_in_batches_of_flush_every(tmp_path):
+    path = tmp_path / "results.jsonl"
+    with ResultsWriter(str(path), flush_every=3) as writer:
+        writer.write_many([{"id": 1}, {"id": 2}])
+        assert path.read_text() == ""
+        writer.write({"id": 3})
+        assert len(lines(path)) == 3
+        writer.write({"id": 4})
+        assert len(lines(path)) == 3
+    assert [record["id"] for record in read_results(str(path))] == [1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("fsync_interval,expected", [(None, 0), (0, 3), (3600, 1)])
+def test_fsync_interval(tmp_path, monkeypatch, fsync_interval, expected):
+    calls = []
+    monkeypatch.setattr(results_log.os, "fsync", calls.append)
+    with ResultsWriter(str(tmp_path / "results.jsonl"), flush_every=1, fsync_interval=fsync_interval) as writer:
+        writer.write_many([{"id": n} for n in range(3)])
+    # 0: every flush that wrote records; 3600: only the close; None: never
+    assert len(calls) == expected
+
+
+def test_unserializable_record(tmp_path):
+    with ResultsWriter(str(tmp_path / "results.jsonl")) as writer:
+        with pytest.raises(ValueError):
+            writer.write({"id": object()})
+
+
+def test_general_utils_routes_jsonl_to_the_log(tmp_path):
+    path = str(tmp_path / "results.jsonl")
+    GeneralUtils.save_to_json([{"id": 1}, {"id": 2}], path)
+    GeneralUtils.append_to_json({"id": 3}, path)
+    assert lines(tmp_path / "results.jsonl") == ['{"id":1}', '{"id":2}', '{"id":3}']
+    assert GeneralUtils.load_from_json(path) == [{"id": 1}, {"id": 2}, {"id": 3}]
+    GeneralUtils.clear_json_file(path)
+    assert GeneralUtils.load_from_json(path) == []
+
+
+def test_general_utils_keeps_json_files_as_one_document(tmp_path):
+    path = str(tmp_path / "results.json")
+    GeneralUtils.append_to_json({"id": 1}, path)
+    GeneralUtils.append_to_json({"id": 2}, path)
+    with open(path) as f:
+        assert json.load(f) == [{"id": 1}, {"id": 2}]
+    GeneralUtils.clear_json_file(path)
+    assert GeneralUtils.load_from_json(path) == []
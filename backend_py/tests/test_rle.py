@@ -0,0 +1,71 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.rle import (encode_rle, header_rule, iter_rle_cells, load_rle, read_rle, read_rle_array, read_rle_file,
+                     rle_to_2d_grid, write_rle_file)
+from src.rules import parse_rule
+from src.sparse_grid import SparseGrid
+
+GLIDER = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+
+
+def soup(seed, rows=40, cols=90, density=0.4):
+    rng = random.Random(seed)
+    return [(r, c) for r in range(rows) for c in range(cols) if rng.random() < density]
+
+
+def test_glider_text():
+    assert encode_rle(GLIDER) == "x = 3, y = 3, rule = B3/S23\nbo$2bo$3o!\n"
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_encode_read_round_trip(seed):
+    cells = soup(seed)
+    header, decoded = read_rle(encode_rle(cells, rule="B36/S23", line_width=40))
+    # The pattern is cropped to its bounding box
+    top, left = min(r for r, _ in cells), min(c for _, c in cells)
+    assert decoded == [(r - top, c - left) for r, c in sorted(cells)]
+    assert header["x"] == max(c for _, c in cells) - left + 1
+    assert header["y"] == max(r for r, _ in cells) - top + 1
+    assert header_rule(header) == parse_rule("B36/S23")
+
+
+def test_array_and_streaming_decoders_agree():
+    text = encode_rle(soup(7), line_width=30)
+    _, cells = read_rle_array(text)
+    assert cells.tolist() == [list(cell) for cell in iter_rle_cells(text)]
+
+
+def test_empty_pattern():
+    header, cells = read_rle(encode_rle([]))
+    assert (header["x"], header["y"], cells) == (0, 0, [])
+
+
+def test_line_width_and_comments():
+    text = encode_rle(soup(3), line_width=20, comments=["N Soup", "#O someone"])
+    lines = text.splitlines()
+    assert lines[:2] == ["#C N Soup", "#O someone"]
+    assert all(len(line) <= 20 for line in lines[3:])
+
+
+def test_header_rule_ignores_topology():
+    header, _ = read_rle("x = 3, y = 1, rule = b36/s23:T100,100\n3o!")
+    assert header_rule(header) == parse_rule("B36/S23")
+    assert header_rule(read_rle("3o!")[0]) == parse_rule("B3/S23")
+
+
+def test_file_round_trip(tmp_path):
+    file_name = str(tmp_path / "glider.rle")
+    write_rle_file(file_name, GLIDER, rule="B3/S23", comments=["N Glider"])
+    header, cells = read_rle_file(file_name)
+    assert cells == sorted(GLIDER)
+    assert rle_to_2d_grid(encode_rle(GLIDER)) == [[0, 1, 0], [0, 0, 1], [1, 1, 1]]
+
+
+def test_load_rle_places_pattern():
+    grid = SparseGrid(None, None, boundary="expand")
+    load_rle(encode_rle(GLIDER), grid, position=(-5, 10))
+    assert sorted(grid.get_live_cells()) == sorted((r - 5, c + 10) for r, c in GLIDER)
+    assert np.array_equal(read_rle_array(encode_rle(GLIDER))[1], np.array(sorted(GLIDER)))
@@ -0,0 +1,118 @@
+import gc
+import hashlib
+import multiprocessing
+import random
+
+import numpy as np
+import pytest
+
+from src.numpy_grid import NumpyGrid
+from src.shared_grid import SharedGrid, SharedGridReader
+
+ROWS, COLS = 192, 256
+GENERATIONS = 150
+
+
+def soup(seed=3, density=0.35):
+    rng = random.Random(seed)
+    return [(r, c) for r in range(ROWS) for c in range(COLS) if rng.random() < density]
+
+
+def digest(board):
+    return hashlib.md5(np.ascontiguousarray(board, dtype=np.uint8).tobytes()).hexdigest()
+
+
+def read_frames(name, ready, results):
+    """Reads frames in a second process until the last generation, reporting (generation, digest) of each."""
+    reader = SharedGridReader(name)
+    ready.set()
+    seen = {}
+    out = np.empty((reader.rows, reader.cols), dtype=np.uint8)
+    generation = -1
+    while generation < GENERATIONS:
+        frame, board = reader.read(out)
+        generation = reader.metadata(frame)[0]
+        if reader.is_valid(frame):  # The metadata must belong to the frame that was copied
+            seen[generation] = digest(board)
+    reader.close()
+    results.put(seen)
+
+
+def test_reader_process_sees_consistent_frames():
+    cells = soup()
+    reference = NumpyGrid(ROWS, COLS)
+    reference.set_cells(cells)
+    expected = {0: digest(reference.grid_coordinates)}
+    for generation in range(1, GENERATIONS + 1):
+        reference.update()
+        expected[generation] = digest(reference.grid_coordinates)
+
+    context = multiprocessing.get_context()
+    with SharedGrid(ROWS, COLS) as grid:
+        grid.set_cells(cells)
+        ready, results = context.Event(), context.Queue()
+        process = context.Process(target=read_frames, args=(grid.name, ready, results))
+        process.start()
+        assert ready.wait(30)
+        for _ in range(GENERATIONS):
+            grid.update()
+        seen = results.get(timeout=60)
+        process.join(30)
+    assert process.exitcode == 0
+    assert seen and GENERATIONS in seen
+    # Every frame the reader accepted is a whole generation, never a mix of two
+    for generation, board in seen.items():
+        assert board == expected[generation], f"generation {generation}"
+
+
+def test_read_reuses_its_buffer():
+    with SharedGrid(8, 8) as grid:
+        grid.set_cells([(1, 2), (1, 3), (1, 4)])
+        reader = SharedGridReader(grid.name)
+        out = np.full((8, 8), 7, dtype=np.uint8)
+        frame, board = reader.read(out=out)
+        assert board is out
+        assert np.array_equal(out, grid.grid_coordinates)
+        assert reader.metadata(frame)[:2] == (0, 3)
+
+        grid.update()
+        frame, board = reader.read(out=out)
+        assert board is out
+        assert sorted(zip(*np.nonzero(out))) == [(0, 3), (1, 3), (2, 3)]
+        reader.close()
+
+
+def test_zero_copy_frame_is_invalidated_two_frames_later():
+    with SharedGrid(8, 8) as grid:
+        grid.set_cells([(1, 2), (1, 3), (1, 4)])
+        reader = SharedGridReader(grid.name)
+        frame, view = reader.frame()
+        grid.update()  # Writes the other slot
+        assert reader.is_valid(frame)
+        grid.update()  # Writes the slot of the view
+        assert not reader.is_valid(frame)
+        assert reader.read()[0] == frame + 2
+        reader.close()
+
+
+def test_close_unlinks_the_block():
+    grid = SharedGrid(8, 8)
+    grid.set_cells([(3, 3)])
+    name = grid.name
+    attached = SharedGridReader(name)
+    grid.close()
+    grid.close()  # Closing twice does nothing
+    # Readers attached before keep their mapping, new ones cannot attach
+    assert attached.get_live_cells() == [(3, 3)]
+    attached.close()
+    with pytest.raises(FileNotFoundError):
+        SharedGridReader(name)
+
+
+def test_dropped_grid_unlinks_the_block():
+    grid = SharedGrid(8, 8)
+    name = grid.name
+    del grid
+    gc.collect()
+    with pytest.raises(FileNotFoundError):
+        SharedGridReader(name)
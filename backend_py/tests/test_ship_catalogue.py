@@ -0,0 +1,55 @@
+import json
+import os
+import random
+
+import numpy as np
+import pytest
+
+from utils.ship_catalogue import ShipCatalogue, convert_json_to_catalogue, write_catalogue
+
+SHIPS_JSON = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ships.json")
+
+
+def random_ships(count, seed=0):
+    rng = random.Random(seed)
+    ships = []
+    for n in range(count):
+        rows, cols = rng.randint(1, 12), rng.randint(1, 12)
+        ships.append({"id": f"ship-{n:03d}-é", "name": f"Ship {n}", "designation": rng.choice(["Small", ""]),
+                      "initial_direction": [[rng.randint(0, 1) for _ in range(cols)] for _ in range(rows)],
+                      "created": "2025-01-20T10:00:00Z", "tags": ["random", n], "period": n % 4 or None})
+    rng.shuffle(ships)
+    return ships
+
+
+def test_ships_json_round_trip(tmp_path):
+    file_name = str(tmp_path / "ships.bin")
+    with open(SHIPS_JSON) as f:
+        ships = json.load(f)
+    assert convert_json_to_catalogue(SHIPS_JSON, file_name) == len(ships)
+    with ShipCatalogue(file_name) as catalogue:
+        assert len(catalogue) == len(ships)
+        # Every field comes back, including 'created' and 'last_updated'
+        assert list(catalogue) == ships
+
+
+def test_random_ships_round_trip(tmp_path):
+    file_name = str(tmp_path / "random.bin")
+    ships = random_ships(50)
+    assert write_catalogue(iter(ships), file_name) == len(ships)
+    with ShipCatalogue(file_name) as catalogue:
+        assert list(catalogue) == ships
+        assert list(catalogue.ids()) == [ship["id"] for ship in ships]
+        for index, ship in enumerate(ships):
+            assert catalogue.index_of(ship["id"]) == index
+            assert catalogue.get(ship["id"]) == ship
+            assert np.array_equal(catalogue.direction_array(index), np.array(ship["initial_direction"]))
+
+
+def test_missing_id(tmp_path):
+    file_name = str(tmp_path / "random.bin")
+    write_catalogue(random_ships(5), file_name)
+    with ShipCatalogue(file_name) as catalogue:
+        for ship_id in ["", "ship", "ship-999-é", "zzz"]:
+            with pytest.raises(KeyError):
+                catalogue.get(ship_id)
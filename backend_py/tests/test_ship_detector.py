@@ -0,0 +1,91 @@
+import json
+import os
+
+import pytest
+
+from src.batch_runner import BatchRunner
+from src.engines import create_grid
+from src.ship_detector import DIED_OUT, OSCILLATOR, SPACESHIP, STILL_LIFE, ShipDetector
+
+SHIPS_JSON = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ships.json")
+GLIDER = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+
+
+def definition(ship_id, rows):
+    return {"id": ship_id, "name": ship_id, "designation": "", "initial_direction": rows}
+
+
+def ships():
+    with open(SHIPS_JSON) as f:
+        return {ship["id"]: ship for ship in json.load(f)}
+
+
+@pytest.mark.parametrize("engine", ["list", "numpy", "sparse", "bit", "hashlife"])
+@pytest.mark.parametrize("ship_id,displacement", [("glider", [1, 1]), ("lwss", [0, 2]), ("mwss", [0, 2]),
+                                                  ("hwss", [0, 2])])
+def test_ships_json_spaceships(engine, ship_id, displacement):
+    with BatchRunner(rows=40, cols=40, engine=engine) as runner:
+        result = runner.run_ship(ships()[ship_id])
+    assert (result["status"], result["period"], result["displacement"]) == (SPACESHIP, 4, displacement)
+    assert result["generations"] <= 5  # Stops at the first repeat
+
+
+def test_blinker_is_a_period_2_oscillator():
+    with BatchRunner(rows=20, cols=20) as runner:
+        result = runner.run_ship(definition("blinker", [[1, 1, 1]]))
+    assert (result["status"], result["period"], result["generations"]) == (OSCILLATOR, 2, 2)
+
+
+def test_block_is_a_still_life():
+    with BatchRunner(rows=20, cols=20) as runner:
+        result = runner.run_ship(definition("block", [[1, 1], [1, 1]]))
+    assert (result["status"], result["period"], result["generations"]) == (STILL_LIFE, 1, 1)
+
+
+def test_dying_pattern_stops_when_empty():
+    # The diagonal keeps only its middle cell, which dies in the next generation
+    with BatchRunner(rows=20, cols=20) as runner:
+        result = runner.run_ship(definition("diagonal", [[1, 0, 0], [0, 1, 0], [0, 0, 1]]))
+    assert (result["status"], result["generations"], result["population"]) == (DIED_OUT, 2, 0)
+
+
+def run_detector(grid, generations):
+    detector = ShipDetector(grid)
+    detector.detect_and_classify_ships(0)
+    for generation in range(1, generations + 1):
+        grid.update()
+        detector.detect_and_classify_ships(generation)
+        if detector.is_classified:
+            return detector, generation
+    return detector, generations
+
+
+def test_cycle_touching_a_dead_edge_is_not_proof():
+    grid = create_grid(12, 12, "numpy")
+    grid.set_cells(GLIDER)  # Touches the top edge for its first generations
+    detector, generation = run_detector(grid, 4)
+    assert not detector.is_classified  # Its shape repeated, but the edge could have shaped the cycle
+    detector, generation = run_detector(grid, 8)
+    assert detector.classification["status"] == SPACESHIP
+
+
+def test_cycle_on_a_torus_is_proof():
+    grid = create_grid(12, 12, "numpy", boundary="torus")
+    grid.set_cells(GLIDER)
+    detector, generation = run_detector(grid, 10)
+    assert (detector.classification["status"], generation) == (SPACESHIP, 4)
+
+
+def test_glider_crashing_into_a_corner_is_a_still_life():
+    # Too small a board for a free cycle: the glider ends up as a block in the corner
+    with BatchRunner(rows=5, cols=5, generations=50) as runner:
+        result = runner.run_ship(ships()["glider"])
+    assert (result["status"], result["population"]) == (STILL_LIFE, 4)
+
+
+def test_max_history_limits_the_period():
+    with BatchRunner(rows=30, cols=30, generations=40, max_history=3) as runner:
+        result = runner.run_ship(ships()["glider"])
+    assert result["status"] == "unclassified"
+    with BatchRunner(rows=30, cols=30, max_history=4) as runner:
+        assert runner.run_ship(ships()["glider"])["status"] == SPACESHIP
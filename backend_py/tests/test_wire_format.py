@@ -0,0 +1,85 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.engines import create_grid
+from src.generation_stream import DELTA, KEYFRAME
+from src.wire_format import (LENGTH, MAGIC, decode_frame, decode_varints, encode_grid, encode_message,
+                             encode_varints, stream_chunk)
+
+ROWS, COLS = 37, 101
+
+
+def soup(seed, density):
+    rng = random.Random(seed)
+    return [(r, c) for r in range(ROWS) for c in range(COLS) if rng.random() < density]
+
+
+def as_array(cells):
+    return np.array(sorted(cells), dtype=np.int64).reshape(-1, 2)
+
+
+def test_varint_round_trip():
+    values = np.array([0, 1, 127, 128, 300, 16383, 16384, 2 ** 32, 2 ** 63, 2 ** 64 - 1], dtype=np.uint64)
+    encoded = encode_varints(values)
+    assert encoded[:3].tolist() == [0, 1, 127]
+    assert np.array_equal(decode_varints(encoded), values)
+    assert len(decode_varints(encode_varints(np.zeros(0, dtype=np.uint64)))) == 0
+
+
+@pytest.mark.parametrize("engine", ["list", "numpy", "sparse", "bit", "hashlife", "tiled", "shared"])
+@pytest.mark.parametrize("density", [0.0, 0.02, 0.5])
+@pytest.mark.parametrize("compress", [False, True])
+def test_encode_grid_round_trip(engine, density, compress):
+    cells = soup(int(density * 100), density)
+    rows, cols = (None, None) if engine == "hashlife" else (ROWS, COLS)
+    with create_grid(rows, cols, engine) as grid:
+        grid.set_cells(cells)
+        message = decode_frame(encode_grid(grid, generation=12, seq=3, compress=compress))
+    assert (message["kind"], message["generation"], message["seq"]) == (KEYFRAME, 12, 3)
+    assert (message["rows"], message["cols"]) == (rows or 0, cols or 0)
+    assert np.array_equal(message["cells"], as_array(cells))
+
+
+def test_expanded_grid_keeps_negative_coordinates():
+    with create_grid(10, 10, "numpy", boundary="expand") as grid:
+        grid.set_cells([(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)])
+        for _ in range(40):  # The glider leaves the starting board towards the bottom right
+            grid.update()
+        grid.set_cells([(-3, -4)])
+        message = decode_frame(encode_grid(grid))
+        assert np.array_equal(message["cells"], as_array(grid.get_live_cells()))
+
+
+@pytest.mark.parametrize("density", [0.01, 0.6])
+def test_message_round_trip(density):
+    cells, born, died = soup(1, density), soup(2, density), soup(3, density)
+    keyframe = {"kind": KEYFRAME, "seq": 0, "generation": 5, "rows": ROWS, "cols": COLS, "cells": as_array(cells)}
+    delta = {"kind": DELTA, "seq": 1, "generation": 6, "born": as_array(born), "died": as_array(died[:0])}
+    decoded = decode_frame(encode_message(keyframe, compress=True))
+    assert np.array_equal(decoded["cells"], keyframe["cells"])
+    assert (decoded["rows"], decoded["cols"]) == (ROWS, COLS)
+    decoded = decode_frame(encode_message(delta))
+    assert decoded["kind"] == DELTA
+    assert np.array_equal(decoded["born"], delta["born"])
+    assert decoded["died"].shape == (0, 2)
+
+
+def test_unordered_cells_come_back_sorted():
+    cells = np.array([[5, 1], [-2, 7], [5, 0], [-2, -9]], dtype=np.int64)
+    message = decode_frame(encode_message({"kind": KEYFRAME, "seq": 0, "generation": 0, "cells": cells}))
+    assert message["cells"].tolist() == [[-2, -9], [-2, 7], [5, 0], [5, 1]]
+
+
+def test_rejects_other_data():
+    with pytest.raises(ValueError):
+        decode_frame(b"XX" + bytes(64))
+    assert encode_message({"kind": KEYFRAME, "seq": 0, "generation": 0, "cells": []}).startswith(MAGIC)
+
+
+def test_stream_chunk():
+    frame = encode_message({"kind": KEYFRAME, "seq": 0, "generation": 0, "cells": [[1, 1]]})
+    chunk = stream_chunk(frame)
+    assert LENGTH.unpack_from(chunk)[0] == len(frame) and chunk[LENGTH.size:] == frame
+    assert stream_chunk(None) == LENGTH.pack(0)
@@ -1,6 +1,8 @@
 import json
 import os
 
+from utils.results_log import ResultsWriter, append_result, read_results
+
 
 class GeneralUtils:
     """
@@ -14,8 +16,18 @@ class GeneralUtils:
     - load_from_json(file_name): Loads and returns data from a JSON file.
     - append_to_json(new_data, file_name): Appends data to an existing JSON file.
     - clear_json_file(file_name): Clears the content of a JSON file (overwrites with an empty list).
+
+    Files ending in .jsonl are treated as line-delimited JSON logs (see utils.results_log): appending
+    writes a single line instead of rewriting the file, and loading reads it line by line.
     """
 
+    @staticmethod
+    def is_jsonl(file_name: str) -> bool:
+        """
+        Whether the file is a line-delimited JSON log, judged by its .jsonl extension.
+        """
+        return file_name.endswith(".jsonl")
+
     @staticmethod
     def save_to_json(data: dict | list, file_name: str) -> None:
         """
@@ -46,6 +58,11 @@ class GeneralUtils:
         >>> GeneralUtils.save_to_json(data, "example.json")
         """
         try:
+            if GeneralUtils.is_jsonl(file_name):
+                GeneralUtils.clear_json_file(file_name)
+                with ResultsWriter(file_name) as writer:
+                    writer.write_many(data if isinstance(data, list) else [data])
+                return
             with open(file_name, "w") as f:
                 json.dump(data, f, indent=4)
         except TypeError as e:
@@ -88,6 +105,8 @@ class GeneralUtils:
             raise FileNotFoundError(f"{file_name} does not exist.")
 
         try:
+            if GeneralUtils.is_jsonl(file_name):
+                return list(read_results(file_name))
             with open(file_name, "r") as f:
                 return json.load(f)
         except json.JSONDecodeError as e:
@@ -125,7 +144,10 @@ class GeneralUtils:
         >>> GeneralUtils.append_to_json(new_data, "example.json")
         """
         try:
-            if not os.path.exists(file_name):
+            if GeneralUtils.is_jsonl(file_name):
+                # Line-delimited log: a single appended line, the existing content is never read
+                append_result(new_data, file_name)
+            elif not os.path.exists(file_name):
                 # Initialize a new file with a list containing the new data
                 with open(file_name, "w") as f:
                     json.dump([new_data], f, indent=4)
@@ -172,6 +194,9 @@ class GeneralUtils:
         >>> GeneralUtils.clear_json_file("example.json")
         """
         try:
+            if GeneralUtils.is_jsonl(file_name):
+                open(file_name, "w").close()
+                return
             with open(file_name, "w") as f:
                 json.dump([], f, indent=4)
         except IOError as e:
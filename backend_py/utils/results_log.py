@@ -0,0 +1,209 @@
+import json
+import os
+import time
+from typing import Iterable, Iterator, Optional
+
+
+class ResultsWriter:
+    """
+    Append-only writer for line-delimited JSON (JSONL) results.
+
+    Every record is serialized to one line and appended to the file, so logging N results costs O(N)
+    I/O. Records are buffered and written in batches of flush_every; fsync_interval additionally
+    forces the data to disk at most every so many seconds. A crash can at worst leave one partial
+    last line, which read_results skips and the next ResultsWriter on the file truncates before
+    appending; every earlier record stays readable.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the JSONL file, created if it does not exist.
+    flush_every : int
+        Number of buffered records that triggers a write. Defaults to 100.
+    fsync_interval : Optional[float]
+        Minimum number of seconds between two fsync calls, None (the default) never calls fsync and
+        0 calls it on every flush.
+
+    Methods
+    -------
+    write(record) -> None
+        Buffers one record.
+    write_many(records) -> None
+        Buffers several records.
+    flush() -> None
+        Writes the buffered records to the file.
+    close() -> None
+        Flushes, fsyncs if enabled and closes the file.
+
+    Examples
+    --------
+    >>> with ResultsWriter("results.jsonl", flush_every=50) as writer:
+    ...     for result in runner.run(ship_list):
+    ...         writer.write(result)
+    """
+
+    def __init__(self, file_name: str, flush_every: int = 100, fsync_interval: Optional[float] = None) -> None:
+        if flush_every < 1:
+            raise ValueError("flush_every must be at least 1")
+        self.file_name = file_name
+        self.flush_every = flush_every
+        self.fsync_interval = fsync_interval
+        self._buffer = []
+        self._last_fsync = time.monotonic()
+        self._unsynced = False  # Whether records were written since the last fsync
+        try:
+            _drop_partial_line(file_name)
+            self._file = open(file_name, "a", encoding="utf-8")
+        except IOError as e:
+            raise IOError(f"Error opening file {file_name}: {e}")
+
+    def __enter__(self) -> 'ResultsWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def write(self, record: dict | list) -> None:
+        """
+        Buffers one record, writing the buffer once it holds flush_every records.
+
+        Raises
+        ------
+        ValueError
+            If the record is not serializable to JSON.
+        """
+        try:
+            line = json.dumps(record, separators=(",", ":"))
+        except TypeError as e:
+            raise ValueError(f"Data is not serializable to JSON: {e}")
+        self._buffer.append(line + "\n")
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def write_many(self, records: Iterable[dict | list]) -> None:
+        """
+        Buffers several records.
+        """
+        for record in records:
+            self.write(record)
+
+    def flush(self) -> None:
+        """
+        Writes the buffered records to the file in one call and fsyncs if the interval has elapsed.
+
+        Raises
+        ------
+        IOError
+            If there is an error writing to the file.
+        """
+        if self._buffer:
+            try:
+                self._file.write("".join(self._buffer))
+                self._file.flush()
+            except IOError as e:
+                raise IOError(f"Error writing to file {self.file_name}: {e}")
+            self._buffer.clear()
+            self._unsynced = True
+
+        if self.fsync_interval is not None and time.monotonic() - self._last_fsync >= self.fsync_interval:
+            self._fsync()
+
+    def _fsync(self) -> None:
+        if self._unsynced:
+            os.fsync(self._file.fileno())
+            self._unsynced = False
+            self._last_fsync = time.monotonic()
+
+    def close(self) -> None:
+        """
+        Writes the remaining records and closes the file.
+        """
+        if self._file.closed:
+            return
+        try:
+            self.flush()
+            if self.fsync_interval is not None:
+                self._fsync()
+        finally:
+            self._file.close()
+
+
+def _drop_partial_line(file_name: str) -> None:
+    """
+    Truncates a file after its last newline, removing the partial record of an interrupted write.
+    """
+    if not os.path.exists(file_name):
+        return
+    with open(file_name, "rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            step = min(4096, position)
+            f.seek(position - step)
+            block = f.read(step)
+            newline = block.rfind(b"\n")
+            if newline != -1:
+                position = position - step + newline + 1
+                break
+            position -= step
+        if position != end:
+            f.truncate(position)
+
+
+def append_result(record: dict | list, file_name: str) -> None:
+    """
+    Appends a single record to a JSONL file.
+
+    Parameters
+    ----------
+    record : dict | list
+        The record to append. Must be serializable to JSON.
+    file_name : str
+        The name of the JSONL file.
+    """
+    with ResultsWriter(file_name, flush_every=1) as writer:
+        writer.write(record)
+
+
+def read_results(file_name: str) -> Iterator[dict | list]:
+    """
+    Streams the records of a JSONL file one line at a time, without loading the whole file.
+
+    Empty lines are ignored and so is a last line without a trailing newline that is not valid JSON,
+    which is what an interrupted write leaves behind.
+
+    Parameters
+    ----------
+    file_name : str
+        The name of the JSONL file.
+
+    Returns
+    -------
+    Iterator[dict | list]
+        The records, in the order they were written.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the specified file does not exist.
+    ValueError
+        If a complete line is not valid JSON.
+
+    Examples
+    --------
+    >>> for result in read_results("results.jsonl"):
+    ...     print(result["status"])
+    """
+    if not os.path.exists(file_name):
+        raise FileNotFoundError(f"{file_name} does not exist.")
+
+    with open(file_name, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                if not line.endswith("\n"):
+                    return  # Partial last record of an interrupted write
+                raise ValueError(f"File {file_name} contains invalid JSON on line {line_number}: {e}")
@@ -0,0 +1,388 @@
+import json
+import mmap
+import os
+import struct
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from utils.general_utils import GeneralUtils
+
+# File layout
+# -----------
+# header    : magic, version, ship count, offset of the record index, offset of the id table
+# ship data : per ship its UTF-8 id, name, designation and extra fields (a JSON object of every other
+#             field of the definition, e.g. 'created'), followed by its bit-packed bitmap
+# index     : one INDEX_DTYPE record per ship, in catalogue order
+# id table  : uint32 record numbers sorted by ship id, for binary search
+MAGIC = b"SRFSHIPS"
+VERSION = 2
+# Version 1 files have no extra fields, their extras_length is always 0
+READABLE_VERSIONS = (1, 2)
+# Fields stored in their own columns, every other field of a definition goes into the extras
+CORE_FIELDS = ("id", "name", "designation", "initial_direction")
+HEADER = struct.Struct("<8sIIQQ")
+INDEX_DTYPE = np.dtype([
+    ("bitmap_offset", "<u8"),
+    ("text_offset", "<u8"),
+    ("rows", "<u4"),
+    ("cols", "<u4"),
+    ("id_length", "<u2"),
+    ("name_length", "<u2"),
+    ("designation_length", "<u2"),
+    ("extras_length", "<u2"),
+])
+ID_TABLE_DTYPE = np.dtype("<u4")
+
+
+def write_catalogue(ships: Iterable[dict], file_name: str) -> int:
+    """
+    Writes ship definitions to a binary catalogue file.
+
+    Ships are streamed to the file one at a time, only their ids are kept in memory to build the
+    sorted id table at the end. Every field besides id, name, designation and initial_direction
+    (e.g. 'created' and 'last_updated' in ships.json) is kept as JSON, so reading a ship back gives
+    the definition that was written.
+
+    Parameters
+    ----------
+    ships : Iterable[dict]
+        Ship definitions with 'id', 'name', 'designation' and 'initial_direction' (a list of rows of 0/1),
+        and any other JSON serializable fields.
+
+    file_name : str
+        The name of the catalogue file to write.
+
+    Returns
+    -------
+    int
+        The number of ships written.
+
+    Raises
+    ------
+    ValueError
+        If a ship has a ragged or non 2D initial_direction, or a text field (or its extra fields as
+        JSON) longer than 65535 bytes.
+    IOError
+        If there is an error writing to the file.
+
+    Example
+    -------
+    >>> write_catalogue(GeneralUtils.load_from_json("ships.json"), "ships.cat")
+    6
+    """
+    records = []
+    ids = []
+    try:
+        with open(file_name, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, 0, 0, 0))  # Rewritten once the offsets are known
+
+            for ship in ships:
+                direction = np.asarray(ship["initial_direction"], dtype=np.uint8)
+                if direction.ndim != 2:
+                    raise ValueError(f"Ship {ship.get('id')!r} does not have a rectangular initial_direction.")
+                texts = [str(ship.get(key, "")).encode("utf-8") for key in ("id", "name", "designation")]
+                extras = {key: value for key, value in ship.items() if key not in CORE_FIELDS}
+                texts.append(json.dumps(extras, ensure_ascii=False).encode("utf-8") if extras else b"")
+                if any(len(text) > 0xFFFF for text in texts):
+                    raise ValueError(f"Ship {ship.get('id')!r} has a text field longer than 65535 bytes.")
+
+                text_offset = f.tell()
+                f.write(b"".join(texts))
+                bitmap_offset = f.tell()
+                f.write(np.packbits(direction != 0).tobytes())
+
+                records.append((bitmap_offset, text_offset, direction.shape[0], direction.shape[1],
+                                len(texts[0]), len(texts[1]), len(texts[2]), len(texts[3])))
+                ids.append(texts[0])
+
+            index_offset = _align(f, INDEX_DTYPE.alignment)
+            f.write(np.array(records, dtype=INDEX_DTYPE).tobytes())
+            id_table_offset = f.tell()
+            order = sorted(range(len(ids)), key=ids.__getitem__)
+            f.write(np.array(order, dtype=ID_TABLE_DTYPE).tobytes())
+
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, VERSION, len(records), index_offset, id_table_offset))
+    except IOError as e:
+        raise IOError(f"Error writing to file {file_name}: {e}")
+    return len(records)
+
+
+def convert_json_to_catalogue(json_file: str, catalogue_file: str) -> int:
+    """
+    Converts a JSON ship list such as ships.json into a binary catalogue.
+
+    Parameters
+    ----------
+    json_file : str
+        The name of the JSON file holding a list of ship definitions.
+
+    catalogue_file : str
+        The name of the catalogue file to write.
+
+    Returns
+    -------
+    int
+        The number of ships written.
+
+    Example
+    -------
+    >>> convert_json_to_catalogue("ships.json", "ships.cat")
+    6
+    """
+    ships = GeneralUtils.load_from_json(file_name=json_file)
+    if not isinstance(ships, list):
+        raise ValueError(f"{json_file} does not contain a list of ships.")
+    return write_catalogue(ships, catalogue_file)
+
+
+def _align(f, alignment: int) -> int:
+    """Pads the file with zeros up to the next multiple of alignment and returns the new position."""
+    position = f.tell()
+    padding = -position % alignment
+    f.write(b"\0" * padding)
+    return position + padding
+
+
+class ShipCatalogue:
+    """
+    Read-only, memory-mapped view of a binary ship catalogue.
+
+    Opening a catalogue only maps the file and reads its header; the record index and id table are
+    NumPy views on the mapping and ships are decoded on access, so a worker can open a catalogue of
+    hundreds of thousands of ships instantly and the pages it never touches are never read.
+
+    Ships are returned as the same dictionaries GeneralUtils.load_from_json gives for ships.json,
+    including fields such as 'created' and 'last_updated' (catalogues written by version 1 only hold
+    id, name, designation and initial_direction), so a catalogue can be passed wherever a ship list
+    is expected (e.g. BatchRunner.run).
+
+    Available Methods
+    -----------------
+    - get(ship_id): Returns the ship with the given id.
+    - index_of(ship_id): Returns the position of the ship with the given id.
+    - packed_bitmap(index): Returns the bit-packed bitmap of a ship without copying it.
+    - direction_array(index): Returns the bitmap of a ship as a 2D uint8 array.
+    - close(): Unmaps the file.
+
+    Example
+    -------
+    >>> with ShipCatalogue("ships.cat") as catalogue:
+    ...     glider = catalogue.get("glider")
+    """
+
+    def __init__(self, file_name: str) -> None:
+        """
+        Maps a catalogue file.
+
+        Parameters
+        ----------
+        file_name : str
+            The name of the catalogue file.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the specified file does not exist.
+        ValueError
+            If the file is not a ship catalogue or was written by an unsupported version.
+        """
+        if not os.path.exists(file_name):
+            raise FileNotFoundError(f"{file_name} does not exist.")
+
+        self.file_name = file_name
+        with open(file_name, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mm) < HEADER.size:
+            self._mm.close()
+            raise ValueError(f"{file_name} is not a ship catalogue.")
+        magic, version, count, index_offset, id_table_offset = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{file_name} is not a ship catalogue.")
+        if version not in READABLE_VERSIONS:
+            self._mm.close()
+            raise ValueError(f"{file_name} has unsupported catalogue version {version}.")
+
+        self._index = np.frombuffer(self._mm, dtype=INDEX_DTYPE, count=count, offset=index_offset)
+        self._id_table = np.frombuffer(self._mm, dtype=ID_TABLE_DTYPE, count=count, offset=id_table_offset)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[dict]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index: int) -> dict:
+        """
+        Decodes the ship at the given position.
+
+        Parameters
+        ----------
+        index : int
+            Position of the ship in the catalogue, negative values count from the end.
+
+        Returns
+        -------
+        dict
+            Ship definition with 'id', 'name', 'designation', 'initial_direction' and the extra fields
+            it was written with.
+
+        Raises
+        ------
+        IndexError
+            If the index is out of range.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Ship index {index} out of range.")
+
+        ship_id, name, designation, extras = self._texts(index)
+        ship = {"id": ship_id, "name": name, "designation": designation}
+        if extras:
+            ship.update(json.loads(extras))
+        ship["initial_direction"] = self.direction_array(index).tolist()
+        return ship
+
+    def __enter__(self) -> "ShipCatalogue":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _texts(self, index: int) -> tuple:
+        """Decodes the id, name, designation and extra fields (JSON, empty for none) of a ship."""
+        record = self._index[index]
+        start = int(record["text_offset"])
+        id_end = start + int(record["id_length"])
+        name_end = id_end + int(record["name_length"])
+        designation_end = name_end + int(record["designation_length"])
+        extras_end = designation_end + int(record["extras_length"])
+        return (
+            self._mm[start:id_end].decode("utf-8"),
+            self._mm[id_end:name_end].decode("utf-8"),
+            self._mm[name_end:designation_end].decode("utf-8"),
+            self._mm[designation_end:extras_end].decode("utf-8"),
+        )
+
+    def _id_bytes(self, index: int) -> bytes:
+        """Returns the raw UTF-8 id of a ship."""
+        record = self._index[index]
+        start = int(record["text_offset"])
+        return self._mm[start:start + int(record["id_length"])]
+
+    def index_of(self, ship_id: str) -> int:
+        """
+        Finds a ship by id with a binary search over the sorted id table.
+
+        Parameters
+        ----------
+        ship_id : str
+            The id of the ship.
+
+        Returns
+        -------
+        int
+            Position of the ship in the catalogue.
+
+        Raises
+        ------
+        KeyError
+            If no ship has the given id.
+        """
+        key = ship_id.encode("utf-8")
+        low, high = 0, len(self._id_table)
+        while low < high:
+            middle = (low + high) // 2
+            if self._id_bytes(int(self._id_table[middle])) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self._id_table):
+            index = int(self._id_table[low])
+            if self._id_bytes(index) == key:
+                return index
+        raise KeyError(ship_id)
+
+    def get(self, ship_id: str) -> dict:
+        """
+        Decodes the ship with the given id.
+
+        Parameters
+        ----------
+        ship_id : str
+            The id of the ship.
+
+        Returns
+        -------
+        dict
+            Ship definition, see __getitem__.
+
+        Raises
+        ------
+        KeyError
+            If no ship has the given id.
+        """
+        return self[self.index_of(ship_id)]
+
+    def packed_bitmap(self, index: int) -> np.ndarray:
+        """
+        Returns the bitmap of a ship as stored: its cells in row-major order, eight per byte.
+
+        The array is a read-only view on the mapped file, no data is copied.
+
+        Parameters
+        ----------
+        index : int
+            Position of the ship in the catalogue.
+
+        Returns
+        -------
+        np.ndarray
+            uint8 array of ceil(rows * cols / 8) bytes, to be unpacked with np.unpackbits.
+        """
+        record = self._index[index]
+        n_bytes = (int(record["rows"]) * int(record["cols"]) + 7) // 8
+        return np.frombuffer(self._mm, dtype=np.uint8, count=n_bytes, offset=int(record["bitmap_offset"]))
+
+    def direction_array(self, index: int) -> np.ndarray:
+        """
+        Unpacks the bitmap of a ship.
+
+        Parameters
+        ----------
+        index : int
+            Position of the ship in the catalogue.
+
+        Returns
+        -------
+        np.ndarray
+            uint8 array of shape (rows, cols) with 1 for alive cells.
+        """
+        record = self._index[index]
+        rows, cols = int(record["rows"]), int(record["cols"])
+        return np.unpackbits(self.packed_bitmap(index), count=rows * cols).reshape(rows, cols)
+
+    def ids(self) -> Iterator[str]:
+        """
+        Yields the id of every ship in catalogue order without decoding the bitmaps.
+
+        Returns
+        -------
+        Iterator[str]
+            The ship ids.
+        """
+        for index in range(len(self)):
+            yield self._id_bytes(index).decode("utf-8")
+
+    def close(self) -> None:
+        """
+        Unmaps the file. Arrays returned by packed_bitmap must be released before.
+        """
+        self._index = np.empty(0, dtype=INDEX_DTYPE)
+        self._id_table = np.empty(0, dtype=ID_TABLE_DTYPE)
+        self._mm.close()